@@ -31,6 +31,8 @@ class AWSConfig(metaclass=Singleton):
     """
     is_local: bool = os.getenv('AWS_IS_LOCAL', 'False').lower() == 'true'
     dynamodb_aws_region: str = os.getenv('AWS_DYNAMODB_REGION')
+    # Opens a DynamoDB connection while the Lambda container initializes. Off by default, so imports in tests and builds stay offline.
+    dynamodb_warm_up: bool = os.getenv('AWS_DYNAMODB_WARM_UP', 'False').lower() == 'true'
 
     stepfunction_execution_role_arn: str = os.getenv('AWS_STEP_FUNCTION_EXECUTION_ROLE_ARN')
     sqs_workflow_billing_arn: str = os.getenv('AWS_SQS_WORKFLOW_BILLING_ARN')
@@ -1,6 +1,5 @@
 import uuid
 from flask import g, has_request_context
-from dataclasses import asdict
 
 from model import User
 
@@ -49,5 +48,16 @@ class RequestContext:
             event: The event object containing the token validation info.
         """
         claims = event['requestContext']['authorizer']['claims']
-        user = User.from_authorizer_claims(claims)
-        g.user = asdict(user)
+        g.user = User.from_authorizer_claims(claims)
+
+
+    @classmethod
+    def get_authenticated_user(cls) -> User:
+        """
+        Get the authenticated user from the Flask application context (g).
+        The user is built once per request, so controllers do not rebuild it from a dict on every call.
+
+        Returns:
+            User: The authenticated user.
+        """
+        return g.user
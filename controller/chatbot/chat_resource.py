@@ -1,6 +1,5 @@
 from flask_restx import fields, Resource, Namespace
-from flask import g, request
-from dacite import from_dict
+from flask import request
 
 from controller.server_response import ServerResponse
 from controller.server_stream_response import ServerStreamResponse
@@ -10,7 +9,8 @@ from service import ChatService, BedrockService
 from repository import ChatRepository
 from exception import ServiceException
 from enums import APIStatus, ServiceStatus
-from model import User, UserPromptRequestDTO
+from model import UserPromptRequestDTO
+from context import RequestContext
 
 
 api = Namespace("Chatbot API", description="API for the chatbot that lists all the chat per user, get message history, create chat session and interact with the model", path="/interconnecthub/chatbot")
@@ -93,13 +93,13 @@ class ChatListResource(Resource):
     def get(self):
         log.info('Received API Request. api: %s, method: %s, status: %s', request.url, request.method, APIStatus.START.value)
 
-        user = from_dict(User, g.get('user'))
+        user = RequestContext.get_authenticated_user()
 
         if not user.can_access_model():
             log.warning('User has no permission to access chatbot. api: %s, method: %s, status: %s', request.url, request.method, APIStatus.FAILURE.value)
             raise ServiceException(403, ServiceStatus.FAILURE, 'User has no permission to access chatbot.')
 
-        user = from_dict(User, g.get('user'))
+        user = RequestContext.get_authenticated_user()
 
         response_payload = chat_service.get_chats(
             user_id=user.sub,
@@ -114,7 +114,7 @@ class ChatListResource(Resource):
     def post(self):
         log.info('Received API Request. api: %s, method: %s, status: %s', request.url, request.method, APIStatus.START.value)
 
-        user = from_dict(User, g.get('user'))
+        user = RequestContext.get_authenticated_user()
 
         model_id = api.payload['model_id']
 
@@ -145,7 +145,7 @@ class ChatMessagesResource(Resource):
     def get(self, chat_id):
         log.info('Received API Request. api: %s, method: %s, status: %s', request.url, request.method, APIStatus.START.value)
 
-        user = from_dict(User, g.get('user'))
+        user = RequestContext.get_authenticated_user()
 
         if not user.can_access_model():
             log.warning('User has no permission to access chat messages. api: %s, method: %s, status: %s', request.url, request.method, APIStatus.FAILURE.value)
@@ -168,22 +168,19 @@ class ChatMessagesResource(Resource):
     def post(self, chat_id):
         log.info('Received API Request. api: %s, method: %s, status: %s', request.url, request.method, APIStatus.START.value)
 
-        user = from_dict(User, g.get('user'))
+        user = RequestContext.get_authenticated_user()
 
         if not user.can_access_model():
             log.warning('User has no permission to send message. api: %s, method: %s, status: %s', request.url, request.method, APIStatus.FAILURE.value)
             raise ServiceException(403, ServiceStatus.FAILURE, 'User has no permission to send message.')
 
         payload = api.payload
-        request_data = from_dict(
-            UserPromptRequestDTO,
-            {
-                'user_id': user.sub,
-                'chat_id': chat_id,
-                'prompt': api.payload['prompt'],  
-                'system_prompt': payload.get('system_prompt', ''),  
-                'use_history': payload.get('use_history', True),  
-            }
+        request_data = UserPromptRequestDTO(
+            user_id=user.sub,
+            chat_id=chat_id,
+            prompt=payload['prompt'],
+            system_prompt=payload.get('system_prompt', ''),
+            use_history=payload.get('use_history', True),
         )
 
         response_generator = chat_service.save_chat_interaction(request_data)
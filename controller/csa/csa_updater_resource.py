@@ -1,6 +1,5 @@
 from flask_restx import fields, Resource, Namespace
-from flask import g, request
-from dacite import from_dict
+from flask import request
 
 from controller.server_response import ServerResponse
 from controller.common_controller import targets_dto, server_response
@@ -8,13 +7,23 @@ from configuration import AWSConfig, AppConfig, S3AssetsFileConfig
 from service import CsaUpdaterService
 from repository import CsaMachinesRepository, CsaModuleVersionsRepository
 from enums import APIStatus
-from model import User,UpdateRequest
+from model import UpdateRequest
+from context import RequestContext
 
 
 api = Namespace('CSA Updater API ', description='API for updating CSA modules in client side.', path='/interconnecthub/csa')
 log=api.logger
 
 
+aws_config = AWSConfig()
+app_config = AppConfig()
+s3_assets_file_config = S3AssetsFileConfig()
+
+csa_machines_repository = CsaMachinesRepository(app_config, aws_config)
+csa_module_versions_repository = CsaModuleVersionsRepository(app_config, aws_config)
+csa_updater_service = CsaUpdaterService(csa_machines_repository, csa_module_versions_repository, s3_assets_file_config)
+
+
 # Response
 update_response_dto = api.inherit('Csa updater targets response',server_response,{
     'payload':fields.List(fields.Nested(targets_dto))
@@ -35,23 +44,13 @@ update_request_dto = api.model('UpdateRequest', {
 class CsaUpdaterResource(Resource):
 
 
-    def __init__(self, api=None, *args, **kwargs):
-        super().__init__(api, *args, **kwargs)
-        self.aws_config = AWSConfig()
-        self.app_config = AppConfig()
-        self.s3_assets_file_config = S3AssetsFileConfig()
-        self.csa_machines_repository = CsaMachinesRepository(self.app_config, self.aws_config)
-        self.csa_module_versions_repository = CsaModuleVersionsRepository(self.app_config, self.aws_config)
-        self.csa_updater_service = CsaUpdaterService(self.csa_machines_repository, self.csa_module_versions_repository, self.s3_assets_file_config)
-
-
     @api.doc('Gets latest updates to compair with the current version and returns target updates.')
     @api.expect(update_request_dto, validate=True)
     @api.marshal_with(update_response_dto, skip_none=True)
     def post(self):
         log.info('Received API Request. api: %s, method: %s, status: %s', request.url, request.method, APIStatus.START.value)
 
-        user = from_dict(User, g.get('user'))
+        user = RequestContext.get_authenticated_user()
         
         request_data = UpdateRequest(
             owner_id=user.organization_id,
@@ -59,7 +58,7 @@ class CsaUpdaterResource(Resource):
             modules=api.payload['modules']
         )
 
-        response_payload = self.csa_updater_service.get_targets(
+        response_payload = csa_updater_service.get_targets(
             owner_id=user.organization_id, 
             machine_id=request_data.machine_id, 
             machine_modules=request_data.modules
@@ -1,6 +1,5 @@
 from flask_restx import Namespace, Resource, fields
-from flask import g, request
-from dacite import from_dict
+from flask import request
 
 from configuration import AWSConfig, AppConfig, S3AssetsFileConfig
 from .server_response import ServerResponse
@@ -8,9 +7,11 @@ from .common_controller import server_response
 from enums import APIStatus
 from repository import CustomScriptRepository
 from service import S3AssetsService, CustomScriptService
-from model import User, CustomScriptRequestDTO
+from model import CustomScriptRequestDTO
 from enums import ServicePermissions, ServiceStatus
 from exception import ServiceException
+from context import RequestContext
+from utils import DataClassUtils
 
 
 api = Namespace('Custom Script API', description='API for the working with s3 custom scripts', path='/interconnecthub/custom-scripts')
@@ -24,6 +25,7 @@ s3_assets_file_config = S3AssetsFileConfig()
 custom_script_repository = CustomScriptRepository(app_config, aws_config)
 s3_assets_service = S3AssetsService(s3_assets_file_config)
 custom_script_service = CustomScriptService(s3_assets_service=s3_assets_service, custom_script_repository=custom_script_repository)
+build_custom_script_request = DataClassUtils.get_builder(CustomScriptRequestDTO)
 
 
 # Models
@@ -89,18 +91,18 @@ class CustomScriptResource(Resource):
 
 
     @api.doc(description='Save custom script if does not exist else creates unpublished change')
-    @api.expect(save_custom_script_request_dto, description='Custom script information')
+    @api.expect(save_custom_script_request_dto, description='Custom script information', validate=True)
     @api.marshal_with(custom_script_response_dto, skip_none=True)
     def put(self):
         log.info('Received API Request. api: %s, method: %s, status: %s', request.url, request.method, APIStatus.START.value)
 
-        user = from_dict(User, g.get('user'))
+        user = RequestContext.get_authenticated_user()
 
         if not user.has_permission(ServicePermissions.CUSTOM_SCRIPT_SAVE_ITEM.value):
             log.warning('User has no permission to save custom script. api: %s, method: %s, status: %s', request.url, request.method, APIStatus.FAILURE.value)
             raise ServiceException(403, ServiceStatus.FAILURE, 'User has no permission to save custom script')
 
-        payload = from_dict(CustomScriptRequestDTO, request.json)
+        payload = build_custom_script_request(request.json)
         response_payload = custom_script_service.save_custom_script(
             owner_id=user.organization_id,
             payload=payload
@@ -114,7 +116,7 @@ class CustomScriptResource(Resource):
     def get(self):
         log.info('Received API Request. api: %s, method: %s, status: %s', request.url, request.method, APIStatus.START.value)
 
-        user = from_dict(User, g.get('user'))
+        user = RequestContext.get_authenticated_user()
 
         response_payload = custom_script_service.get_custom_scripts(
             owner_id=user.organization_id,
@@ -135,7 +137,7 @@ class CustomScriptDeleteResource(Resource):
     def delete(self, script_id: str):
         log.info('Received API Request. api: %s, method: %s, status: %s', request.url, request.method, APIStatus.START.value)
 
-        user = from_dict(User, g.get('user'))
+        user = RequestContext.get_authenticated_user()
 
         custom_script_service.remove_unpublished_change(
             owner_id=user.organization_id,
@@ -162,7 +164,7 @@ class CustomScriptContentResource(Resource):
         branch = request.args.get('branch', type=str, default='unpublished')
         version_id = request.args.get('version_id', type=str)
         
-        user = from_dict(User, g.get('user'))
+        user = RequestContext.get_authenticated_user()
 
         response_payload = custom_script_service.get_custom_script_content(
             owner_id=user.organization_id,
@@ -186,7 +188,7 @@ class CustomScriptReleaseResource(Resource):
     def post(self, script_id: str):
         log.info('Received API Request. api: %s, method: %s, status: %s', request.url, request.method, APIStatus.START.value)
 
-        user = from_dict(User, g.get('user'))
+        user = RequestContext.get_authenticated_user()
 
         if not user.has_permission(ServicePermissions.CUSTOM_SCRIPT_RELEASE_ITEM.value):
             log.warning('User has no permission to release custom script. api: %s, method: %s, status: %s', request.url, request.method, APIStatus.FAILURE.value)
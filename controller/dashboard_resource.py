@@ -1,7 +1,7 @@
 from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
 from flask_restx import Namespace, Resource, fields, reqparse
-from flask import g, request
+from flask import request
 
 from configuration import AWSConfig, AppConfig, OpensearchConfig
 from .server_response import ServerResponse
@@ -9,9 +9,9 @@ from .common_controller import server_response
 from enums import APIStatus
 from repository import WorkflowRepository
 from service import DashboardService, OpensearchService
-from model import User
 from exception import ServiceException
 from enums import ServiceStatus
+from context import RequestContext
 
 
 api = Namespace("Dashboard API", description="API for the dashboard home", path="/interconnecthub/dashboard")
@@ -126,8 +126,7 @@ class WorkflowStatsResource(Resource):
             log.error("The date range cannot exceed 14 days. api: %s, method: %s", request.url, request.method)
             raise ServiceException(400, ServiceStatus.FAILURE, "The date range cannot exceed 14 days.")
 
-        user_data = g.get("user")
-        user = User(**user_data)
+        user = RequestContext.get_authenticated_user()
         workflow_stats = dashboard_service.get_workflow_stats(user.organization_id, start_date, end_date)
         log.info('Done API Invocation. api: %s, method: %s, status: %s', request.url, request.method, APIStatus.SUCCESS.value)
         return ServerResponse.success(payload=workflow_stats), 200
@@ -161,8 +160,7 @@ class WorkflowIntegrationsResource(Resource):
             log.error("The date range cannot exceed 14 days. api: %s, method: %s", request.url, request.method)
             raise ServiceException(400, ServiceStatus.FAILURE, "The date range cannot exceed 14 days.")
 
-        user_data = g.get("user")
-        user = User(**user_data)
+        user = RequestContext.get_authenticated_user()
         workflow_integrations = dashboard_service.get_workflow_integrations(user.organization_id, start_date, end_date)
         log.info('Done API Invocation. api: %s, method: %s, status: %s', request.url, request.method, APIStatus.SUCCESS.value)
         return ServerResponse.success(payload=workflow_integrations), 200
@@ -196,8 +194,7 @@ class WorkflowFailuresResource(Resource):
             log.error("The date range cannot exceed 14 days. api: %s, method: %s", request.url, request.method)
             raise ServiceException(400, ServiceStatus.FAILURE, "The date range cannot exceed 14 days.")
 
-        user_data = g.get("user")
-        user = User(**user_data)
+        user = RequestContext.get_authenticated_user()
         workflow_failures = dashboard_service.get_workflow_failures(user.organization_id, start_date, end_date)
         log.info('Done API Invocation. api: %s, method: %s, status: %s', request.url, request.method, APIStatus.SUCCESS.value)
         return ServerResponse.success(payload=workflow_failures), 200
@@ -231,8 +228,7 @@ class WorkflowFailedEventsResource(Resource):
             log.error("The date range cannot exceed 14 days. api: %s, method: %s", request.url, request.method)
             raise ServiceException(400, ServiceStatus.FAILURE, "The date range cannot exceed 14 days.")
 
-        user_data = g.get("user")
-        user = User(**user_data)
+        user = RequestContext.get_authenticated_user()
         workflow_failed_events = dashboard_service.get_workflow_failed_executions(user.organization_id, start_date, end_date)
         log.info('Done API Invocation. api: %s, method: %s, status: %s', request.url, request.method, APIStatus.SUCCESS.value)
         return ServerResponse.success(payload=workflow_failed_events), 200
@@ -266,8 +262,7 @@ class WorkflowExecutionEventsResource(Resource):
             log.error("The date range cannot exceed 14 days. api: %s, method: %s", request.url, request.method)
             raise ServiceException(400, ServiceStatus.FAILURE, "The date range cannot exceed 14 days.")
 
-        user_data = g.get("user")
-        user = User(**user_data)
+        user = RequestContext.get_authenticated_user()
         workflow_execution_metrics = dashboard_service.get_workflow_execution_metrics_by_date(user.organization_id, start_date, end_date)
         log.info('Done API Invocation. api: %s, method: %s, status: %s', request.url, request.method, APIStatus.SUCCESS.value)
         return ServerResponse.success(payload=workflow_execution_metrics), 200
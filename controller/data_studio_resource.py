@@ -1,14 +1,15 @@
-from flask import g, request
+from flask import request
 from flask_restx import Namespace, Resource, fields
-from dacite import from_dict
 
 from configuration import AWSConfig, AppConfig
 from repository import WorkflowRepository, DataStudioMappingRepository, DataFormatsRepository
 from .server_response import ServerResponse
 from .common_controller import server_response
 from service import WorkflowService, DataStudioMappingService, DataFormatsService, AWSCloudWatchService, DataStudioStepFunctionService
-from model import User, DataStudioSaveMapping
+from model import DataStudioSaveMapping
 from enums import APIStatus
+from context import RequestContext
+from utils import DataClassUtils
 
 
 api = Namespace("Data Studio API", description="API for Data Studio", path="/interconnecthub/data-studio")
@@ -38,6 +39,7 @@ data_studio_mapping_service = DataStudioMappingService(
     workflow_service=workflow_service,
     data_studio_step_function_service=data_studio_step_function_service
 )
+build_save_mapping = DataClassUtils.get_builder(DataStudioSaveMapping)
 
 
 # Model
@@ -125,8 +127,7 @@ class DataStudioWorkflowsResource(Resource):
     @api.marshal_with(data_studio_workflows_response_dto, skip_none=True)
     def get(self):
         log.info('Received API Request. api: %s, method: %s, status: %s', request.url, request.method, APIStatus.START.value)
-        user_data = g.get("user")
-        user = User(**user_data)
+        user = RequestContext.get_authenticated_user()
         workflows = workflow_service.get_data_studio_workflows(user.organization_id)
         log.info('Done API Invocation. api: %s, method: %s, status: %s', request.url, request.method, APIStatus.SUCCESS.value)
         return ServerResponse.success(payload=workflows), 200
@@ -161,8 +162,7 @@ class DataStudioMappingsResource(Resource):
     @api.marshal_with(data_studio_active_mappings_response_dto, skip_none=True)
     def get(self):
         log.info('Received API Request. api: %s, method: %s, status: %s', request.url, request.method, APIStatus.START.value)
-        user_data = g.get("user")
-        user = User(**user_data)
+        user = RequestContext.get_authenticated_user()
         mappings = data_studio_mapping_service.get_active_mappings(user.organization_id)
         log.info('Done API Invocation. api: %s, method: %s, status: %s', request.url, request.method, APIStatus.SUCCESS.value)
         return ServerResponse.success(payload=mappings), 200
@@ -172,8 +172,7 @@ class DataStudioMappingsResource(Resource):
     @api.marshal_with(data_studio_mapping_response_dto, skip_none=True)
     def post(self):
         log.info('Received API Request. api: %s, method: %s, status: %s', request.url, request.method, APIStatus.START.value)
-        user_data = g.get("user")
-        user = User(**user_data)
+        user = RequestContext.get_authenticated_user()
         mapping_id = data_studio_mapping_service.create_mapping(user.sub, user.organization_id)
         log.info('Done API Invocation. api: %s, method: %s, status: %s', request.url, request.method, APIStatus.SUCCESS.value)
         return ServerResponse.success(payload=mapping_id), 201
@@ -191,8 +190,7 @@ class DataStudioMappingResource(Resource):
     @api.marshal_with(data_studio_mapping_response_dto, skip_none=True)
     def get(self, mapping_id: str):
         log.info('Received API Request. api: %s, method: %s, status: %s', request.url, request.method, APIStatus.START.value)
-        user_data = g.get("user")
-        user = User(**user_data)
+        user = RequestContext.get_authenticated_user()
         mappings = data_studio_mapping_service.get_mapping(user.organization_id, user.sub, mapping_id)
         log.info('Done API Invocation. api: %s, method: %s, status: %s', request.url, request.method, APIStatus.SUCCESS.value)
         return ServerResponse.success(payload=mappings), 200
@@ -203,11 +201,10 @@ class DataStudioMappingResource(Resource):
     @api.marshal_with(server_response, skip_none=True)
     def patch(self, mapping_id: str):
         log.info('Received API Request. api: %s, method: %s, status: %s', request.url, request.method, APIStatus.START.value)
-        user_data = g.get("user")
-        user = User(**user_data)
+        user = RequestContext.get_authenticated_user()
 
         request.json['id'] = mapping_id
-        mapping = from_dict(DataStudioSaveMapping, request.json)
+        mapping = build_save_mapping(request.json)
         data_studio_mapping_service.save_mapping(user, mapping)
         log.info('Done API Invocation. api: %s, method: %s, status: %s', request.url, request.method, APIStatus.SUCCESS.value)
         return ServerResponse.success(payload=None), 200
@@ -225,8 +222,7 @@ class PublishMappingResource(Resource):
     @api.marshal_with(data_studio_active_mappings_response_dto, skip_none=True)
     def post(self, mapping_id: str):
         log.info('Received API Request. api: %s, method: %s, status: %s', request.url, request.method, APIStatus.START.value)
-        user_data = g.get('user')
-        user = User(**user_data)
+        user = RequestContext.get_authenticated_user()
         published_mapping = data_studio_mapping_service.publish_mapping(user.sub, user.organization_id, mapping_id)
         log.info('Done API Invocation. api: %s, method: %s, status: %s', request.url, request.method, APIStatus.SUCCESS.value)
         return ServerResponse.success(payload=published_mapping), 200
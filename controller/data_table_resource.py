@@ -1,6 +1,5 @@
 from flask_restx import Namespace, Resource, fields
-from flask import g, request
-from dacite import from_dict
+from flask import request
 
 from configuration import AWSConfig, AppConfig
 from repository import CustomerTableInfoRepository, CustomerTableRepository
@@ -8,10 +7,11 @@ from .server_response import ServerResponse
 from service import DataTableService
 from .common_controller import server_response
 from enums import APIStatus
-from model import User, UpdateTableRequest
+from model import UpdateTableRequest
 from exception import ServiceException
 from enums import ServiceStatus, ServicePermissions
-from utils import Base64ConversionUtils
+from utils import Base64ConversionUtils, DataClassUtils
+from context import RequestContext
 
 api = Namespace(
     name="Data Table API",
@@ -28,6 +28,7 @@ data_table_service = DataTableService(
     customer_table_info_repository=customer_table_info_repository,
     customer_table_repository=customer_table_repository
 )
+build_update_table_request = DataClassUtils.get_builder(UpdateTableRequest)
 
 list_tables_response_dto = api.inherit('List customer tables response',server_response, {
     'payload': fields.List(fields.Nested(api.model('List of customer tables', {
@@ -110,7 +111,7 @@ class DataTableListResource(Resource):
     @api.marshal_with(list_tables_response_dto, skip_none=True)
     def get(self):
         log.info('Received API Request. api: %s, method: %s, status: %s', request.url, request.method, APIStatus.START.value)
-        user = from_dict(User, g.get('user'))
+        user = RequestContext.get_authenticated_user()
         tables = data_table_service.list_tables(owner_id=user.organization_id)
         log.info('Done API Invocation. api: %s, method: %s, status: %s', request.url, request.method, APIStatus.SUCCESS.value)
         return ServerResponse.success(payload=tables), 200
@@ -129,8 +130,8 @@ class DataTableResource (Resource):
     @api.marshal_with(table_info_response_dto, skip_none=True)
     def put(self, table_id:str):
         log.info('Received API Request. api: %s, method: %s, status: %s', request.url, request.method, APIStatus.START.value)
-        user = from_dict(User, g.get('user'))
-        update_table_request = from_dict(UpdateTableRequest, request.json)
+        user = RequestContext.get_authenticated_user()
+        update_table_request = build_update_table_request(request.json)
         updated_customer_table_info = data_table_service.update_description(owner_id=user.organization_id, table_id=table_id, update_table_request=update_table_request)
         log.info('Done API Invocation. api: %s, method: %s, status: %s', request.url, request.method, APIStatus.SUCCESS.value)
         return ServerResponse.success(payload=updated_customer_table_info), 200
@@ -140,7 +141,7 @@ class DataTableResource (Resource):
     @api.marshal_with(table_info_response_dto, skip_none=True)
     def get(self, table_id:str):
         log.info('Received API Request. api: %s, method: %s, status: %s', request.url, request.method, APIStatus.START.value)
-        user = from_dict(User, g.get('user'))
+        user = RequestContext.get_authenticated_user()
         table_details = data_table_service.get_table_info(owner_id=user.organization_id, table_id=table_id)
         log.info('Done API Invocation. api: %s, method: %s, status: %s', request.url, request.method, APIStatus.SUCCESS.value)
         return ServerResponse.success(payload=table_details), 200
@@ -152,7 +153,7 @@ class DataTableResource (Resource):
     def post(self, table_id: str):
         log.info('Received API Request. api: %s, method: %s, status: %s', request.url, request.method, APIStatus.START.value)
 
-        user = from_dict(User, g.get('user'))
+        user = RequestContext.get_authenticated_user()
         item = request.json
 
         if not user.has_permission(ServicePermissions.DATA_TABLE_CREATE_ITEM.value):
@@ -180,7 +181,7 @@ class TableBackupsResource(Resource):
     @api.marshal_with(backups_response_dto, skip_none=True)
     def get(self, table_id:str):
         log.info('Received API Request. api: %s, method: %s, status: %s', request.url, request.method, APIStatus.START.value)
-        user = from_dict(User, g.get('user'))
+        user = RequestContext.get_authenticated_user()
         backups = data_table_service.get_table_backup_jobs(owner_id=user.organization_id, table_id=table_id)
         log.info('Done API Invocation. api: %s, method: %s, status: %s', request.url, request.method, APIStatus.SUCCESS.value)
         return ServerResponse.success(payload=backups), 200
@@ -202,7 +203,7 @@ class DataTableItemsResource (Resource):
 
         size = request.args.get('size', type=int)
         last_evaluated_key = request.args.get('last_evaluated_key', default=None, type=str)
-        user = from_dict(User, g.get('user'))
+        user = RequestContext.get_authenticated_user()
 
         response_payload = data_table_service.get_table_items(
             owner_id=user.organization_id,
@@ -241,7 +242,7 @@ class DataTableItemResource (Resource):
         attribute_filters = request.args.get('attribute_filters', type=str)
         attribute_filters = Base64ConversionUtils.decode_to_dict(attribute_filters) if attribute_filters else None
 
-        user = from_dict(User, g.get('user'))
+        user = RequestContext.get_authenticated_user()
 
         response_payload = data_table_service.query_item(
             owner_id=user.organization_id,
@@ -269,7 +270,7 @@ class DataTableItemResource (Resource):
         log.info('Received API Request for deletion. api: %s, method: %s, status: %s', request.url, request.method, APIStatus.START.value)
 
         sort_key = request.args.get('sort_key', default=None, type=str)
-        user = from_dict(User, g.get('user'))
+        user = RequestContext.get_authenticated_user()
 
         if not user.has_permission(ServicePermissions.DATA_TABLE_DELETE_ITEM.value):
             log.warning('User has no permission to delete item in table. api: %s, method: %s, status: %s, table_id: %s', request.url, request.method, APIStatus.FAILURE.value, table_id)
@@ -1,4 +1,4 @@
-from dataclasses import dataclass, asdict, is_dataclass
+from dataclasses import dataclass, is_dataclass
 import datetime
 
 from enums import ServiceStatus
@@ -26,18 +26,13 @@ class ServerResponse:
         """
 
         if isinstance(payload, list):
-            result = []
-            for item in payload:
-                result.append(ServerResponse.get_payload_as_dict(item))
-            result = DataTypeUtils.convert_decimals_to_float_or_int(result)
-            return result
+            # Items are already sanitized by the recursive call, so the list is not walked a second time
+            return [ServerResponse.get_payload_as_dict(item) for item in payload]
         elif isinstance(payload, dict):
             payload = DataTypeUtils.convert_decimals_to_float_or_int(payload)
             return payload
         elif is_dataclass(payload):
-            result = asdict(payload)
-            result = DataTypeUtils.convert_decimals_to_float_or_int(result)
-            return result
+            return DataTypeUtils.convert_to_builtins(payload)
 
         raise ValueError('Unsupported response body type')
 
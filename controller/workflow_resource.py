@@ -1,5 +1,4 @@
 from flask_restx import fields, Resource, Namespace
-from dacite import from_dict
 from flask import request
 
 from .server_response import ServerResponse
@@ -39,7 +38,7 @@ class WorkflowResource(Resource):
         """
         log.info('Received API Request. api: %s, method: %s, status: %s', request.url, request.method, APIStatus.START)
         workflow_request_dto = api.payload
-        workflow = from_dict(data_class=Workflow, data=workflow_request_dto)
+        workflow = Workflow.parse_from(workflow_request_dto)
         created_workflow = self.workflow_service.save_workflow(workflow)
         log.info('Done API Invocation. api: %s, method: %s, status: %s', request.url, request.method, APIStatus.SUCCESS)
         return ServerResponse.created(payload=created_workflow), 200
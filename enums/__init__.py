@@ -1,4 +1,5 @@
 from .status import ServiceStatus, APIStatus, SystemStatus, BackupStatus, TableStatus, IndexStatus, AutoBackupStatus, Backup, BackupType, WorkflowErrorCode, WorkflowErrorSeverity
+from .status import TABLE_STATUS_ACTIVE, INDEX_STATUS_ACTIVE, BACKUP_ENABLED, AUTO_BACKUP_ENABLED, BACKUP_STATUS_ACTIVE, BACKUP_TYPE_AUTO
 from .permissions import ServicePermissions
 from .data_studio import DataStudioMappingStatus
 from .step_function import StateMachineType
@@ -1,4 +1,6 @@
+import sys
 from enum import Enum
+from typing import Final
 
 
 class ServiceStatus(Enum):
@@ -60,3 +62,12 @@ class WorkflowErrorSeverity(Enum):
     HIGH='HIGH'
     MEDIUM='MEDIUM'
     LOW='LOW'
+
+
+# Default values of the data table models. Interned once here, so every model instance references the same string.
+TABLE_STATUS_ACTIVE: Final[str] = sys.intern(TableStatus.ACTIVE.value)
+INDEX_STATUS_ACTIVE: Final[str] = sys.intern(IndexStatus.ACTIVE.value)
+BACKUP_ENABLED: Final[str] = sys.intern(Backup.ENABLED.value)
+AUTO_BACKUP_ENABLED: Final[str] = sys.intern(AutoBackupStatus.ENABLED.value)
+BACKUP_STATUS_ACTIVE: Final[str] = sys.intern(BackupStatus.ACTIVE.value)
+BACKUP_TYPE_AUTO: Final[str] = sys.intern(BackupType.AUTO.value)
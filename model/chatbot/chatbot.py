@@ -1,37 +1,37 @@
-import nanoid
+import secrets
 import time
 
 from dataclasses import dataclass, field
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatMessage:
     timestamp: int
     prompt: Optional[str] = None
     response: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatResponse:
     chat_id: str
     created_at: int
     title: str
 
 
-@dataclass
+@dataclass(slots=True)
 class MessageHistoryPagination:
     size: int
     last_evaluated_key: Optional[str] | None
 
 
-@dataclass
+@dataclass(slots=True)
 class MessageHistoryResponse:
     messages: List[ChatMessage]
     pagination: MessageHistoryPagination
 
 
-@dataclass
+@dataclass(slots=True)
 class Chat:
     user_id: str
     owner_id: str
@@ -40,46 +40,43 @@ class Chat:
     timestamp: int = field(init=False)
 
     def __post_init__(self):
-        self.chat_id = nanoid.generate()
+        self.chat_id = secrets.token_urlsafe(16)
         self.timestamp = int(time.time())
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ChatSession:
     chat_id: str
     timestamp: int 
 
 
-@dataclass
+@dataclass(slots=True)
 class SaveChatResponseDTO:
     chat_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatMessageResponse:
     messages: List[ChatMessage]
     last_evaluated_key: Optional[dict]
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatInteraction:
     chat_id: str
     prompt: str
     response: str
-    timestamp: int = None
-
-    def __post_init__(self):
-        if self.timestamp is None:
-            self.timestamp = int(time.time())
+    timestamp: int = field(default_factory=lambda: int(time.time()))
 
 
-@dataclass
+# Frozen, as the repository shares cached instances between requests
+@dataclass(slots=True, frozen=True)
 class ChatContext:
     model_id: str
     title: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class UserPromptRequestDTO:
     user_id: str
     chat_id: str
@@ -88,18 +85,18 @@ class UserPromptRequestDTO:
     use_history: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatCreationDate:
     timestamp: int
 
 
-@dataclass
+@dataclass(slots=True)
 class InteractionRecord:
     role: str
     content: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelInteractionRequest:
     anthropic_version: str
     max_tokens: int
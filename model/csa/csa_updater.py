@@ -2,13 +2,13 @@ from dataclasses import dataclass
 from typing import List
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Module:
     module_name: str
     version: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Targets:
     module_name: str
     version: str
@@ -16,19 +16,19 @@ class Targets:
     checksum: str
 
 
-@dataclass
+@dataclass(slots=True)
 class UpdateRequest:
     owner_id: str
     machine_id: str
     modules: List[Module]
 
 
-@dataclass
+@dataclass(slots=True)
 class UpdateResponse:
     targets: List[Targets]
 
 
-@dataclass
+@dataclass(slots=True)
 class MachineInfo:
     owner_id: str
     machine_id: str
@@ -36,7 +36,8 @@ class MachineInfo:
     modules: List[Module]
 
 
-@dataclass
+# Frozen, as the repository shares cached instances between requests
+@dataclass(slots=True, frozen=True)
 class ModuleInfo:
     module_name: str
     version: str
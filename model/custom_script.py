@@ -5,23 +5,23 @@ from dataclasses import dataclass, field
 from typing import List, Union
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomScriptRelease:
     version_id: str
     edited_by: str
     source_version_id: str
-    release_date: int = field(default=int(time.time()))
+    release_date: int = field(default_factory=lambda: int(time.time()))
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomScriptUnpublishedChange:
     version_id: str
     edited_by: str
     source_version_id: Union[str, None] = field(default=None)
-    edited_at: int = field(default=int(time.time()))
+    edited_at: int = field(default_factory=lambda: int(time.time()))
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomScript:
     owner_id: str
     script_id: str
@@ -30,17 +30,17 @@ class CustomScript:
     name: str
     releases: List[CustomScriptRelease]
     unpublished_changes: List[CustomScriptUnpublishedChange]
-    creation_date: int = field(default=int(time.time()))
+    creation_date: int = field(default_factory=lambda: int(time.time()))
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomScriptMetadata:
     language: str
     extension: str
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomScriptRequestDTO:
     script: str
     script_id: Union[str, None] = None
@@ -52,15 +52,15 @@ class CustomScriptRequestDTO:
             log.error("Atlease script_id or metadata is required.")
             raise ValueError("Atlease script_id or metadata is required.")
         
-@dataclass
+@dataclass(slots=True)
 class UnpublishedChangeResponseDTO:
     script_id: str
     version_id: str
     edited_by: str
     source_version_id: Union[str, None] = field(default=None)
-    edited_at: int = field(default=int(time.time()))
+    edited_at: int = field(default_factory=lambda: int(time.time()))
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomScriptContentResponse:
     content: str
\ No newline at end of file
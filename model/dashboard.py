@@ -1,20 +1,29 @@
 from dataclasses import dataclass
+from functools import lru_cache
 
 from enums import SystemStatus, WorkflowErrorCode, WorkflowErrorSeverity
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WorkflowItem:
     id: str
     name: str
 
-@dataclass
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def of(cls, id: str, name: str) -> 'WorkflowItem':
+        """
+        Returns a shared WorkflowItem for the given id and name, so rows referencing the same workflow reuse one instance.
+        """
+        return cls(id=id, name=name)
+
+@dataclass(slots=True)
 class WorkflowStats:
     active_workflows_count: int
     failed_executions_count: int
     total_executions_count: int
     system_status: str = SystemStatus.ONLINE.value
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowIntegration:
     failed_executions_count: int
     total_executions_count: int
@@ -22,20 +31,20 @@ class WorkflowIntegration:
     last_event_date: str
     workflow: WorkflowItem
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowError:
     occurrence: int
     error_code: str = WorkflowErrorCode.UNKNOWN.value
     severity: str = WorkflowErrorSeverity.HIGH.value
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowFailure:
     workflow: WorkflowItem
     errors: list[WorkflowError]
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowErrorFlatStructure:
     error_occurrence: int
     workflow_name: str
@@ -43,7 +52,7 @@ class WorkflowErrorFlatStructure:
     error_code: str = WorkflowErrorCode.UNKNOWN.value
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowFailedEvent:
     date: str
     error_code: str
@@ -51,7 +60,7 @@ class WorkflowFailedEvent:
     execution_id: str
     workflow: WorkflowItem
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowExecutionMetric:
     date: str
     failed_executions: int
@@ -1,12 +1,12 @@
 from dataclasses import dataclass
 from typing import  Optional, Dict
 
-@dataclass
+@dataclass(slots=True)
 class DataFormatProperties:
     lambda_arn: str
     parameters: dict
 
-@dataclass
+@dataclass(slots=True)
 class DataFormat:
     format_name: str
     parser: DataFormatProperties
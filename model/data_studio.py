@@ -6,7 +6,7 @@ from typing import Optional, Dict, List
 from enums import DataStudioMappingStatus
 
 
-@dataclass
+@dataclass(slots=True)
 class OutputSchemaField:
     name: str
     type: str
@@ -16,7 +16,7 @@ class OutputSchemaField:
     fields: list['OutputSchemaField'] | None
 
 
-@dataclass
+@dataclass(slots=True)
 class OutputSchema:
     name: str
     type: str
@@ -24,7 +24,7 @@ class OutputSchema:
     fields: list[OutputSchemaField]
 
 
-@dataclass
+@dataclass(slots=True)
 class InputSchema:
     name: str
     type: str
@@ -32,19 +32,19 @@ class InputSchema:
     fields: list['InputSchema'] | None
 
 
-@dataclass
+@dataclass(slots=True)
 class MappingFrom:
     format: str
     parameters: dict
 
 
-@dataclass
+@dataclass(slots=True)
 class MappingTo:
     format: str
     parameters: dict
 
 
-@dataclass
+@dataclass(slots=True)
 class Mapping:
     mapping_id: str
     from_ : MappingFrom
@@ -53,13 +53,13 @@ class Mapping:
     input_schema: InputSchema
 
 
-@dataclass
+@dataclass(slots=True)
 class DataStudioMapping:
     id: str
     revision: str
     owner_id: str
     created_by: str
-    status: str = DataStudioMappingStatus.DRAFT.value
+    status: str = field(default=DataStudioMappingStatus.DRAFT.value, metadata={'intern': True})
     active: bool = False
     name: Optional[str] = None
     description: Optional[str] = None
@@ -73,13 +73,13 @@ class DataStudioMapping:
     created_at: int = field(default_factory=lambda: int(time.time()))
  
 
-@dataclass
+@dataclass(slots=True)
 class DataStudioMappingResponse:
     draft: Optional[DataStudioMapping]
     revisions: List[DataStudioMapping]
 
 
-@dataclass
+@dataclass(slots=True)
 class DataStudioSaveMapping:
     id: str
     name: Optional[str] = None
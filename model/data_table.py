@@ -1,69 +1,69 @@
 from dataclasses import dataclass, field
-from typing import List
 
-from enums import TableStatus, IndexStatus, AutoBackupStatus, Backup, BackupStatus, BackupType
+from enums import TABLE_STATUS_ACTIVE, INDEX_STATUS_ACTIVE, BACKUP_ENABLED, AUTO_BACKUP_ENABLED, BACKUP_STATUS_ACTIVE, BACKUP_TYPE_AUTO
 
-@dataclass
+@dataclass(slots=True)
 class ListTableResponse:
     name: str
     id: str
     size: float
 
 
-@dataclass
+@dataclass(slots=True)
 class IndexInfo:
     name: str
     partition_key: str
     sort_key: str | None = field(default=None)
-    status: str = field(default=IndexStatus.ACTIVE.value)
+    status: str = field(default=INDEX_STATUS_ACTIVE, metadata={'intern': True})
     size: float = field(default=0)
     item_count: int = field(default=0)
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class CustomerTableInfo:
-    owner_id: str
+    # Fields read when listing tables come first, the rest are only needed for table details
     table_id: str
     table_name: str
     original_table_name: str
+    table_status: str = field(default=TABLE_STATUS_ACTIVE, metadata={'intern': True})
+    total_indexes: int = field(default=0)
+    owner_id: str
     partition_key: str
     sort_key: str | None = field(default=None)
     description: str | None = field(default=None)
     created_by: str | None = field(default=None)
     creation_time: str | None = field(default=None)
-    total_indexes: int = field(default=0)
     read_capacity_units: int = field(default=0)
     write_capacity_units: int = field(default=0)
-    backup: str = field(default=Backup.ENABLED.value)
-    auto_backup_status: str = field(default=AutoBackupStatus.ENABLED.value)
-    table_status: str = field(default=TableStatus.ACTIVE.value)
+    backup: str = field(default=BACKUP_ENABLED, metadata={'intern': True})
+    auto_backup_status: str = field(default=AUTO_BACKUP_ENABLED, metadata={'intern': True})
     backup_schedule: str | None = field(default='0 0 * * *')
     table_arn: str | None = field(default=None)
-    indexes: List[IndexInfo] = field(default_factory=list)
+    indexes: tuple[IndexInfo, ...] = field(default=())
 
 
-@dataclass
+@dataclass(slots=True)
 class UpdateTableRequest:
     description: str
 
 
-@dataclass
+@dataclass(slots=True)
 class BackupJob:
     id: str
     name: str | None = field(default=None)
-    status: str = field(default=BackupStatus.ACTIVE.value)
+    status: str = field(default=BACKUP_STATUS_ACTIVE)
     creation_time: str | None = field(default=None)
-    type: str = field(default=BackupType.AUTO.value)
+    type: str = field(default=BACKUP_TYPE_AUTO)
     size: int = field(default=0)
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomerTableItemPagination:
     size: int
     last_evaluated_key: str | None
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomerTableItem:
     items: list[any]
     pagination: CustomerTableItemPagination
@@ -2,21 +2,21 @@ from dataclasses import dataclass
 from typing import Dict, Optional
 from numbers import Number
 
-@dataclass
+@dataclass(slots=True)
 class InputDescription:
     description: str
     format: str
     media_type: str
 
 
-@dataclass
+@dataclass(slots=True)
 class OutputDescription:
     description: str
     format: str
     media_type: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ParameterDescription:
     description: str
     name: str
@@ -25,7 +25,7 @@ class ParameterDescription:
     required: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessorTemplate:
     template_id: str
     name: str
@@ -5,7 +5,7 @@ from dacite import from_dict
 from enums import StateMachineType
 
 
-@dataclass
+@dataclass(slots=True)
 class StateMachineCreatePayload:
     state_machine_name: str
     state_machine_definition: dict
@@ -14,7 +14,7 @@ class StateMachineCreatePayload:
     logging_configuration: Optional[dict] = field(default=None)
 
 
-@dataclass
+@dataclass(slots=True)
 class StateMachineUpdatePayload:
     state_machine_arn: str
     state_machine_definition: dict
@@ -1,15 +1,28 @@
 import json
+import sys
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from enums import ServicePermissions
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class User:
     sub: str
     organization_id: str
-    permissions: list[str]
+    permissions: tuple[str, ...]
+    # Permissions of the user's organization with the 'organization_id:' prefix stripped, so has_permission
+    # looks up the (interned) permission value directly instead of formatting a new string on every check
+    _organization_permissions: frozenset[str] = field(init=False, repr=False, compare=False)
+
+
+    def __post_init__(self):
+        prefix = f'{self.organization_id}:'
+        organization_permissions = frozenset(
+            sys.intern(permission[len(prefix):]) for permission in self.permissions if permission.startswith(prefix)
+        )
+        # The dataclass is frozen, so the derived field has to be set through object.__setattr__
+        object.__setattr__(self, '_organization_permissions', organization_permissions)
 
 
     @classmethod
@@ -21,11 +34,12 @@ class User:
         Returns:
             User: A new instance of the `User` class.
         """
-        permissions = claims.get('custom:permissions', [])
+        permissions = claims.get('custom:permissions', ())
         if isinstance(permissions, str):
-            permissions = json.loads(permissions)
+            # Users without permissions are common, so the empty claim does not need to be decoded
+            permissions = () if permissions == '[]' else json.loads(permissions)
 
-        return cls(claims['sub'], claims['custom:organizationId'], permissions)
+        return cls(claims['sub'], claims['custom:organizationId'], tuple(permissions))
 
 
     def has_file_ownership(self, file_owner_id: str):
@@ -51,13 +65,7 @@ class User:
         Returns:
             bool: True if the user has permission, False otherwise.
         """
-        expected_permission = f'{self.organization_id}:{permission}'
-        generic_permission = f'{self.organization_id}:*'
-
-        if expected_permission in self.permissions or generic_permission in self.permissions:
-            return True
-            
-        return False
+        return '*' in self._organization_permissions or permission in self._organization_permissions
     
 
     def can_access_model(self, model_id: str = None, default_model_id: str = None) -> bool:
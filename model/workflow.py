@@ -1,16 +1,15 @@
 from datetime import datetime
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
-from dacite import from_dict
 
 
-@dataclass
+@dataclass(slots=True)
 class Connection:
     source_node: str
     target_node: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Node:
     id: str
     name: str
@@ -22,19 +21,19 @@ class Node:
     sub_workflow: Optional['SubWorkflow'] = field(default=None)
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     start_at: str = field(default=None)
     connections: List[Connection] = field(default=None)
     nodes: List[Node] = field(default=None)
 
 
-@dataclass
+@dataclass(slots=True)
 class SubWorkflow:
     config: Config = field(default=None)
 
 
-@dataclass
+@dataclass(slots=True)
 class Workflow:
     owner_id: str
     workflow_id: str
@@ -53,28 +52,41 @@ class Workflow:
 
     @classmethod
     def parse_from(cls, data: Dict[str, Any]) -> 'Workflow':
-        return from_dict(data_class=Workflow, data=data)
-    
+        return cls(
+            owner_id=data["owner_id"],
+            workflow_id=data["workflow_id"],
+            name=data["name"],
+            event_name=data["event_name"],
+            created_by=data["created_by"],
+            created_by_name=data["created_by_name"],
+            group_name=data["group_name"],
+            state=data["state"],
+            version=data["version"],
+            is_sync_execution=data["is_sync_execution"],
+            state_machine_arn=data["state_machine_arn"],
+            is_binary_event=data["is_binary_event"],
+            creation_date=data["creation_date"] if "creation_date" in data else datetime.now().isoformat(),
+        )
+
 
     @classmethod
-    def from_dict(cls, data:dict) -> 'Workflow':
-        mapped_data = {
-            "owner_id": data["ownerId"],
-            "workflow_id": data["workflowId"],
-            "name": data["name"],
-            "event_name": data["event_name"],
-            "created_by": data["createdBy"],
-            "created_by_name": data["createdByName"],
-            "group_name": data["groupName"],
-            "state": data["state"],
-            "version": data["version"],
-            "is_sync_execution": data["is_sync_execution"],
-            "state_machine_arn": data["state_machine_arn"],
-            "is_binary_event": data["is_binary_event"],
-            "creation_date": data["creationDate"],
-        }
-        return cls(**mapped_data)
-    
+    def from_dict(cls, data: dict) -> 'Workflow':
+        return cls(
+            owner_id=data["ownerId"],
+            workflow_id=data["workflowId"],
+            name=data["name"],
+            event_name=data["event_name"],
+            created_by=data["createdBy"],
+            created_by_name=data["createdByName"],
+            group_name=data["groupName"],
+            state=data["state"],
+            version=data["version"],
+            is_sync_execution=data["is_sync_execution"],
+            state_machine_arn=data["state_machine_arn"],
+            is_binary_event=data["is_binary_event"],
+            creation_date=data["creationDate"],
+        )
+
 
     def as_dict(self) -> dict:
         return {
@@ -91,4 +103,4 @@ class Workflow:
             "state_machine_arn": self.state_machine_arn,
             "is_binary_event": self.is_binary_event,
             "creationDate": self.creation_date,
-        }
\ No newline at end of file
+        }
@@ -0,0 +1,88 @@
+import boto3
+import contextvars
+from botocore.config import Config
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Iterable
+
+
+_MAX_POOL_CONNECTIONS = 50
+
+# Worker threads shared by the repositories that fan out DynamoDB calls. There are fewer workers than pooled
+# connections, so concurrent calls never wait for a free connection of the shared client.
+_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix='dynamodb')
+
+
+@lru_cache(maxsize=None)
+def get_resource(region: str, is_local: bool):
+    """
+    Returns the DynamoDB service resource shared by all repositories of the process. Creating a boto3 resource
+    loads the service model and sets up the HTTP connection pool, which dominates Lambda cold start time,
+    so it is done once per region and environment instead of once per repository.
+
+    Args:
+        region (str): The AWS region of the DynamoDB tables.
+        is_local (bool): Whether to connect to a local DynamoDB instance.
+
+    Returns:
+        boto3.resources.factory.dynamodb.ServiceResource: The DynamoDB service resource.
+    """
+    if is_local:
+        return boto3.resource('dynamodb', region_name=region, endpoint_url='http://localhost:8000')
+
+    config = Config(
+        region_name=region,
+        max_pool_connections=_MAX_POOL_CONNECTIONS,
+        retries={'mode': 'adaptive', 'max_attempts': 5},
+        tcp_keepalive=True
+    )
+    return boto3.resource('dynamodb', config=config)
+
+
+@lru_cache(maxsize=None)
+def get_table(region: str, is_local: bool, table_name: str):
+    """
+    Returns the shared Table object of the DynamoDB table, so repositories reading the same table use one instance.
+
+    Args:
+        region (str): The AWS region of the DynamoDB table.
+        is_local (bool): Whether to connect to a local DynamoDB instance.
+        table_name (str): The name of the DynamoDB table.
+
+    Returns:
+        boto3.resources.factory.dynamodb.Table: The DynamoDB table object.
+    """
+    return get_resource(region, is_local).Table(table_name)
+
+
+def get_client(region: str, is_local: bool):
+    """
+    Returns the low-level DynamoDB client of the shared resource, so client calls reuse its configuration and connection pool.
+
+    Args:
+        region (str): The AWS region of the DynamoDB tables.
+        is_local (bool): Whether to connect to a local DynamoDB instance.
+
+    Returns:
+        botocore.client.DynamoDB: The DynamoDB client.
+    """
+    return get_resource(region, is_local).meta.client
+
+
+def map_concurrently(function: Callable[[Any], Any], values: Iterable[Any]) -> list:
+    """
+    Calls the function for each value on the shared DynamoDB worker threads and waits for all results.
+    Each call runs in a copy of the caller's context, so its logs keep the request id.
+
+    Args:
+        function (Callable[[Any], Any]): The function to call, e.g. a repository method issuing one DynamoDB request.
+        values (Iterable[Any]): The values to call the function with.
+
+    Returns:
+        list: The results, in the order of the given values.
+
+    Raises:
+        Exception: The first exception raised by any of the calls, in the order of the given values.
+    """
+    futures = [_EXECUTOR.submit(contextvars.copy_context().run, function, value) for value in values]
+    return [future.result() for future in futures]
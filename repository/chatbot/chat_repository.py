@@ -1,9 +1,5 @@
-import boto3 
-from botocore.config import Config
-from botocore.exceptions import ClientError
-from boto3.dynamodb.conditions import Key
-from dataclasses import asdict
-from dacite import from_dict
+import threading
+from botocore.exceptions import ClientError, BotoCoreError
 from typing import List, Optional
 
 from model import Chat, ChatMessage, ChatSession, ChatContext, ChatMessageResponse, ChatInteraction, ChatCreationDate
@@ -11,10 +7,21 @@ from configuration import AWSConfig, AppConfig
 from controller import common_controller as common_ctrl
 from exception import ServiceException
 from enums import ServiceStatus
-from utils import Singleton, DataTypeUtils
+from utils import Singleton, DataClassUtils, DynamoDBUtils, TTLCache
+from repository._dynamodb import get_client, get_table
 
 log = common_ctrl.log
 
+# The GSI queries read only the attributes of the model they are built into
+_CHAT_SESSION_PROJECTION, _CHAT_SESSION_ATTRIBUTE_NAMES = DynamoDBUtils.get_projection(ChatSession)
+_CHAT_CREATION_DATE_PROJECTION, _CHAT_CREATION_DATE_ATTRIBUTE_NAMES = DynamoDBUtils.get_projection(ChatCreationDate)
+
+# Generated at import so the first request does not pay for the code generation
+_build_chat_context = DataClassUtils.get_builder(ChatContext)
+_build_chat_session = DynamoDBUtils.get_item_builder(ChatSession)
+_build_chat_message = DynamoDBUtils.get_item_builder(ChatMessage)
+_build_chat_creation_date = DynamoDBUtils.get_item_builder(ChatCreationDate)
+
 
 class ChatRepository(metaclass=Singleton):
 
@@ -31,11 +38,19 @@ class ChatRepository(metaclass=Singleton):
         self.app_config = app_config
 
         self.table = self.__configure_dynamodb()
+        # The low-level client is used on the hot read paths, it skips the Decimal conversion of the Table resource
+        self.client = self.table.meta.client
+        # Chat contexts keyed by (chat_id, timestamp). Only contexts that already have a title are cached,
+        # the title is written once, so a cached context cannot go stale in another Lambda instance.
+        # Local runs keep no entries, so contexts edited directly in the local table are read back at once.
+        self.chat_context_cache = TTLCache(maxsize=0 if self.aws_config.is_local else 10_000, ttl=300)
+        # Chat creation dates keyed by (user_id, chat_id), they never change once the chat is created
+        self.chat_creation_date_cache = TTLCache(maxsize=10_000, ttl=300)
 
 
     def get_user_chat_sessions(self, user_id: str) -> List[ChatSession]:  
         """
-        Retrieves all chat sessions for a specified user.
+        Retrieves all chat sessions for a specified user, following the query pages until all sessions are read.
 
         Args:
             user_id (str): The ID of the user whose chats are being retrieved.
@@ -48,16 +63,22 @@ class ChatRepository(metaclass=Singleton):
         """
         log.info('Retriving chats for user. user_id: %s', user_id)
         try:
-            response = self.table.query(
-                IndexName=self.app_config.chatbot_messages_gsi_name,
-                KeyConditionExpression=Key('user_id').eq(user_id)
-            )
-            items = response.get('Items', [])
+            params = {
+                'TableName': self.app_config.chatbot_messages_table_name,
+                'IndexName': self.app_config.chatbot_messages_gsi_name,
+                'KeyConditionExpression': 'user_id = :user_id',
+                'ExpressionAttributeValues': {':user_id': {'S': user_id}},
+                'ProjectionExpression': _CHAT_SESSION_PROJECTION,
+                'ExpressionAttributeNames': _CHAT_SESSION_ATTRIBUTE_NAMES
+            }
             chat_sessions = []
-            for item in items:
-                item = DataTypeUtils.convert_decimals_to_float_or_int(item)
-                chat_sessions.append(from_dict(ChatSession, item))
-            return chat_sessions
+            while True:
+                response = self.client.query(**params)
+                chat_sessions.extend([_build_chat_session(item) for item in response.get('Items', [])])
+                last_evaluated_key = response.get('LastEvaluatedKey')
+                if not last_evaluated_key:
+                    return chat_sessions
+                params['ExclusiveStartKey'] = last_evaluated_key
 
         except ClientError as e:
             log.exception('Failed to retrieve chats. user_id: %s', user_id)
@@ -68,6 +89,8 @@ class ChatRepository(metaclass=Singleton):
     def get_chat_messages(self, chat_id: str, limit: int, exclusive_start_key: dict = None) -> ChatMessageResponse:
         """
         Retrieves messages from a specific chat, with pagination support.
+        DynamoDB ends a query page after 1 MB of data even if fewer than `limit` items were read, so the query
+        is continued from the last evaluated key until `limit` messages are collected or the chat has no more messages.
 
         Args:
             chat_id (str): The ID of the chat.
@@ -83,31 +106,37 @@ class ChatRepository(metaclass=Singleton):
         log.info('Retrieving messages for chat. chat_id: %s, limit: %s, exclusive_start_key: %s', chat_id, limit, exclusive_start_key)
         try:
             params = {
-                'KeyConditionExpression': Key('chat_id').eq(chat_id),
+                'TableName': self.app_config.chatbot_messages_table_name,
+                'KeyConditionExpression': 'chat_id = :chat_id',
+                'ExpressionAttributeValues': {':chat_id': {'S': chat_id}},
                 'Limit': limit,
                 'ScanIndexForward': False
             }
             
             if exclusive_start_key:
-                params['ExclusiveStartKey'] = exclusive_start_key
+                params['ExclusiveStartKey'] = DynamoDBUtils.serialize_item(exclusive_start_key)
 
-            response = self.table.query(**params)
-            last_evaluated_key = DataTypeUtils.convert_decimals_to_float_or_int(response.get('LastEvaluatedKey'))
+            items = []
+            while True:
+                response = self.client.query(**params)
+                items.extend(response.get('Items', []))
+                last_evaluated_key = response.get('LastEvaluatedKey')
+                if not last_evaluated_key or len(items) >= limit:
+                    break
+                params['Limit'] = limit - len(items)
+                params['ExclusiveStartKey'] = last_evaluated_key
 
-            messages = []
-            for item in response.get('Items', []):
-                item = DataTypeUtils.convert_decimals_to_float_or_int(item)
-                messages.append(from_dict(ChatMessage, item))
+            messages = [_build_chat_message(item) for item in items]
 
             return ChatMessageResponse(
                 messages=messages,
-                last_evaluated_key=last_evaluated_key
+                last_evaluated_key=DynamoDBUtils.deserialize_item(last_evaluated_key)
             )
             
         except ClientError as e:
             log.exception('Failed to retrieve messages. chat_id: %s', chat_id)
             code = e.response['ResponseMetadata']['HTTPStatusCode']
-        raise ServiceException(code, ServiceStatus.FAILURE, 'Failed to retrieve messages')
+            raise ServiceException(code, ServiceStatus.FAILURE, 'Failed to retrieve messages')
     
 
     def create_new_chat(self, item: Chat) -> None:
@@ -122,7 +151,8 @@ class ChatRepository(metaclass=Singleton):
         """
         log.info('Creating new chat. user_id: %s, chat_id: %s, owner_id: %s', item.user_id, item.chat_id, item.owner_id)
         try:
-            self.table.put_item(Item=asdict(item))
+            self.table.put_item(Item=DataClassUtils.to_dict(item))
+            self.chat_creation_date_cache.put((item.user_id, item.chat_id), ChatCreationDate(timestamp=item.timestamp))
             log.info('Successfully created chat. user_id: %s, chat_id: %s, owner_id: %s', item.user_id, item.chat_id, item.owner_id)
         except ClientError as e:
             log.exception('Failed to create chat. user_id: %s, chat_id: %s, owner_id: %s', item.user_id, item.chat_id, item.owner_id)
@@ -142,7 +172,7 @@ class ChatRepository(metaclass=Singleton):
         """
         log.info('Saving chat interaction. chat_id: %s, timestamp: %s', chat_interaction.chat_id, chat_interaction.timestamp)
         try: 
-            self.table.put_item(Item=asdict(chat_interaction))
+            self.table.put_item(Item=DataClassUtils.to_dict(chat_interaction))
             log.info('Successfully saved chat interaction. chat_id: %s, timestamp: %s', chat_interaction.chat_id, chat_interaction.timestamp)
         except ClientError as e:
             log.exception('Failed to save chat interaction. chat_id: %s, timestamp: %s', chat_interaction.chat_id, chat_interaction.timestamp)
@@ -166,6 +196,7 @@ class ChatRepository(metaclass=Singleton):
             ServiceException: If there's an error while updating the title.
         """
         log.info('Updating chat context with title. chat_id: %s, timestamp: %s', chat_id, timestamp)
+        self.chat_context_cache.pop((chat_id, timestamp))
         try:
             response = self.table.update_item(
                 Key={"chat_id": chat_id, "timestamp": timestamp},
@@ -176,7 +207,10 @@ class ChatRepository(metaclass=Singleton):
             log.info("Successfully updated chat with title. chat_id: %s, timestamp: %s", chat_id, timestamp)
             updated_item = response.get("Attributes", {})
 
-            return from_dict(ChatContext, updated_item) 
+            chat_context = _build_chat_context(updated_item)
+            if chat_context.title:
+                self.chat_context_cache.put((chat_id, timestamp), chat_context)
+            return chat_context
 
         except ClientError as e:
             log.exception('Failed to update title. chat_id: %s, timestamp: %s', chat_id, timestamp)
@@ -186,7 +220,7 @@ class ChatRepository(metaclass=Singleton):
 
     def get_chat_context(self, chat_id: str, timestamp: int) -> ChatContext:
         """
-        Retrieves chat context for a specific chat.
+        Retrieves chat context for a specific chat. Contexts with a title are served from the in-process cache.
 
         Args:
             chat_id (str): The ID of the chat context.
@@ -199,6 +233,9 @@ class ChatRepository(metaclass=Singleton):
             ServiceException: If there's an error while retrieving the chat context.
         """
         log.info('Retriving chat context for chat. chat_id: %s, timestamp: %s', chat_id, timestamp)
+        chat_context = self.chat_context_cache.get((chat_id, timestamp))
+        if chat_context is not None:
+            return chat_context
         try:
             response = self.table.get_item(
                 Key={
@@ -212,7 +249,10 @@ class ChatRepository(metaclass=Singleton):
                 raise ServiceException(400, ServiceStatus.FAILURE, 'Chat context does not exists')
             
             log.info('Successfully retrieved chat info. chat_id: %s', chat_id)
-            return from_dict(ChatContext, item)
+            chat_context = _build_chat_context(item)
+            if chat_context.title:
+                self.chat_context_cache.put((chat_id, timestamp), chat_context)
+            return chat_context
 
         except ClientError as e:
             log.exception('Failed to retrieve chat context. chat_id: %s, timestamp: %s ', chat_id, timestamp)
@@ -223,6 +263,7 @@ class ChatRepository(metaclass=Singleton):
     def get_chat_timestamp(self, user_id: str, chat_id: str) -> Optional[ChatCreationDate]:
         """
         Retrieves chat timestamp for a specific chat (used to update chat title).
+        The timestamp never changes, so it is served from the in-process cache after the first read or chat creation.
 
         Args:
             chat_id (str): The ID of the chat session.
@@ -235,15 +276,23 @@ class ChatRepository(metaclass=Singleton):
             ServiceException: If there's an error while retrieving the timestamp.
         """
         log.info('Getting chat creation timestamp. user_id: %s, chat_id: %s', user_id, chat_id)
+        chat_creation_date = self.chat_creation_date_cache.get((user_id, chat_id))
+        if chat_creation_date is not None:
+            return chat_creation_date
         try:
-            response = self.table.query(
+            response = self.client.query(
+                TableName=self.app_config.chatbot_messages_table_name,
                 IndexName=self.app_config.chatbot_messages_gsi_name,
-                KeyConditionExpression=Key('user_id').eq(user_id) & Key('chat_id').eq(chat_id)
+                KeyConditionExpression='user_id = :user_id AND chat_id = :chat_id',
+                ExpressionAttributeValues={':user_id': {'S': user_id}, ':chat_id': {'S': chat_id}},
+                ProjectionExpression=_CHAT_CREATION_DATE_PROJECTION,
+                ExpressionAttributeNames=_CHAT_CREATION_DATE_ATTRIBUTE_NAMES
             )
             items = response.get('Items', [])
             if items:  
-                item = DataTypeUtils.convert_decimals_to_float_or_int(items[0])  
-                return from_dict(ChatCreationDate, item)
+                chat_creation_date = _build_chat_creation_date(items[0])
+                self.chat_creation_date_cache.put((user_id, chat_id), chat_creation_date)
+                return chat_creation_date
             log.warning("No chat timestamp found. user_id: %s, chat_id: %s", user_id, chat_id)
             return None  
         
@@ -260,12 +309,25 @@ class ChatRepository(metaclass=Singleton):
         Returns:
             The DynamoDB table object.`
         """
-        resource = None
+        table = get_table(self.aws_config.dynamodb_aws_region, self.aws_config.is_local, self.app_config.chatbot_messages_table_name)
+        if self.aws_config.dynamodb_warm_up and not self.aws_config.is_local:
+            # The shared client waits and retries for a long time on an unreachable endpoint,
+            # so the warm-up runs in the background instead of holding up the container initialization
+            threading.Thread(target=self.__warm_up_connection, name='dynamodb-warm-up', daemon=True).start()
+        return table
 
-        if self.aws_config.is_local:
-            resource = boto3.resource('dynamodb', region_name=self.aws_config.dynamodb_aws_region, endpoint_url = 'http://localhost:8000')
-        else:
-            config = Config(region_name = self.aws_config.dynamodb_aws_region)
-            resource = boto3.resource('dynamodb', config = config)
 
-        return resource.Table(self.app_config.chatbot_messages_table_name)
\ No newline at end of file
+    def __warm_up_connection(self) -> None:
+        """
+        Opens a connection of the shared DynamoDB client (TLS handshake, credential resolution) while the Lambda
+        container initializes, so the first request finds it in the connection pool. A get_item of a key that cannot
+        exist is used, as it needs no permission beyond what the repository already uses. A failure only means
+        the first request pays the setup.
+        """
+        try:
+            get_client(self.aws_config.dynamodb_aws_region, self.aws_config.is_local).get_item(
+                TableName=self.app_config.chatbot_messages_table_name,
+                Key={'chat_id': {'S': '__warm_up__'}, 'timestamp': {'N': '0'}}
+            )
+        except (ClientError, BotoCoreError):
+            log.warning('Failed to warm up DynamoDB connection. table_name: %s', self.app_config.chatbot_messages_table_name)
@@ -1,7 +1,4 @@
-import boto3
-from botocore.config import Config
 from botocore.exceptions import ClientError 
-from dacite import from_dict
 from typing import List
 
 from model import Module, MachineInfo
@@ -9,10 +6,17 @@ from configuration import AWSConfig, AppConfig
 from controller import common_controller as common_ctrl
 from exception import ServiceException
 from enums import ServiceStatus
-from utils import Singleton
+from utils import Singleton, DynamoDBUtils
+from repository._dynamodb import get_table
 
 log = common_ctrl.log
 
+# The reads return only the attributes of the model they are built into
+_MACHINE_INFO_PROJECTION, _MACHINE_INFO_ATTRIBUTE_NAMES = DynamoDBUtils.get_projection(MachineInfo)
+
+# Generated at import so the first request does not pay for the code generation
+_build_machine_info = DynamoDBUtils.get_item_builder(MachineInfo)
+
 
 class CsaMachinesRepository(metaclass=Singleton):
 
@@ -29,6 +33,7 @@ class CsaMachinesRepository(metaclass=Singleton):
         self.app_config = app_config
         
         self.table = self.__configure_dynamodb()
+        self.client = self.table.meta.client
 
 
     def get_csa_machine_info(self, owner_id:str, machine_id: str) -> MachineInfo:
@@ -47,8 +52,11 @@ class CsaMachinesRepository(metaclass=Singleton):
         """
         log.info('Retrieving machine information. owner_id: %s, machine_id: %s', owner_id, machine_id)
         try:
-            response = self.table.get_item(
-                Key={'owner_id': owner_id, 'machine_id': machine_id}
+            response = self.client.get_item(
+                TableName=self.app_config.csa_machines_table_name,
+                Key={'owner_id': {'S': owner_id}, 'machine_id': {'S': machine_id}},
+                ProjectionExpression=_MACHINE_INFO_PROJECTION,
+                ExpressionAttributeNames=_MACHINE_INFO_ATTRIBUTE_NAMES
             )
             item = response.get('Item')
             if not item:
@@ -56,7 +64,7 @@ class CsaMachinesRepository(metaclass=Singleton):
                 raise ServiceException(400, ServiceStatus.FAILURE, 'Machine info does not exists')
             
             log.info('Successfully retrieved machine info. owner_id: %s, machine_id: %s', owner_id, machine_id)
-            return from_dict(MachineInfo, item)
+            return _build_machine_info(item)
 
         except ClientError as e:
             log.exception('Failed to retrieve owner machine information. owner_id: %s, machine_id: %s', owner_id, machine_id)
@@ -101,14 +109,4 @@ class CsaMachinesRepository(metaclass=Singleton):
         Returns:
             The DynamoDB table object.`
         """
-        resource = None
-
-        if self.aws_config.is_local:
-            resource = boto3.resource('dynamodb', region_name=self.aws_config.dynamodb_aws_region, endpoint_url = 'http://localhost:8000')
-        else:
-            config = Config(region_name = self.aws_config.dynamodb_aws_region)
-            resource = boto3.resource('dynamodb', config = config)
-
-        return resource.Table(self.app_config.csa_machines_table_name)
-    
-        
\ No newline at end of file
+        return get_table(self.aws_config.dynamodb_aws_region, self.aws_config.is_local, self.app_config.csa_machines_table_name)
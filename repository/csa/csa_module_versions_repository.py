@@ -1,8 +1,5 @@
-import boto3
-from botocore.config import Config
 from botocore.exceptions import ClientError 
 from boto3.dynamodb.conditions import Key
-from dacite import from_dict
 from typing import List
 
 from model import ModuleInfo
@@ -10,10 +7,18 @@ from configuration import AWSConfig, AppConfig
 from controller import common_controller as common_ctrl
 from exception import ServiceException
 from enums import ServiceStatus
-from utils import Singleton
+from utils import Singleton, DataClassUtils, DynamoDBUtils, TTLCache
+from repository._dynamodb import get_table
 
 log = common_ctrl.log
 
+# The reads return only the attributes of the model they are built into
+_MODULE_INFO_PROJECTION, _MODULE_INFO_ATTRIBUTE_NAMES = DynamoDBUtils.get_projection(ModuleInfo)
+_MODULE_NAME_KEY = Key('module_name')
+
+# Generated at import so the first request does not pay for the code generation
+_build_module_info = DataClassUtils.get_builder(ModuleInfo)
+
 
 class CsaModuleVersionsRepository(metaclass=Singleton):
 
@@ -30,11 +35,15 @@ class CsaModuleVersionsRepository(metaclass=Singleton):
         self.app_config = app_config
         
         self.table = self.__configure_dynamodb()
+        # Module versions keyed by module_name. They only change when a module is released,
+        # so a short TTL bounds how long another Lambda instance can serve an outdated list.
+        self.module_versions_cache = TTLCache(maxsize=1_000, ttl=60)
 
 
     def get_csa_module_versions(self, module_name: str) -> List[ModuleInfo]:
         """
-        Retrieves the latest module versions for a given module name.
+        Retrieves the latest module versions for a given module name, following the query pages until all versions are read.
+        The versions are served from the in-process cache for up to a minute.
 
         Args:
             module_name (str): The name of the module to retrieve versions for.
@@ -46,20 +55,32 @@ class CsaModuleVersionsRepository(metaclass=Singleton):
             ServiceException: If the retrieval of module fails.
         """
         log.info('Retrieving modules. module_name: %s', module_name)
+        cached_module_infos = self.module_versions_cache.get(module_name)
+        if cached_module_infos is not None:
+            return list(cached_module_infos)
         try:
-            response = self.table.query(
-                KeyConditionExpression=Key('module_name').eq(module_name)
-            )
-            items = response.get('Items')
+            params = {
+                'KeyConditionExpression': _MODULE_NAME_KEY.eq(module_name),
+                'ProjectionExpression': _MODULE_INFO_PROJECTION,
+                'ExpressionAttributeNames': _MODULE_INFO_ATTRIBUTE_NAMES
+            }
+            items = []
+            while True:
+                response = self.table.query(**params)
+                items.extend(response.get('Items', []))
+                last_evaluated_key = response.get('LastEvaluatedKey')
+                if not last_evaluated_key:
+                    break
+                params['ExclusiveStartKey'] = last_evaluated_key
+
             if not items:
                 log.error('Modules do not exist. module_name: %s', module_name)
                 raise ServiceException(400, ServiceStatus.FAILURE, 'Modules do not exist')
             
             log.info("Successfully retrived modules. module_name: %s", module_name)
-            
-            module_infos = []
-            for item in items:
-                module_infos.append(from_dict(ModuleInfo, item))
+            module_infos = [_build_module_info(item) for item in items]
+            # The cache keeps a tuple so callers changing their returned list cannot change the cached versions
+            self.module_versions_cache.put(module_name, tuple(module_infos))
         except ClientError as e:
             log.exception('Failed to retrieve modules. module_name: %s', module_name)
             code = e.response['ResponseMetadata']['HTTPStatusCode']
@@ -75,15 +96,4 @@ class CsaModuleVersionsRepository(metaclass=Singleton):
         Returns:
             The DynamoDB table object.`
         """
-        resource = None
-
-        if self.aws_config.is_local:
-            resource = boto3.resource('dynamodb', region_name=self.aws_config.dynamodb_aws_region, endpoint_url = 'http://localhost:8000')
-        else:
-            config = Config(region_name = self.aws_config.dynamodb_aws_region)
-            resource = boto3.resource('dynamodb', config = config)
-
-        return resource.Table(self.app_config.csa_module_versions_table_name)
-    
-    
-        
\ No newline at end of file
+        return get_table(self.aws_config.dynamodb_aws_region, self.aws_config.is_local, self.app_config.csa_module_versions_table_name)
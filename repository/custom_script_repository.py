@@ -1,22 +1,27 @@
-import boto3
 import boto3.resources
 import boto3.resources.factory
-from botocore.config import Config
 from botocore.exceptions import ClientError
-from boto3.dynamodb.conditions import Key
-from dacite import from_dict
-from dataclasses import asdict
 from typing import List
 
 from configuration import AppConfig, AWSConfig
 from controller import common_controller as common_ctrl
 from exception import ServiceException
 from enums import ServiceStatus
-from utils import Singleton, DataTypeUtils
+from utils import Singleton, DataClassUtils, DynamoDBUtils
 from model import CustomScript, CustomScriptUnpublishedChange, CustomScriptRelease
+from repository._dynamodb import get_table
 
 log = common_ctrl.log
 
+# The reads return only the attributes of the model they are built into
+_CUSTOM_SCRIPT_PROJECTION, _CUSTOM_SCRIPT_ATTRIBUTE_NAMES = DynamoDBUtils.get_projection(CustomScript)
+
+# Generated at import so the first request does not pay for the code generation
+_build_custom_script = DynamoDBUtils.get_item_builder(CustomScript)
+_dump_custom_script = DataClassUtils.get_dumper(CustomScript)
+_dump_unpublished_change = DataClassUtils.get_dumper(CustomScriptUnpublishedChange)
+_dump_release = DataClassUtils.get_dumper(CustomScriptRelease)
+
 class CustomScriptRepository(metaclass=Singleton):
 
 
@@ -32,11 +37,12 @@ class CustomScriptRepository(metaclass=Singleton):
         self.aws_config = aws_config
 
         self.table = self.__configure_dynamodb()
+        self.client = self.table.meta.client
 
 
     def get_owner_custom_scripts(self, owner_id: str) -> List[CustomScript]:
         """
-        Retrieves all custom scripts associated with a given owner from the DynamoDB table.
+        Retrieves all custom scripts associated with a given owner from the DynamoDB table, following the query pages until all scripts are read.
 
         Args:
             owner_id (str): The owner's ID.
@@ -49,16 +55,21 @@ class CustomScriptRepository(metaclass=Singleton):
         """
         log.info('Retrieving custom scripts. owner_id: %s', owner_id)
         try:
-            response = self.table.query(
-                KeyConditionExpression=Key('owner_id').eq(owner_id)
-            )
-            items = response.get('Items')
+            params = {
+                'TableName': self.app_config.custom_script_table_name,
+                'KeyConditionExpression': 'owner_id = :owner_id',
+                'ExpressionAttributeValues': {':owner_id': {'S': owner_id}},
+                'ProjectionExpression': _CUSTOM_SCRIPT_PROJECTION,
+                'ExpressionAttributeNames': _CUSTOM_SCRIPT_ATTRIBUTE_NAMES
+            }
             custom_scripts = []
-            for script in items:
-                item = DataTypeUtils.convert_decimals_to_float_or_int(script)
-                custom_scripts.append(from_dict(CustomScript, item))
-            
-            return custom_scripts
+            while True:
+                response = self.client.query(**params)
+                custom_scripts.extend([_build_custom_script(item) for item in response.get('Items', [])])
+                last_evaluated_key = response.get('LastEvaluatedKey')
+                if not last_evaluated_key:
+                    return custom_scripts
+                params['ExclusiveStartKey'] = last_evaluated_key
         except ClientError as e:
             log.exception('Failed to retrieve owner custom script. owner_id: %s', owner_id)
             code = e.response['ResponseMetadata']['HTTPStatusCode']
@@ -81,8 +92,11 @@ class CustomScriptRepository(metaclass=Singleton):
         """
         log.info('Retrieving custom script. owner_id: %s, script_id: %s', owner_id, script_id)
         try:
-            response = self.table.get_item(
-                Key={'owner_id': owner_id, 'script_id': script_id}
+            response = self.client.get_item(
+                TableName=self.app_config.custom_script_table_name,
+                Key={'owner_id': {'S': owner_id}, 'script_id': {'S': script_id}},
+                ProjectionExpression=_CUSTOM_SCRIPT_PROJECTION,
+                ExpressionAttributeNames=_CUSTOM_SCRIPT_ATTRIBUTE_NAMES
             )
             item = response.get('Item')
             if not item:
@@ -90,8 +104,7 @@ class CustomScriptRepository(metaclass=Singleton):
                 raise ServiceException(400, ServiceStatus.FAILURE, 'Custom script does not exists')
             
             log.info('Successfully retrieved custom script. owner_id: %s, script_id: %s', owner_id, script_id)
-            item = DataTypeUtils.convert_decimals_to_float_or_int(item)
-            return from_dict(CustomScript, item)
+            return _build_custom_script(item)
         except ClientError as e:
             log.exception('Failed to retrieve custom script. owner_id: %s, script_id: %s', owner_id, script_id)
             code = e.response['ResponseMetadata']['HTTPStatusCode']
@@ -110,7 +123,7 @@ class CustomScriptRepository(metaclass=Singleton):
         """
         log.info('Creating custom script. owner_id: %s, script_id: %s', item.owner_id, item.script_id)
         try:
-            self.table.put_item(Item=asdict(item))
+            self.table.put_item(Item=_dump_custom_script(item))
             log.info('Successfully created custom script. owner_id: %s, script_id: %s', item.owner_id, item.script_id)
         except ClientError as e:
             log.exception('Failed to create custom script. owner_id: %s, script_id: %s', item.owner_id, item.script_id)
@@ -132,7 +145,7 @@ class CustomScriptRepository(metaclass=Singleton):
         """
         log.info('Updating unpublished changes. script_id: %s, owner_id: %s', script_id, owner_id)
         try:
-            converted_unpublished_changes = [asdict(unpublished_change) for unpublished_change in unpublished_changes]
+            converted_unpublished_changes = [_dump_unpublished_change(unpublished_change) for unpublished_change in unpublished_changes]
             
             self.table.update_item(
                 Key={
@@ -153,39 +166,76 @@ class CustomScriptRepository(metaclass=Singleton):
             raise ServiceException(code, ServiceStatus.FAILURE, 'Failed to update unpublished changes')
         
 
-    def update_releases(self, owner_id: str, script_id: str, releases: List[CustomScriptRelease]) -> None:
+    def append_unpublished_change(self, owner_id: str, script_id: str, unpublished_change: CustomScriptUnpublishedChange) -> None:
         """
-        Updates the releases for a specific custom script.
+        Appends an unpublished change to a specific custom script. Only the new change is sent, so the write
+        does not grow with the number of existing unpublished changes.
 
         Args:
             owner_id (str): The owner's ID.
             script_id (str): The script ID.
-            releases (List[CustomScriptRelease]): The list of releases to be updated.
+            unpublished_change (CustomScriptUnpublishedChange): The unpublished change to be appended.
 
         Raises:
             ServiceException: If the update fails.
         """
-        log.info('Updating releases. script_id: %s, owner_id: %s', script_id, owner_id)
+        log.info('Appending unpublished change. script_id: %s, owner_id: %s', script_id, owner_id)
         try:
-            releases = [asdict(release) for release in releases]
-            
             self.table.update_item(
                 Key={
                     'owner_id': owner_id,
                     'script_id': script_id
                 },
-                UpdateExpression="SET releases = :releases",
+                UpdateExpression="SET unpublished_changes = list_append(if_not_exists(unpublished_changes, :empty_list), :unpublished_changes)",
                 ExpressionAttributeValues={
-                    ':releases': releases
+                    ':unpublished_changes': [_dump_unpublished_change(unpublished_change)],
+                    ':empty_list': []
                 },
             )
-            
-            log.info('Successfully updated releases. script_id: %s, owner_id: %s', script_id, owner_id)
-            
+
+            log.info('Successfully appended unpublished change. script_id: %s, owner_id: %s', script_id, owner_id)
+
+        except ClientError as e:
+            log.exception('Failed to append unpublished change. script_id: %s, owner_id: %s', script_id, owner_id)
+            code = e.response['ResponseMetadata']['HTTPStatusCode']
+            raise ServiceException(code, ServiceStatus.FAILURE, 'Failed to update unpublished changes')
+
+
+    def append_release_and_update_unpublished_changes(self, owner_id: str, script_id: str, release: CustomScriptRelease, unpublished_changes: List[CustomScriptUnpublishedChange]) -> None:
+        """
+        Appends a release to a specific custom script and updates its unpublished changes in a single write.
+        Only the new release is sent, so the write does not grow with the number of existing releases.
+
+        Args:
+            owner_id (str): The owner's ID.
+            script_id (str): The script ID.
+            release (CustomScriptRelease): The release to be appended.
+            unpublished_changes (List[CustomScriptUnpublishedChange]): The list of unpublished changes to be updated.
+
+        Raises:
+            ServiceException: If the update fails.
+        """
+        log.info('Appending release and updating unpublished changes. script_id: %s, owner_id: %s', script_id, owner_id)
+        try:
+            self.table.update_item(
+                Key={
+                    'owner_id': owner_id,
+                    'script_id': script_id
+                },
+                UpdateExpression="SET releases = list_append(if_not_exists(releases, :empty_list), :releases), unpublished_changes = :unpublished_changes",
+                ExpressionAttributeValues={
+                    ':releases': [_dump_release(release)],
+                    ':empty_list': [],
+                    ':unpublished_changes': [_dump_unpublished_change(unpublished_change) for unpublished_change in unpublished_changes]
+                },
+            )
+
+            log.info('Successfully appended release and updated unpublished changes. script_id: %s, owner_id: %s', script_id, owner_id)
+
         except ClientError as e:
-            log.exception('Failed to update releases. script_id: %s, owner_id: %s', script_id, owner_id)
+            log.exception('Failed to append release and update unpublished changes. script_id: %s, owner_id: %s', script_id, owner_id)
             code = e.response['ResponseMetadata']['HTTPStatusCode']
-            raise ServiceException(code, ServiceStatus.FAILURE, 'Failed to update releases')
+            raise ServiceException(code, ServiceStatus.FAILURE, 'Failed to update releases and unpublished changes')
 
 
     def __configure_dynamodb(self):
@@ -195,11 +245,4 @@ class CustomScriptRepository(metaclass=Singleton):
         Returns:
             boto3.resources.factory.ServiceResource: The DynamoDB table resource.
         """
-        resource = None
-        if self.aws_config.is_local:
-            resource = boto3.resource('dynamodb', region_name=self.aws_config.dynamodb_aws_region, endpoint_url='http://localhost:8000')
-        else:
-            config = Config(region_name=self.aws_config.dynamodb_aws_region)
-            resource = boto3.resource('dynamodb', config=config)
-        
-        return resource.Table(self.app_config.custom_script_table_name)
\ No newline at end of file
+        return get_table(self.aws_config.dynamodb_aws_region, self.aws_config.is_local, self.app_config.custom_script_table_name)
@@ -3,20 +3,25 @@ import boto3.resources
 import boto3.resources.factory
 from botocore.config import Config
 from botocore.exceptions import ClientError
-from boto3.dynamodb.conditions import Key, Attr
-from dacite import from_dict
-from utils import DataTypeUtils
+from boto3.dynamodb.conditions import Attr
+from utils import DataClassUtils, DynamoDBUtils
 from datetime import datetime
+from functools import cached_property
 
 from configuration import AWSConfig, AppConfig
 from controller import common_controller as common_ctrl
 from model import CustomerTableInfo, BackupJob
 from exception import ServiceException
 from enums import ServiceStatus
-from utils import Singleton
+from utils import Singleton, TTLCache
+from repository._dynamodb import get_client, get_resource, map_concurrently
 
 log = common_ctrl.log
 
+# Generated at import so the first request does not pay for the code generation
+_build_table_info = DataClassUtils.get_builder(CustomerTableInfo)
+_build_table_info_from_item = DynamoDBUtils.get_item_builder(CustomerTableInfo)
+
 class CustomerTableInfoRepository(metaclass=Singleton):
 
 
@@ -42,13 +47,15 @@ class CustomerTableInfoRepository(metaclass=Singleton):
         self.app_config = app_config
         self.dynamodb_resource = self.__configure_dynamodb_resource()
         self.dynamodb_client = self.__configure_dynamodb_client()
-        self.dynamodb_backup_client = self.__configure_backup_client()
         self.table = self.__configure_table()
+        # Table sizes keyed by table name. DynamoDB refreshes TableSizeBytes only about every six hours
+        # and describe_table is a rate limited control plane call, so the sizes are kept for a few minutes.
+        self.table_size_cache = TTLCache(maxsize=1_000, ttl=300)
 
 
     def get_tables_for_owner(self, owner_id:str) -> list[CustomerTableInfo]:
         """
-        Get a list of tables for a particular owner_id.
+        Get a list of tables for a particular owner_id, following the query pages until all tables are read.
 
         Args:
             owner_id (str): The owner ID to query the table.
@@ -61,15 +68,21 @@ class CustomerTableInfoRepository(metaclass=Singleton):
         """
         log.info('Retrieving customer tables. owner_id: %s', owner_id)
         try:
-            response = self.table.query(
-                KeyConditionExpression=Key('owner_id').eq(owner_id)
-            )
+            params = {
+                'TableName': self.app_config.customer_table_info_table_name,
+                'KeyConditionExpression': 'owner_id = :owner_id',
+                'ExpressionAttributeValues': {':owner_id': {'S': owner_id}}
+            }
+            tables = []
+            while True:
+                response = self.dynamodb_client.query(**params)
+                tables.extend([_build_table_info_from_item(item) for item in response.get('Items', [])])
+                last_evaluated_key = response.get('LastEvaluatedKey')
+                if not last_evaluated_key:
+                    break
+                params['ExclusiveStartKey'] = last_evaluated_key
             log.info('Successfully retrieved customer tables. owner_id: %s', owner_id)
-            customer_info_tables = []
-            for item in response.get('Items', []):
-                item = DataTypeUtils.convert_decimals_to_float_or_int(item)
-                customer_info_tables.append(from_dict(CustomerTableInfo, item))
-            return customer_info_tables
+            return tables
         except ClientError as e:
             log.exception('Failed to retrieve customer tables. owner_id: %s', owner_id)
             raise ServiceException(500, ServiceStatus.FAILURE, 'Failed to retrieve customer tables')
@@ -77,7 +90,7 @@ class CustomerTableInfoRepository(metaclass=Singleton):
 
     def get_table_size(self, table_name:str) -> float:
         """
-        Get the size of a specific dynamoDB table.
+        Get the size of a specific dynamoDB table. Sizes are served from the in-process cache for up to five minutes.
 
         Args:
             table_name (str): The name of the dynamoDB table to retrieve size for.
@@ -88,16 +101,49 @@ class CustomerTableInfoRepository(metaclass=Singleton):
         Raises:
             ServiceException: If there is an error describing the DynamoDB table.
         """
+        table_size = self.table_size_cache.get(table_name)
+        if table_size is not None:
+            return table_size
         try:
             log.info('Retrieving size of customer table. table_name: %s', table_name)
             response = self.dynamodb_client.describe_table(TableName=table_name)
             log.info('Successfully retrieved size of customer table. table_name: %s', table_name)
-            return response['Table']['TableSizeBytes'] / 1024
+            table_size = response['Table']['TableSizeBytes'] / 1024
+            self.table_size_cache.put(table_name, table_size)
+            return table_size
         except ClientError as e:
             log.exception('Failed to retrieve size of customer table. table_name: %s', table_name)
             raise ServiceException(500, ServiceStatus.FAILURE, 'Failed to retrieve size of customer table')
 
 
+    def get_table_sizes(self, table_names:list[str]) -> list[float]:
+        """
+        Get the sizes of several dynamoDB tables, describing the tables concurrently.
+
+        Args:
+            table_names (list[str]): The names of the dynamoDB tables to retrieve sizes for.
+
+        Returns:
+            list[float]: The table sizes, in the order of the given table names.
+
+        Raises:
+            ServiceException: If there is an error describing any of the DynamoDB tables.
+        """
+        return map_concurrently(self.get_table_size, table_names)
+
+
+    @cached_property
+    def dynamodb_backup_client(self):
+        """
+        The AWS Backup client, created on first use. Only the backup jobs listing needs it,
+        so requests that never read backups do not pay for loading the backup service model.
+
+        Returns:
+            boto3.client: The DynamoDB backup client.
+        """
+        return self.__configure_backup_client()
+
+
     def get_table_item(self, owner_id:str, table_id:str) -> CustomerTableInfo:
         """
         Retrieves customer's table item based on owner_id and table_id.
@@ -122,8 +168,7 @@ class CustomerTableInfoRepository(metaclass=Singleton):
                 log.error('Customer table item does not exist. owner_id: %s, table_id: %s', owner_id, table_id)
                 raise ServiceException(400, ServiceStatus.FAILURE, 'Customer table item does not exists')
             log.info('Successfully retrieved customer table item. owner_id: %s, table_id: %s', owner_id, table_id)
-            item = DataTypeUtils.convert_decimals_to_float_or_int(item)
-            return from_dict(CustomerTableInfo, item)
+            return _build_table_info(item)
         except ClientError as e:
             log.exception('Failed to retrieve customer table item. owner_id: %s, table_id: %s', owner_id, table_id)
             raise ServiceException(500, ServiceStatus.FAILURE, 'Failed to retrieve customer table item')
@@ -155,8 +200,7 @@ class CustomerTableInfoRepository(metaclass=Singleton):
                 ReturnValues="ALL_NEW"
             )
             log.info('Successfully updated customer table description. owner_id: %s, table_id: %s', customer_table_info.owner_id, customer_table_info.table_id)
-            updated_customer_table_info = DataTypeUtils.convert_decimals_to_float_or_int(response.get('Attributes'))
-            return from_dict(CustomerTableInfo, updated_customer_table_info)
+            return _build_table_info(response.get('Attributes'))
         except ClientError as e:
             log.exception('Failed to update customer table description. owner_id: %s, table_id: %s', customer_table_info.owner_id, customer_table_info.table_id)
             raise ServiceException(500, ServiceStatus.FAILURE, 'Failed to update customer table description')
@@ -211,11 +255,7 @@ class CustomerTableInfoRepository(metaclass=Singleton):
         Returns:
             boto3.resources.factory.ServiceResource: The DynamoDB service resource.
         """
-        if self.aws_config.is_local:
-            return boto3.resource('dynamodb', region_name=self.aws_config.dynamodb_aws_region, endpoint_url='http://localhost:8000')
-        else:
-            config = Config(region_name=self.aws_config.dynamodb_aws_region)
-            return boto3.resource('dynamodb', config=config)
+        return get_resource(self.aws_config.dynamodb_aws_region, self.aws_config.is_local)
 
 
     def __configure_dynamodb_client(self) -> boto3.client:
@@ -225,11 +265,7 @@ class CustomerTableInfoRepository(metaclass=Singleton):
         Returns:
             boto3.client: The DynamoDB client.
         """
-        if self.aws_config.is_local:
-            return boto3.client('dynamodb', region_name=self.aws_config.dynamodb_aws_region, endpoint_url='http://localhost:8000')
-        else:
-            config = Config(region_name=self.aws_config.dynamodb_aws_region)
-            return boto3.client('dynamodb', config=config)
+        return get_client(self.aws_config.dynamodb_aws_region, self.aws_config.is_local)
 
 
     def __configure_backup_client(self) -> boto3.client:
@@ -1,7 +1,5 @@
-import boto3
 import boto3.resources
 import boto3.resources.factory
-from botocore.config import Config
 from botocore.exceptions import ClientError
 from boto3.dynamodb.conditions import Key, Attr
 from typing import Tuple, Dict
@@ -11,6 +9,7 @@ from controller import common_controller as common_ctrl
 from exception import ServiceException
 from enums import ServiceStatus
 from utils import Singleton
+from repository._dynamodb import get_resource
 
 log = common_ctrl.log
 
@@ -176,8 +175,4 @@ class CustomerTableRepository(metaclass=Singleton):
         Returns:
             boto3.resources.factory.ServiceResource: The DynamoDB service resource.
         """
-        if self.aws_config.is_local:
-            return boto3.resource('dynamodb', region_name=self.aws_config.dynamodb_aws_region, endpoint_url='http://localhost:8000')
-        else:
-            config = Config(region_name=self.aws_config.dynamodb_aws_region)
-            return boto3.resource('dynamodb', config=config)
+        return get_resource(self.aws_config.dynamodb_aws_region, self.aws_config.is_local)
@@ -1,21 +1,22 @@
-import boto3
 import boto3.resources
 import boto3.resources.factory
-from botocore.config import Config
 from boto3.dynamodb.conditions import Key
 from botocore.exceptions import ClientError
 from typing import List, Optional
-from dacite import from_dict
 
-from utils import Singleton, DataTypeUtils
+from utils import Singleton, DataTypeUtils, DataClassUtils
 from model import DataFormat
 from controller import common_controller as common_ctrl
 from configuration import AppConfig, AWSConfig
 from exception import ServiceException
 from enums import ServiceStatus
+from repository._dynamodb import get_table
 
 log = common_ctrl.log
 
+# Generated at import so the first request does not pay for the code generation
+_build_data_format = DataClassUtils.get_builder(DataFormat)
+
 
 class DataFormatsRepository(metaclass=Singleton):
 
@@ -48,7 +49,7 @@ class DataFormatsRepository(metaclass=Singleton):
         try:
             response = self.table.scan()
             return [
-                from_dict(DataFormat, DataTypeUtils.convert_decimals_to_float_or_int(item))
+                _build_data_format(DataTypeUtils.convert_decimals_to_float_or_int(item))
                 for item in response.get('Items', [])
             ]
         except ClientError as e:
@@ -80,7 +81,7 @@ class DataFormatsRepository(metaclass=Singleton):
                 log.error('Unable to find data format. format_name: %s', format_name)
                 return None
             
-            return from_dict(DataFormat, DataTypeUtils.convert_decimals_to_float_or_int(formats[0]))
+            return _build_data_format(DataTypeUtils.convert_decimals_to_float_or_int(formats[0]))
         except ClientError as e:
             log.exception('Error while retrieving data format. format_name: %s', format_name)
             code = e.response['ResponseMetadata']['HTTPStatusCode']
@@ -94,11 +95,4 @@ class DataFormatsRepository(metaclass=Singleton):
         Returns:
             boto3.resources.factory.ServiceResource: The DynamoDB table resource.
         """
-        resource = None
-        if self.aws_config.is_local:
-            resource = boto3.resource('dynamodb', region_name=self.aws_config.dynamodb_aws_region, endpoint_url='http://localhost:8000')
-        else:
-            config = Config(region_name=self.aws_config.dynamodb_aws_region)
-            resource = boto3.resource('dynamodb', config=config)
-
-        return resource.Table(self.app_config.data_formats_table_name)
\ No newline at end of file
+        return get_table(self.aws_config.dynamodb_aws_region, self.aws_config.is_local, self.app_config.data_formats_table_name)
@@ -1,22 +1,23 @@
 from dataclasses import asdict
-import boto3
 import boto3.resources
 import boto3.resources.factory
-from botocore.config import Config
 from botocore.exceptions import ClientError
 from boto3.dynamodb.conditions import Attr, Key
 from typing import List, Optional
-from dacite import from_dict
 
-from utils import Singleton, DataTypeUtils
+from utils import Singleton, DataTypeUtils, DataClassUtils
 from model import DataStudioMapping, DataStudioSaveMapping
 from controller import common_controller as common_ctrl
 from configuration import AppConfig, AWSConfig
 from exception import ServiceException
 from enums import ServiceStatus, DataStudioMappingStatus
+from repository._dynamodb import get_table
 
 log = common_ctrl.log
 
+# Generated at import so the first request does not pay for the code generation
+_build_mapping = DataClassUtils.get_builder(DataStudioMapping)
+
 
 class DataStudioMappingRepository(metaclass=Singleton):
 
@@ -53,7 +54,7 @@ class DataStudioMappingRepository(metaclass=Singleton):
                 FilterExpression=Attr('active').eq(True)
             )
             return [
-                from_dict(DataStudioMapping, DataTypeUtils.convert_decimals_to_float_or_int(item))
+                _build_mapping(DataTypeUtils.convert_decimals_to_float_or_int(item))
                 for item in response.get('Items', [])
             ]
         except ClientError as e:
@@ -81,7 +82,7 @@ class DataStudioMappingRepository(metaclass=Singleton):
             )
 
             return [
-                from_dict(DataStudioMapping, DataTypeUtils.convert_decimals_to_float_or_int(item))
+                _build_mapping(DataTypeUtils.convert_decimals_to_float_or_int(item))
                 for item in response.get('Items', [])
             ]
         except ClientError as e:
@@ -138,7 +139,7 @@ class DataStudioMappingRepository(metaclass=Singleton):
             if not draft:
                 log.error("Unable to find draft. owner_id: %s, user_id: %s, mapping_id: %s", owner_id, user_id, mapping_id)
                 return None
-            return from_dict(DataStudioMapping, DataTypeUtils.convert_decimals_to_float_or_int(draft[0]))
+            return _build_mapping(DataTypeUtils.convert_decimals_to_float_or_int(draft[0]))
         except ClientError as e:
             log.exception('Failed to retrieve user draft. owner_id: %s, mapping_id: %s, user_id: %s', owner_id, mapping_id, user_id)
             code = e.response['ResponseMetadata']['HTTPStatusCode']
@@ -192,7 +193,7 @@ class DataStudioMappingRepository(metaclass=Singleton):
                 ConsistentRead=True
             )
             items = response.get('Items', [])
-            return from_dict(DataStudioMapping, DataTypeUtils.convert_decimals_to_float_or_int(items[0])) if items else None
+            return _build_mapping(DataTypeUtils.convert_decimals_to_float_or_int(items[0])) if items else None
         except ClientError as e:
             log.exception('Failed to get active mapping. owner_id: %s, mapping_id: %s', owner_id, mapping_id)
             raise ServiceException(e.response['ResponseMetadata']['HTTPStatusCode'], ServiceStatus.FAILURE, 'Failed to get active mapping')
@@ -243,11 +244,4 @@ class DataStudioMappingRepository(metaclass=Singleton):
         Returns:
             boto3.resources.factory.ServiceResource: The DynamoDB table resource.
         """
-        resource = None
-        if self.aws_config.is_local:
-            resource = boto3.resource('dynamodb', region_name=self.aws_config.dynamodb_aws_region, endpoint_url='http://localhost:8000')
-        else:
-            config = Config(region_name=self.aws_config.dynamodb_aws_region)
-            resource = boto3.resource('dynamodb', config=config)
-
-        return resource.Table(self.app_config.data_studio_mappings_table_name)
\ No newline at end of file
+        return get_table(self.aws_config.dynamodb_aws_region, self.aws_config.is_local, self.app_config.data_studio_mappings_table_name)
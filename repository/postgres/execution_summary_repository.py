@@ -179,7 +179,7 @@ class ExecutionSummaryRepository(metaclass=Singleton):
             log.info("Workflow intergrations retrieved successfully. owner_id: %s", owner_id)
             return [
                 WorkflowIntegration(
-                    workflow=WorkflowItem(id=integartion[0], name=integartion[1]),
+                    workflow=WorkflowItem.of(id=integartion[0], name=integartion[1]),
                     last_event_date=integartion[2].strftime('%Y-%m-%d'),
                     failed_executions_count=integartion[3],
                     total_executions_count=integartion[4],
@@ -240,7 +240,7 @@ class ExecutionSummaryRepository(metaclass=Singleton):
                     execution_id=execution[0],
                     event_id=execution[1],
                     date=execution[2].strftime('%Y-%m-%d'),
-                    workflow=WorkflowItem(id=execution[4], name=execution[3]),
+                    workflow=WorkflowItem.of(id=execution[4], name=execution[3]),
                     error_code=None
                 )
                 for execution in failed_executions
@@ -1,18 +1,19 @@
-import boto3
-from botocore.config import Config
 from botocore.exceptions import ClientError
 from typing import List
-import dacite
 
 from model import ProcessorTemplate
 from configuration import AWSConfig, AppConfig
 from controller import common_controller as common_ctrl
 from exception import ServiceException
 from enums import ServiceStatus
-from utils import Singleton
+from utils import Singleton, DataClassUtils
+from repository._dynamodb import get_table
 
 log = common_ctrl.log
 
+# Generated at import so the first request does not pay for the code generation
+_build_template = DataClassUtils.get_builder(ProcessorTemplate)
+
 
 class ProcessorTemplateRepo(metaclass=Singleton):
 
@@ -34,9 +35,7 @@ class ProcessorTemplateRepo(metaclass=Singleton):
         templates = []
         try:
             response = self.table.scan()
-            for item in response.get('Items', []):
-                template = dacite.from_dict(ProcessorTemplate, item)
-                templates.append(template)
+            templates = [_build_template(item) for item in response.get('Items', [])]
         except ClientError as e:
             log.exception('Failed to list all templates. status_code: %s, message: %s', e.response['ResponseMetadata']['HTTPStatusCode'], e.response['Error']['Message'])
             raise ServiceException(500, ServiceStatus.FAILURE, 'Could not load available templates list')
@@ -50,12 +49,4 @@ class ProcessorTemplateRepo(metaclass=Singleton):
         Returns:
             The DynamoDB table object.
         """
-        dynamo_db = None
-
-        if self.aws_config.is_local:
-            dynamo_db = boto3.resource('dynamodb', region_name=self.aws_config.dynamodb_aws_region, endpoint_url = 'http://localhost:8000')
-        else:
-            config = Config(region_name = self.aws_config.dynamodb_aws_region)
-            dynamo_db = boto3.resource('dynamodb', config = config)
-
-        return dynamo_db.Table(self.app_config.processor_templates_table_name)
+        return get_table(self.aws_config.dynamodb_aws_region, self.aws_config.is_local, self.app_config.processor_templates_table_name)
@@ -1,6 +1,4 @@
-import boto3
 import dataclasses
-from botocore.config import Config
 from botocore.exceptions import ClientError
 from boto3.dynamodb.conditions import Key, Attr
 from typing import Optional
@@ -11,6 +9,7 @@ from controller import common_controller as common_ctrl
 from exception import ServiceException
 from enums import ServiceStatus
 from utils import Singleton
+from repository._dynamodb import get_table
 
 log = common_ctrl.log
 
@@ -129,12 +128,4 @@ class WorkflowRepository(metaclass=Singleton):
         Returns:
             The DynamoDB table object.
         """
-        dynamo_db = None
-
-        if self.aws_config.is_local:
-            dynamo_db = boto3.resource('dynamodb', region_name = self.aws_config.dynamodb_aws_region, endpoint_url = 'http://localhost:8000')
-        else:
-            config = Config(region_name = self.aws_config.dynamodb_aws_region)
-            dynamo_db = boto3.resource('dynamodb', config = config)
-
-        return dynamo_db.Table(self.app_config.workflow_table_name)
+        return get_table(self.aws_config.dynamodb_aws_region, self.aws_config.is_local, self.app_config.workflow_table_name)
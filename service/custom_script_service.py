@@ -1,8 +1,6 @@
 import nanoid
 
 from typing import List, Union, Dict, Any, Optional
-from dataclasses import asdict
-from dacite import from_dict
 
 from exception import ServiceException
 from enums import ServiceStatus
@@ -51,21 +49,28 @@ class CustomScriptService(metaclass=Singleton):
         # Upload the script to S3 and get the new version ID
         version_id = self._upload_script_to_s3(owner_id, custom_script, payload.script)
 
-        # Create and merge unpublished changes
         unpublished_change = CustomScriptUnpublishedChange(
             version_id=version_id,
             edited_by=owner_id,
             source_version_id=source_version_id,
         )
-        unpublished_changes = self._merge_unpublished_changes(unpublished_change, custom_script.unpublished_changes)
 
-        # Update the repository with the new unpublished changes
-        self.custom_script_repository.update_unpublished_changes(owner_id, custom_script.script_id, unpublished_changes)
+        if self._get_owner_unpublished_change(owner_id, custom_script.unpublished_changes):
+            # Replace the owner's existing unpublished change
+            unpublished_changes = self._merge_unpublished_changes(unpublished_change, custom_script.unpublished_changes)
+            self.custom_script_repository.update_unpublished_changes(owner_id, custom_script.script_id, unpublished_changes)
+        else:
+            # Append the owner's first unpublished change without rewriting the other changes
+            self.custom_script_repository.append_unpublished_change(owner_id, custom_script.script_id, unpublished_change)
 
         # Construct and return the response
-        response = asdict(unpublished_changes[-1])
-        response['script_id'] = custom_script.script_id
-        return from_dict(UnpublishedChangeResponseDTO, response)
+        return UnpublishedChangeResponseDTO(
+            script_id=custom_script.script_id,
+            version_id=unpublished_change.version_id,
+            edited_by=unpublished_change.edited_by,
+            source_version_id=unpublished_change.source_version_id,
+            edited_at=unpublished_change.edited_at
+        )
     
 
     def get_custom_scripts(self, owner_id: str) -> List[CustomScript]:
@@ -80,13 +85,11 @@ class CustomScriptService(metaclass=Singleton):
         """
         log.info('Retrieving owner custom scripts. owner_id: %s', owner_id)
         custom_scripts = self.custom_script_repository.get_owner_custom_scripts(owner_id)
-        updated_scripts = []
         for script in custom_scripts:
             changes = self._get_owner_unpublished_change(owner_id, script.unpublished_changes)
             script.unpublished_changes = [changes] if changes else []
-            updated_scripts.append(script)
         
-        return updated_scripts
+        return custom_scripts
 
 
     def get_custom_script_content(self, owner_id: str, script_id: str, branch: str, version_id: Union[str, None]) -> str:
@@ -156,17 +159,9 @@ class CustomScriptService(metaclass=Singleton):
         version_id = self._upload_script_to_s3(owner_id, custom_script, content, True)
         release = CustomScriptRelease(version_id=version_id, edited_by=owner_id, source_version_id=unpublished_change.version_id)
 
-        # Updating releases
-        custom_script.releases.append(release)
-        self.custom_script_repository.update_releases(owner_id, script_id, custom_script.releases)
-        
-        # Removing unpublished changes from the list
-        filtered_unpublished_changes = []
-        for script in custom_script.unpublished_changes:
-            if script.edited_by == owner_id:
-                continue
-            filtered_unpublished_changes.append(script)
-        self.custom_script_repository.update_unpublished_changes(owner_id, script_id, filtered_unpublished_changes)
+        # Appending the release and removing the owner's unpublished changes in one write
+        filtered_unpublished_changes = [change for change in custom_script.unpublished_changes if change.edited_by != owner_id]
+        self.custom_script_repository.append_release_and_update_unpublished_changes(owner_id, script_id, release, filtered_unpublished_changes)
 
         return release
     
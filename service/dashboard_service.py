@@ -176,7 +176,7 @@ class DashboardService(metaclass=Singleton):
             total_executions_count=total_executions_count,
             failed_executions_ratio=failed_executions_ratio,
             last_event_date=last_event_date,
-            workflow=WorkflowItem(
+            workflow=WorkflowItem.of(
                 id=workflow_id,
                 name=workflow_name,
             )
@@ -205,7 +205,7 @@ class DashboardService(metaclass=Singleton):
                     error_code=error_code,
                     event_id=event_id,
                     execution_id=execution_id,
-                    workflow=WorkflowItem(
+                    workflow=WorkflowItem.of(
                         id=workflow_id,
                         name=workflow_name,
                     ),
@@ -232,7 +232,7 @@ class DashboardService(metaclass=Singleton):
             error_occurrence = bucket['unique_failed_executions']['value']
 
             # Create Workflow Item instance
-            workflow = WorkflowItem(
+            workflow = WorkflowItem.of(
                 id=workflow_id,
                 name=workflow_name
             )
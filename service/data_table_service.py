@@ -39,16 +39,12 @@ class DataTableService(metaclass=Singleton):
         """
         log.info('Retrieving customer tables. owner_id: %s', owner_id)
         tables = self.customer_table_info_repository.get_tables_for_owner(owner_id)
-        owner_tables  = []
-
-        for table in tables:
-            table_size = self.customer_table_info_repository.get_table_size(table.original_table_name)
-            owner_tables.append(ListTableResponse(
-                name=table.table_name,
-                id=table.table_id,
-                size=table_size
-            ))
-        return owner_tables
+        table_sizes = self.customer_table_info_repository.get_table_sizes([table.original_table_name for table in tables])
+
+        return [
+            ListTableResponse(name=table.table_name, id=table.table_id, size=table_size)
+            for table, table_size in zip(tables, table_sizes)
+        ]
 
 
     def update_description(self, owner_id:str, table_id:str, update_table_request:UpdateTableRequest) -> CustomerTableInfo:
@@ -116,7 +116,7 @@ class DashboardService(metaclass=Singleton):
         for failure in failures:
             if not workflow_failures.get(failure.workflow_id, None):
                 workflow_failures[failure.workflow_id] = WorkflowFailure(
-                    workflow=WorkflowItem(id=failure.workflow_id, name=failure.workflow_name),
+                    workflow=WorkflowItem.of(id=failure.workflow_id, name=failure.workflow_name),
                     errors=[]
                 )
             error = WorkflowError(occurrence=failure.error_occurrence, error_code=failure.error_code)
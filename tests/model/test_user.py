@@ -0,0 +1,57 @@
+import unittest
+
+from enums import ServicePermissions
+from model import User
+
+
+class TestUser(unittest.TestCase):
+
+
+    TEST_ORGANIZATION_ID = 'test_organization_id'
+
+
+    def test_from_authorizer_claims_decodes_permissions(self):
+        claims = {
+            'sub': 'test_sub',
+            'custom:organizationId': self.TEST_ORGANIZATION_ID,
+            'custom:permissions': f'["{self.TEST_ORGANIZATION_ID}:{ServicePermissions.CUSTOM_SCRIPT_SAVE_ITEM.value}"]'
+        }
+
+        user = User.from_authorizer_claims(claims)
+
+        self.assertEqual(user.permissions, (f'{self.TEST_ORGANIZATION_ID}:{ServicePermissions.CUSTOM_SCRIPT_SAVE_ITEM.value}',))
+        self.assertTrue(user.has_permission(ServicePermissions.CUSTOM_SCRIPT_SAVE_ITEM.value))
+
+
+    def test_from_authorizer_claims_with_empty_permissions(self):
+        user = User.from_authorizer_claims({'sub': 'test_sub', 'custom:organizationId': self.TEST_ORGANIZATION_ID, 'custom:permissions': '[]'})
+
+        self.assertEqual(user.permissions, ())
+        self.assertFalse(user.has_permission(ServicePermissions.CUSTOM_SCRIPT_SAVE_ITEM.value))
+
+
+    def test_has_permission_ignores_permissions_of_other_organizations(self):
+        user = User('test_sub', self.TEST_ORGANIZATION_ID, (f'other_organization_id:{ServicePermissions.DATA_TABLE_CREATE_ITEM.value}',))
+
+        self.assertFalse(user.has_permission(ServicePermissions.DATA_TABLE_CREATE_ITEM.value))
+
+
+    def test_has_permission_with_wildcard(self):
+        user = User('test_sub', self.TEST_ORGANIZATION_ID, (f'{self.TEST_ORGANIZATION_ID}:*',))
+
+        self.assertTrue(user.has_permission(ServicePermissions.DATA_TABLE_DELETE_ITEM.value))
+
+
+    def test_can_access_model_with_limited_access(self):
+        user = User('test_sub', self.TEST_ORGANIZATION_ID, (f'{self.TEST_ORGANIZATION_ID}:{ServicePermissions.CHATBOT_LIMITED_ACCESS.value}',))
+
+        self.assertTrue(user.can_access_model(None, 'default_model'))
+        self.assertTrue(user.can_access_model('default_model', 'default_model'))
+        self.assertFalse(user.can_access_model('other_model', 'default_model'))
+
+
+    def test_user_is_hashable(self):
+        first_user = User('test_sub', self.TEST_ORGANIZATION_ID, ())
+        second_user = User('test_sub', self.TEST_ORGANIZATION_ID, ())
+
+        self.assertEqual(hash(first_user), hash(second_user))
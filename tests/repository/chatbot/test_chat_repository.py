@@ -1,13 +1,13 @@
 import unittest
 from unittest.mock import Mock, patch
 from botocore.exceptions import ClientError
-from boto3.dynamodb.conditions import Key
-from dataclasses import asdict
+from dataclasses import asdict, FrozenInstanceError
+from decimal import Decimal
 
 from repository import ChatRepository
 from tests.test_utils import TestUtils
 from exception import ServiceException
-from utils import Singleton
+from utils import Singleton, DynamoDBUtils
 from model import ChatSession, ChatMessage, Chat, ChatInteraction, ChatContext, ChatCreationDate
 
 
@@ -27,6 +27,7 @@ class TestChatRepository(unittest.TestCase):
     def setUp(self) -> None:
         self.app_config = Mock()
         self.aws_config = Mock()
+        self.aws_config.is_local = False
         self.mock_dynamodb_table = Mock()
 
         Singleton.clear_instance(ChatRepository)
@@ -35,6 +36,12 @@ class TestChatRepository(unittest.TestCase):
             self.mock_configure_resource = mock_configure_resource
             mock_configure_resource.return_value = self.mock_dynamodb_table
             self.chat_repository = ChatRepository(self.app_config, self.aws_config)
+        self.mock_dynamodb_client = self.mock_dynamodb_table.meta.client
+
+
+    @staticmethod
+    def to_client_items(items: list[dict]) -> list[dict]:
+        return [DynamoDBUtils.serialize_item(item) for item in items]
 
 
     def tearDown(self) -> None:
@@ -52,30 +59,72 @@ class TestChatRepository(unittest.TestCase):
         mock_table_items_path = self.test_resource_path + "get_user_chat_sessions_response.json"
         mock_items = TestUtils.get_file_content(mock_table_items_path)
 
-        self.mock_dynamodb_table.query.return_value = {
-            'Items': mock_items,
+        self.mock_dynamodb_client.query.return_value = {
+            'Items': self.to_client_items(mock_items),
         }
 
         # Call the method under test
         chats = self.chat_repository.get_user_chat_sessions(self.TEST_USER_ID)
 
         # Assertions
-        self.mock_dynamodb_table.query.assert_called_once_with(
+        self.mock_dynamodb_client.query.assert_called_once_with(
+            TableName=self.app_config.chatbot_messages_table_name,
             IndexName=self.app_config.chatbot_messages_gsi_name,
-            KeyConditionExpression=Key('user_id').eq(self.TEST_USER_ID)
+            KeyConditionExpression='user_id = :user_id',
+            ExpressionAttributeValues={':user_id': {'S': self.TEST_USER_ID}},
+            ProjectionExpression='#chat_id, #timestamp',
+            ExpressionAttributeNames={'#chat_id': 'chat_id', '#timestamp': 'timestamp'}
         )
         self.assertEqual(type(chats), list)
         self.assertEqual(len(chats), len(mock_items))
         self.assertEqual(type(chats[0]), ChatSession)
 
 
+    def test_get_user_chat_sessions_converts_number_timestamp(self):
+        """
+        Test case for retrieving user chat sessions whose timestamps are returned as DynamoDB number attributes.
+
+        Expected result: The timestamps of the returned chat sessions are converted to int.
+        """
+        self.mock_dynamodb_client.query.return_value = {
+            'Items': self.to_client_items([{'chat_id': self.TEST_CHAT_ID, 'timestamp': Decimal(self.TEST_TIMESTAMP)}]),
+        }
+
+        chats = self.chat_repository.get_user_chat_sessions(self.TEST_USER_ID)
+
+        self.assertEqual(chats, [ChatSession(chat_id=self.TEST_CHAT_ID, timestamp=self.TEST_TIMESTAMP)])
+        self.assertEqual(type(chats[0].timestamp), int)
+
+
+    def test_get_user_chat_sessions_reads_all_pages(self):
+        """
+        Test case for retrieving user chat sessions spread over several query pages.
+
+        Expected result: The query is continued from the last evaluated key until all sessions are read.
+        """
+        mock_table_items_path = self.test_resource_path + "get_user_chat_sessions_response.json"
+        mock_items = TestUtils.get_file_content(mock_table_items_path)
+        last_evaluated_key = DynamoDBUtils.serialize_item({'chat_id': self.TEST_CHAT_ID, 'timestamp': self.TEST_TIMESTAMP})
+
+        self.mock_dynamodb_client.query.side_effect = [
+            {'Items': self.to_client_items(mock_items[:1]), 'LastEvaluatedKey': last_evaluated_key},
+            {'Items': self.to_client_items(mock_items[1:])},
+        ]
+
+        chats = self.chat_repository.get_user_chat_sessions(self.TEST_USER_ID)
+
+        self.assertEqual(len(chats), len(mock_items))
+        self.assertEqual(self.mock_dynamodb_client.query.call_count, 2)
+        self.assertEqual(self.mock_dynamodb_client.query.call_args.kwargs['ExclusiveStartKey'], last_evaluated_key)
+
+
     def test_get_user_chat_sessions_throws_client_exception(self):
         """
         Test case for handling failure while retrieving user chats due to a ClientError.
 
         Expected Result: The method raises a ServiceException.
         """
-        self.mock_dynamodb_table.query.side_effect = ClientError(
+        self.mock_dynamodb_client.query.side_effect = ClientError(
             {'Error': {'Message': 'Test Error'}, 'ResponseMetadata': {'HTTPStatusCode': 400}}, 'query'
         )
         
@@ -84,9 +133,13 @@ class TestChatRepository(unittest.TestCase):
             self.chat_repository.get_user_chat_sessions(self.TEST_USER_ID)
 
         # Assertions
-        self.mock_dynamodb_table.query.assert_called_once_with(
+        self.mock_dynamodb_client.query.assert_called_once_with(
+            TableName=self.app_config.chatbot_messages_table_name,
             IndexName=self.app_config.chatbot_messages_gsi_name,
-            KeyConditionExpression=Key('user_id').eq(self.TEST_USER_ID)
+            KeyConditionExpression='user_id = :user_id',
+            ExpressionAttributeValues={':user_id': {'S': self.TEST_USER_ID}},
+            ProjectionExpression='#chat_id, #timestamp',
+            ExpressionAttributeNames={'#chat_id': 'chat_id', '#timestamp': 'timestamp'}
         )
         self.assertEqual(e.exception.status_code, 400)
 
@@ -98,15 +151,19 @@ class TestChatRepository(unittest.TestCase):
         Expected result: The method returns an empty list.
         """
         # Mock response from DynamoDB query
-        self.mock_dynamodb_table.query.return_value = {'Items': []}
+        self.mock_dynamodb_client.query.return_value = {'Items': []}
 
         # Call the method under test
         result = self.chat_repository.get_user_chat_sessions(self.TEST_USER_ID)
 
         # Assertions
-        self.mock_dynamodb_table.query.assert_called_once_with(
+        self.mock_dynamodb_client.query.assert_called_once_with(
+            TableName=self.app_config.chatbot_messages_table_name,
             IndexName=self.app_config.chatbot_messages_gsi_name,
-            KeyConditionExpression=Key('user_id').eq(self.TEST_USER_ID)
+            KeyConditionExpression='user_id = :user_id',
+            ExpressionAttributeValues={':user_id': {'S': self.TEST_USER_ID}},
+            ProjectionExpression='#chat_id, #timestamp',
+            ExpressionAttributeNames={'#chat_id': 'chat_id', '#timestamp': 'timestamp'}
         )
         self.assertEqual(result, [])
 
@@ -124,13 +181,13 @@ class TestChatRepository(unittest.TestCase):
         mock_items = TestUtils.get_file_content(mock_table_items_path)
         mock_last_evaluated_key = {"key": "value"}
 
-        self.mock_dynamodb_table.query.return_value = {
-            'Items': mock_items,
-            'LastEvaluatedKey': mock_last_evaluated_key,
+        self.mock_dynamodb_client.query.return_value = {
+            'Items': self.to_client_items(mock_items),
+            'LastEvaluatedKey': DynamoDBUtils.serialize_item(mock_last_evaluated_key),
         }
 
         # Call the method under test
-        chat_response = self.chat_repository.get_chat_messages(self.TEST_CHAT_ID, self.CHAT_MESSAGES_LIMIT, exclusive_start_key)
+        chat_response = self.chat_repository.get_chat_messages(self.TEST_CHAT_ID, len(mock_items), exclusive_start_key)
 
         items = chat_response.messages
         last_evaluated_key = chat_response.last_evaluated_key
@@ -141,9 +198,11 @@ class TestChatRepository(unittest.TestCase):
         self.assertEqual(type(items[0]), ChatMessage)  
         self.assertEqual(last_evaluated_key, mock_last_evaluated_key)
 
-        self.mock_dynamodb_table.query.assert_called_once_with(
-            KeyConditionExpression=Key('chat_id').eq(self.TEST_CHAT_ID),
-            Limit=self.CHAT_MESSAGES_LIMIT,
+        self.mock_dynamodb_client.query.assert_called_once_with(
+            TableName=self.app_config.chatbot_messages_table_name,
+            KeyConditionExpression='chat_id = :chat_id',
+            ExpressionAttributeValues={':chat_id': {'S': self.TEST_CHAT_ID}},
+            Limit=len(mock_items),
             ScanIndexForward=False
         )
 
@@ -161,13 +220,13 @@ class TestChatRepository(unittest.TestCase):
         mock_items = TestUtils.get_file_content(mock_table_items_path)
         mock_last_evaluated_key = {"key": "new_value"}
 
-        self.mock_dynamodb_table.query.return_value = {
-            'Items': mock_items,
-            'LastEvaluatedKey': mock_last_evaluated_key
+        self.mock_dynamodb_client.query.return_value = {
+            'Items': self.to_client_items(mock_items),
+            'LastEvaluatedKey': DynamoDBUtils.serialize_item(mock_last_evaluated_key)
         }
 
         # Call the method under test
-        chat_response = self.chat_repository.get_chat_messages(self.TEST_CHAT_ID, self.CHAT_MESSAGES_LIMIT, exclusive_start_key)
+        chat_response = self.chat_repository.get_chat_messages(self.TEST_CHAT_ID, len(mock_items), exclusive_start_key)
 
         items = chat_response.messages
         last_evaluated_key = chat_response.last_evaluated_key
@@ -178,10 +237,43 @@ class TestChatRepository(unittest.TestCase):
         self.assertEqual(type(items[0]), ChatMessage)
         self.assertEqual(last_evaluated_key, mock_last_evaluated_key)
 
-        self.mock_dynamodb_table.query.assert_called_once_with(
-            KeyConditionExpression=Key('chat_id').eq(self.TEST_CHAT_ID),
-            Limit=self.CHAT_MESSAGES_LIMIT,
-            ExclusiveStartKey=exclusive_start_key,
+        self.mock_dynamodb_client.query.assert_called_once_with(
+            TableName=self.app_config.chatbot_messages_table_name,
+            KeyConditionExpression='chat_id = :chat_id',
+            ExpressionAttributeValues={':chat_id': {'S': self.TEST_CHAT_ID}},
+            Limit=len(mock_items),
+            ExclusiveStartKey=DynamoDBUtils.serialize_item(exclusive_start_key),
+            ScanIndexForward=False
+        )
+
+
+    def test_get_chat_messages_continues_query_when_page_is_not_full(self):
+        """
+        Test case for retrieving chat messages when DynamoDB returns fewer items than the limit along with a last evaluated key.
+
+        Expected result: The query is continued from the last evaluated key for the remaining messages.
+        """
+        mock_table_items_path = self.test_resource_path + "get_chat_messages_response.json"
+        mock_items = TestUtils.get_file_content(mock_table_items_path)
+        first_page_key = {"key": "first_page"}
+        second_page_key = {"key": "second_page"}
+
+        self.mock_dynamodb_client.query.side_effect = [
+            {'Items': self.to_client_items(mock_items[:1]), 'LastEvaluatedKey': DynamoDBUtils.serialize_item(first_page_key)},
+            {'Items': self.to_client_items(mock_items[1:]), 'LastEvaluatedKey': DynamoDBUtils.serialize_item(second_page_key)},
+        ]
+
+        chat_response = self.chat_repository.get_chat_messages(self.TEST_CHAT_ID, len(mock_items))
+
+        self.assertEqual(len(chat_response.messages), len(mock_items))
+        self.assertEqual(chat_response.last_evaluated_key, second_page_key)
+        self.assertEqual(self.mock_dynamodb_client.query.call_count, 2)
+        self.mock_dynamodb_client.query.assert_called_with(
+            TableName=self.app_config.chatbot_messages_table_name,
+            KeyConditionExpression='chat_id = :chat_id',
+            ExpressionAttributeValues={':chat_id': {'S': self.TEST_CHAT_ID}},
+            Limit=len(mock_items) - 1,
+            ExclusiveStartKey=DynamoDBUtils.serialize_item(first_page_key),
             ScanIndexForward=False
         )
 
@@ -198,8 +290,8 @@ class TestChatRepository(unittest.TestCase):
         mock_table_items_path = self.test_resource_path + "get_chat_messages_response.json"
         mock_items = TestUtils.get_file_content(mock_table_items_path)
 
-        self.mock_dynamodb_table.query.return_value = {
-            'Items': mock_items,
+        self.mock_dynamodb_client.query.return_value = {
+            'Items': self.to_client_items(mock_items),
         }
 
         # Call the method under test
@@ -213,8 +305,10 @@ class TestChatRepository(unittest.TestCase):
         self.assertIsNone(chat_response.last_evaluated_key)
         self.assertEqual(type(items[0]), ChatMessage)  
 
-        self.mock_dynamodb_table.query.assert_called_once_with(
-            KeyConditionExpression=Key('chat_id').eq(self.TEST_CHAT_ID),
+        self.mock_dynamodb_client.query.assert_called_once_with(
+            TableName=self.app_config.chatbot_messages_table_name,
+            KeyConditionExpression='chat_id = :chat_id',
+            ExpressionAttributeValues={':chat_id': {'S': self.TEST_CHAT_ID}},
             Limit=self.CHAT_MESSAGES_LIMIT,
             ScanIndexForward=False
         )
@@ -229,7 +323,7 @@ class TestChatRepository(unittest.TestCase):
         exclusive_start_key = None
 
         # Mocking the ClientError exception from DynamoDB query
-        self.mock_dynamodb_table.query.side_effect = ClientError(
+        self.mock_dynamodb_client.query.side_effect = ClientError(
             {'Error': {'Message': 'Test Error'}, 'ResponseMetadata': {'HTTPStatusCode': 400}}, 'query'
         )
         
@@ -238,8 +332,10 @@ class TestChatRepository(unittest.TestCase):
             self.chat_repository.get_chat_messages(self.TEST_CHAT_ID, self.CHAT_MESSAGES_LIMIT, exclusive_start_key)
 
         # Assertions
-        self.mock_dynamodb_table.query.assert_called_once_with(
-            KeyConditionExpression=Key('chat_id').eq(self.TEST_CHAT_ID),  
+        self.mock_dynamodb_client.query.assert_called_once_with(
+            TableName=self.app_config.chatbot_messages_table_name,
+            KeyConditionExpression='chat_id = :chat_id',
+            ExpressionAttributeValues={':chat_id': {'S': self.TEST_CHAT_ID}},
             Limit=self.CHAT_MESSAGES_LIMIT,
             ScanIndexForward=False  
         )
@@ -253,7 +349,7 @@ class TestChatRepository(unittest.TestCase):
         Expected result: The method returns an empty list.
         """
         # Mock response from DynamoDB query
-        self.mock_dynamodb_table.query.return_value = {
+        self.mock_dynamodb_client.query.return_value = {
             'Items': [],
             'LastEvaluatedKey': None,
         }
@@ -261,8 +357,10 @@ class TestChatRepository(unittest.TestCase):
         # Call the method under test
         result = self.chat_repository.get_chat_messages(self.TEST_CHAT_ID, self.CHAT_MESSAGES_LIMIT)
         
-        self.mock_dynamodb_table.query.assert_called_once_with(
-            KeyConditionExpression=Key('chat_id').eq(self.TEST_CHAT_ID),
+        self.mock_dynamodb_client.query.assert_called_once_with(
+            TableName=self.app_config.chatbot_messages_table_name,
+            KeyConditionExpression='chat_id = :chat_id',
+            ExpressionAttributeValues={':chat_id': {'S': self.TEST_CHAT_ID}},
             Limit=self.CHAT_MESSAGES_LIMIT,
             ScanIndexForward=False
         )
@@ -429,6 +527,71 @@ class TestChatRepository(unittest.TestCase):
         self.mock_dynamodb_table.get_item.assert_called_once_with(Key={'chat_id': self.TEST_CHAT_ID, 'timestamp': self.TEST_TIMESTAMP})
 
 
+    def test_get_chat_context_returns_cached_context_with_title(self):
+        """
+        Test case for retrieving a chat context that has a title twice.
+
+        Expected Result: DynamoDB is queried only once, the second call is served from the cache.
+        """
+        item = TestUtils.get_file_content(self.test_resource_path + 'get_chat_context_response.json')
+        self.mock_dynamodb_table.get_item.return_value = {"Item": item}
+
+        first_chat_context = self.chat_repository.get_chat_context(chat_id=self.TEST_CHAT_ID, timestamp=self.TEST_TIMESTAMP)
+        second_chat_context = self.chat_repository.get_chat_context(chat_id=self.TEST_CHAT_ID, timestamp=self.TEST_TIMESTAMP)
+
+        self.assertEqual(first_chat_context, second_chat_context)
+        self.mock_dynamodb_table.get_item.assert_called_once_with(Key={'chat_id': self.TEST_CHAT_ID, 'timestamp': self.TEST_TIMESTAMP})
+
+
+    def test_get_chat_context_cached_context_cannot_be_changed(self):
+        """
+        Test case for changing a chat context returned from the cache.
+
+        Expected Result: The cached chat context is immutable, so callers cannot change it for later requests.
+        """
+        item = TestUtils.get_file_content(self.test_resource_path + 'get_chat_context_response.json')
+        self.mock_dynamodb_table.get_item.return_value = {"Item": item}
+
+        chat_context = self.chat_repository.get_chat_context(chat_id=self.TEST_CHAT_ID, timestamp=self.TEST_TIMESTAMP)
+
+        with self.assertRaises(FrozenInstanceError):
+            chat_context.title = 'changed title'
+
+
+    def test_get_chat_context_is_not_cached_when_local(self):
+        """
+        Test case for retrieving a chat context that has a title twice against a local DynamoDB.
+
+        Expected Result: DynamoDB is queried for both calls.
+        """
+        self.aws_config.is_local = True
+        Singleton.clear_instance(ChatRepository)
+        with patch('repository.chatbot.chat_repository.ChatRepository._ChatRepository__configure_dynamodb') as mock_configure_resource:
+            mock_configure_resource.return_value = self.mock_dynamodb_table
+            chat_repository = ChatRepository(self.app_config, self.aws_config)
+        item = TestUtils.get_file_content(self.test_resource_path + 'get_chat_context_response.json')
+        self.mock_dynamodb_table.get_item.return_value = {"Item": item}
+
+        chat_repository.get_chat_context(chat_id=self.TEST_CHAT_ID, timestamp=self.TEST_TIMESTAMP)
+        chat_repository.get_chat_context(chat_id=self.TEST_CHAT_ID, timestamp=self.TEST_TIMESTAMP)
+
+        self.assertEqual(self.mock_dynamodb_table.get_item.call_count, 2)
+
+
+    def test_get_chat_context_does_not_cache_context_without_title(self):
+        """
+        Test case for retrieving a chat context without a title twice.
+
+        Expected Result: DynamoDB is queried on every call, as the title can still be set.
+        """
+        self.mock_dynamodb_table.get_item.return_value = {"Item": {'model_id': self.TEST_MODEL_ID}}
+
+        self.chat_repository.get_chat_context(chat_id=self.TEST_CHAT_ID, timestamp=self.TEST_TIMESTAMP)
+        self.chat_repository.get_chat_context(chat_id=self.TEST_CHAT_ID, timestamp=self.TEST_TIMESTAMP)
+
+        self.assertEqual(self.mock_dynamodb_table.get_item.call_count, 2)
+
+
     def test_get_chat_context_throws_client_exception(self):
         """
         Test case for handling DynamoDB ClientError when retrieving chat context.
@@ -477,8 +640,8 @@ class TestChatRepository(unittest.TestCase):
         mock_table_items_path = self.test_resource_path + "get_timestamp_response.json"
         mock_items = TestUtils.get_file_content(mock_table_items_path)
 
-        self.mock_dynamodb_table.query.return_value ={
-            'Items': mock_items
+        self.mock_dynamodb_client.query.return_value ={
+            'Items': self.to_client_items(mock_items)
         }
 
         # Call method
@@ -487,19 +650,38 @@ class TestChatRepository(unittest.TestCase):
         # Assertions
         self.assertIsInstance(chat_timestamp, ChatCreationDate)
         self.assertEqual(chat_timestamp.timestamp, self.TEST_TIMESTAMP)
-        self.mock_dynamodb_table.query.assert_called_once_with(
+        self.mock_dynamodb_client.query.assert_called_once_with(
+            TableName=self.app_config.chatbot_messages_table_name,
             IndexName=self.app_config.chatbot_messages_gsi_name,
-            KeyConditionExpression=Key('user_id').eq(self.TEST_USER_ID) & Key('chat_id').eq(self.TEST_CHAT_ID)
+            KeyConditionExpression='user_id = :user_id AND chat_id = :chat_id',
+            ExpressionAttributeValues={':user_id': {'S': self.TEST_USER_ID}, ':chat_id': {'S': self.TEST_CHAT_ID}},
+            ProjectionExpression='#timestamp',
+            ExpressionAttributeNames={'#timestamp': 'timestamp'}
         )
 
     
+    def test_get_timestamp_of_created_chat_is_served_from_cache(self):
+        """
+        Test case for retrieving the timestamp of a chat that was created by the same repository.
+
+        Expected result: The creation timestamp is returned without querying DynamoDB.
+        """
+        chat = Chat(user_id=self.TEST_USER_ID, owner_id=self.TEST_OWNER_ID, model_id=self.TEST_MODEL_ID)
+        self.chat_repository.create_new_chat(chat)
+
+        chat_timestamp = self.chat_repository.get_chat_timestamp(user_id=self.TEST_USER_ID, chat_id=chat.chat_id)
+
+        self.assertEqual(chat_timestamp, ChatCreationDate(timestamp=chat.timestamp))
+        self.mock_dynamodb_client.query.assert_not_called()
+
+
     def test_get_timestamp_throws_client_exception(self):
         """
          Test case for handling DynamoDB ClientError when retrieving the chat timestamp.
 
          Expected Result: The method raises a ServiceException.
         """
-        self.mock_dynamodb_table.query.side_effect = ClientError(
+        self.mock_dynamodb_client.query.side_effect = ClientError(
             {'Error': {'Message': 'Test Error'}, 'ResponseMetadata': {'HTTPStatusCode': 400}}, 'query'
         )
 
@@ -508,9 +690,13 @@ class TestChatRepository(unittest.TestCase):
             self.chat_repository.get_chat_timestamp(user_id=self.TEST_USER_ID, chat_id=self.TEST_CHAT_ID)
 
         # Assertions
-        self.mock_dynamodb_table.query.assert_called_once_with(
-            IndexName=self.app_config.chatbot_messages_gsi_name,  
-            KeyConditionExpression=Key('user_id').eq(self.TEST_USER_ID) & Key('chat_id').eq(self.TEST_CHAT_ID)
+        self.mock_dynamodb_client.query.assert_called_once_with(
+            TableName=self.app_config.chatbot_messages_table_name,
+            IndexName=self.app_config.chatbot_messages_gsi_name,
+            KeyConditionExpression='user_id = :user_id AND chat_id = :chat_id',
+            ExpressionAttributeValues={':user_id': {'S': self.TEST_USER_ID}, ':chat_id': {'S': self.TEST_CHAT_ID}},
+            ProjectionExpression='#timestamp',
+            ExpressionAttributeNames={'#timestamp': 'timestamp'}
         )
         self.assertEqual(e.exception.status_code, 400)
 
@@ -522,14 +708,66 @@ class TestChatRepository(unittest.TestCase):
         Expected result: The method returns None.
         """
         # Mock response from DynamoDB query
-        self.mock_dynamodb_table.query.return_value = {'Items': []}
+        self.mock_dynamodb_client.query.return_value = {'Items': []}
 
         # Call the method under test
         result = self.chat_repository.get_chat_timestamp(user_id=self.TEST_USER_ID, chat_id=self.TEST_CHAT_ID)
 
         # Assertions
-        self.mock_dynamodb_table.query.assert_called_once_with(
+        self.mock_dynamodb_client.query.assert_called_once_with(
+            TableName=self.app_config.chatbot_messages_table_name,
             IndexName=self.app_config.chatbot_messages_gsi_name,
-            KeyConditionExpression=Key('user_id').eq(self.TEST_USER_ID) & Key('chat_id').eq(self.TEST_CHAT_ID)
+            KeyConditionExpression='user_id = :user_id AND chat_id = :chat_id',
+            ExpressionAttributeValues={':user_id': {'S': self.TEST_USER_ID}, ':chat_id': {'S': self.TEST_CHAT_ID}},
+            ProjectionExpression='#timestamp',
+            ExpressionAttributeNames={'#timestamp': 'timestamp'}
         )
         self.assertIsNone(result)
+
+
+    @patch('repository.chatbot.chat_repository.threading.Thread')
+    @patch('repository.chatbot.chat_repository.get_table')
+    def test_configure_dynamodb_skips_warm_up_when_disabled(self, mock_get_table, mock_thread):
+        self.aws_config.dynamodb_warm_up = False
+        self.aws_config.is_local = False
+
+        Singleton.clear_instance(ChatRepository)
+        chat_repository = ChatRepository(self.app_config, self.aws_config)
+
+        self.assertIs(chat_repository.table, mock_get_table.return_value)
+        mock_thread.assert_not_called()
+
+
+    @patch('repository.chatbot.chat_repository.threading.Thread')
+    @patch('repository.chatbot.chat_repository.get_table')
+    def test_configure_dynamodb_skips_warm_up_when_local(self, mock_get_table, mock_thread):
+        self.aws_config.dynamodb_warm_up = True
+        self.aws_config.is_local = True
+
+        Singleton.clear_instance(ChatRepository)
+        ChatRepository(self.app_config, self.aws_config)
+
+        mock_thread.assert_not_called()
+
+
+    @patch('repository.chatbot.chat_repository.threading.Thread')
+    @patch('repository.chatbot.chat_repository.get_client')
+    @patch('repository.chatbot.chat_repository.get_table')
+    def test_configure_dynamodb_warms_up_shared_client_in_background(self, mock_get_table, mock_get_client, mock_thread):
+        self.aws_config.dynamodb_warm_up = True
+        self.aws_config.is_local = False
+        # Run the warm-up synchronously when the thread is started
+        mock_thread.side_effect = lambda target, **kwargs: Mock(start=target)
+        mock_get_client.return_value.get_item.side_effect = ClientError(
+            {'Error': {'Message': 'Test Error'}, 'ResponseMetadata': {'HTTPStatusCode': 400}}, 'get_item'
+        )
+
+        Singleton.clear_instance(ChatRepository)
+        ChatRepository(self.app_config, self.aws_config)
+
+        self.assertTrue(mock_thread.call_args.kwargs['daemon'])
+        mock_get_client.assert_called_once_with(self.aws_config.dynamodb_aws_region, False)
+        mock_get_client.return_value.get_item.assert_called_once_with(
+            TableName=self.app_config.chatbot_messages_table_name,
+            Key={'chat_id': {'S': '__warm_up__'}, 'timestamp': {'N': '0'}}
+        )
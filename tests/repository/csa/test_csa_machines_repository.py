@@ -6,7 +6,7 @@ from repository import CsaMachinesRepository
 from tests.test_utils import TestUtils
 from exception import ServiceException
 from model import MachineInfo, Module
-from utils import Singleton
+from utils import Singleton, DynamoDBUtils
 
 
 class TestCsaMachinesRepository(unittest.TestCase):
@@ -26,6 +26,7 @@ class TestCsaMachinesRepository(unittest.TestCase):
             self.mock_configure_resource = mock_configure_resource
             mock_configure_resource.return_value = self.mock_dynamodb_table
             self.csa_machine_repo = CsaMachinesRepository(self.app_config, self.aws_config)
+        self.mock_dynamodb_client = self.mock_dynamodb_table.meta.client
 
 
     def tearDown(self) -> None:
@@ -43,7 +44,7 @@ class TestCsaMachinesRepository(unittest.TestCase):
         """
         # Mock DynamoDB response
         item = TestUtils.get_file_content(self.test_resource_path + 'csa_machines_updater_items.json')
-        self.mock_dynamodb_table.get_item.return_value = {"Item": item} 
+        self.mock_dynamodb_client.get_item.return_value = {"Item": DynamoDBUtils.serialize_item(item)}
 
         # Call method
         machine_info = self.csa_machine_repo.get_csa_machine_info("owner123", "machine123")
@@ -57,7 +58,12 @@ class TestCsaMachinesRepository(unittest.TestCase):
         self.assertEqual(machine_info.modules[0].version, "1.1.0")
 
         # Verify the mock was called with the expected arguments
-        self.mock_dynamodb_table.get_item.assert_called_once_with(Key={"owner_id": "owner123", "machine_id": "machine123"})
+        self.mock_dynamodb_client.get_item.assert_called_once_with(
+            TableName=self.app_config.csa_machines_table_name,
+            Key={"owner_id": {"S": "owner123"}, "machine_id": {"S": "machine123"}},
+            ProjectionExpression="#owner_id, #machine_id, #platform, #modules",
+            ExpressionAttributeNames={"#owner_id": "owner_id", "#machine_id": "machine_id", "#platform": "platform", "#modules": "modules"}
+        )
 
 
     def test_get_csa_machine_info_raises_service_exception_on_client_error(self):
@@ -69,7 +75,7 @@ class TestCsaMachinesRepository(unittest.TestCase):
         owner's machine info with the correct status code and message.
         """
         # Mock DynamoDB ClientError
-        self.mock_dynamodb_table.get_item.side_effect = ClientError(
+        self.mock_dynamodb_client.get_item.side_effect = ClientError(
             {"Error": {"Message": "Test Error"}, "ResponseMetadata": {"HTTPStatusCode": 400}},
             "query"
         )
@@ -92,7 +98,7 @@ class TestCsaMachinesRepository(unittest.TestCase):
         does not exist.
         """
         # Mock DynamoDB to return an empty response
-        self.mock_dynamodb_table.get_item.return_value = {}
+        self.mock_dynamodb_client.get_item.return_value = {}
 
         # Call method 
         with self.assertRaises(ServiceException) as e:
@@ -101,7 +107,12 @@ class TestCsaMachinesRepository(unittest.TestCase):
         # Assertions
         self.assertEqual(e.exception.status_code, 400)
         self.assertEqual(e.exception.message, "Machine info does not exists")
-        self.mock_dynamodb_table.get_item.assert_called_once_with(Key={"owner_id": "owner123", "machine_id": "machine123"})
+        self.mock_dynamodb_client.get_item.assert_called_once_with(
+            TableName=self.app_config.csa_machines_table_name,
+            Key={"owner_id": {"S": "owner123"}, "machine_id": {"S": "machine123"}},
+            ProjectionExpression="#owner_id, #machine_id, #platform, #modules",
+            ExpressionAttributeNames={"#owner_id": "owner_id", "#machine_id": "machine_id", "#platform": "platform", "#modules": "modules"}
+        )
 
 
     def test_get_csa_machine_info_invalid_keys(self):
@@ -113,7 +124,7 @@ class TestCsaMachinesRepository(unittest.TestCase):
         does not exist with the provided keys.
         """
         #Mock Dynamodb response
-        self.mock_dynamodb_table.get_item.return_value = {}
+        self.mock_dynamodb_client.get_item.return_value = {}
 
         #Method under test
         with self.assertRaises(ServiceException) as e:
@@ -122,7 +133,12 @@ class TestCsaMachinesRepository(unittest.TestCase):
         #Assertions
         self.assertEqual(e.exception.status_code, 400)
         self.assertEqual(e.exception.message, "Machine info does not exists")
-        self.mock_dynamodb_table.get_item.assert_called_once_with(Key={"owner_id": "invalid_owner", "machine_id": "invalid_machine"})
+        self.mock_dynamodb_client.get_item.assert_called_once_with(
+            TableName=self.app_config.csa_machines_table_name,
+            Key={"owner_id": {"S": "invalid_owner"}, "machine_id": {"S": "invalid_machine"}},
+            ProjectionExpression="#owner_id, #machine_id, #platform, #modules",
+            ExpressionAttributeNames={"#owner_id": "owner_id", "#machine_id": "machine_id", "#platform": "platform", "#modules": "modules"}
+        )
 
 
     def test_update_modules_success(self):
@@ -56,7 +56,72 @@ class TestCsaModuleVersionsRepository(unittest.TestCase):
         self.assertEqual(module_info[0].version, "1.0.0")
         self.assertEqual(module_info[0].checksum, "checksum123")
 
-        self.mock_dynamodb_table.query.assert_called_once_with(KeyConditionExpression=Key('module_name').eq('module_name'))
+        self.mock_dynamodb_table.query.assert_called_once_with(
+            KeyConditionExpression=Key('module_name').eq('module_name'),
+            ProjectionExpression='#module_name, #version, #checksum',
+            ExpressionAttributeNames={'#module_name': 'module_name', '#version': 'version', '#checksum': 'checksum'}
+        )
+
+
+    def test_get_csa_module_versions_reads_all_pages(self):
+        """
+        Test case for retrieving CSA module versions spread over several query pages.
+
+        Case: The first DynamoDB query response contains a LastEvaluatedKey.
+        Expected Result: The method continues the query from that key and returns the items of all pages.
+        """
+        items = [TestUtils.get_file_content(self.test_resource_path + 'module_version_updater_items.json')]
+        last_evaluated_key = {'module_name': 'module_name', 'version': '1.0.0'}
+        self.mock_dynamodb_table.query.side_effect = [
+            {"Items": items, "LastEvaluatedKey": last_evaluated_key},
+            {"Items": items},
+        ]
+
+        module_info = self.csa_module_versions_repo.get_csa_module_versions("module_name")
+
+        self.assertEqual(len(module_info), 2)
+        self.assertEqual(self.mock_dynamodb_table.query.call_count, 2)
+        self.mock_dynamodb_table.query.assert_called_with(
+            KeyConditionExpression=Key('module_name').eq('module_name'),
+            ProjectionExpression='#module_name, #version, #checksum',
+            ExpressionAttributeNames={'#module_name': 'module_name', '#version': 'version', '#checksum': 'checksum'},
+            ExclusiveStartKey=last_evaluated_key
+        )
+
+
+    def test_get_csa_module_versions_served_from_cache(self):
+        """
+        Test case for retrieving the same CSA module versions twice.
+
+        Case: The module versions of the same module name are requested twice.
+        Expected Result: DynamoDB is queried once and the second call returns the cached versions.
+        """
+        items = [TestUtils.get_file_content(self.test_resource_path + 'module_version_updater_items.json')]
+        self.mock_dynamodb_table.query.return_value = {"Items": items}
+
+        first_module_info = self.csa_module_versions_repo.get_csa_module_versions("module_name")
+        second_module_info = self.csa_module_versions_repo.get_csa_module_versions("module_name")
+
+        self.assertEqual(first_module_info, second_module_info)
+        self.mock_dynamodb_table.query.assert_called_once()
+
+
+    def test_get_csa_module_versions_cache_is_not_changed_by_callers(self):
+        """
+        Test case for changing the list of CSA module versions returned from the cache.
+
+        Case: A caller removes the versions from the returned list.
+        Expected Result: The next call still returns the cached versions.
+        """
+        items = [TestUtils.get_file_content(self.test_resource_path + 'module_version_updater_items.json')]
+        self.mock_dynamodb_table.query.return_value = {"Items": items}
+
+        first_module_info = self.csa_module_versions_repo.get_csa_module_versions("module_name")
+        first_module_info.clear()
+        second_module_info = self.csa_module_versions_repo.get_csa_module_versions("module_name")
+
+        self.assertEqual(len(second_module_info), 1)
+        self.mock_dynamodb_table.query.assert_called_once()
 
 
     def test_get_csa_module_versions_raises_service_exception_on_client_error(self):
@@ -122,7 +187,11 @@ class TestCsaModuleVersionsRepository(unittest.TestCase):
         self.assertEqual(module_info[1].version, "1.1.0")
         self.assertEqual(module_info[1].checksum, "checksum456")
 
-        self.mock_dynamodb_table.query.assert_called_once_with(KeyConditionExpression=Key('module_name').eq('module_name'))
+        self.mock_dynamodb_table.query.assert_called_once_with(
+            KeyConditionExpression=Key('module_name').eq('module_name'),
+            ProjectionExpression='#module_name, #version, #checksum',
+            ExpressionAttributeNames={'#module_name': 'module_name', '#version': 'version', '#checksum': 'checksum'}
+        )
 
 
     def test_get_csa_module_versions_no_result(self):
@@ -144,7 +213,11 @@ class TestCsaModuleVersionsRepository(unittest.TestCase):
         self.assertEqual(e.exception.status_code, 400)
         self.assertEqual(e.exception.message, "Modules do not exist")
 
-        self.mock_dynamodb_table.query.assert_called_once_with(KeyConditionExpression=Key('module_name').eq('module_name'))
+        self.mock_dynamodb_table.query.assert_called_once_with(
+            KeyConditionExpression=Key('module_name').eq('module_name'),
+            ProjectionExpression='#module_name, #version, #checksum',
+            ExpressionAttributeNames={'#module_name': 'module_name', '#version': 'version', '#checksum': 'checksum'}
+        )
 
 
     def test_get_csa_module_version_invalid_key(self):
@@ -166,4 +239,8 @@ class TestCsaModuleVersionsRepository(unittest.TestCase):
         self.assertEqual(e.exception.status_code, 400)
         self.assertEqual(e.exception.message, "Modules do not exist")
 
-        self.mock_dynamodb_table.query.assert_called_once_with(KeyConditionExpression=Key('module_name').eq('invalid_module_name'))
+        self.mock_dynamodb_table.query.assert_called_once_with(
+            KeyConditionExpression=Key('module_name').eq('invalid_module_name'),
+            ProjectionExpression='#module_name, #version, #checksum',
+            ExpressionAttributeNames={'#module_name': 'module_name', '#version': 'version', '#checksum': 'checksum'}
+        )
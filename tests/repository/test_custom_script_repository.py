@@ -1,13 +1,12 @@
 import unittest
 from unittest.mock import Mock, patch
 from botocore.exceptions import ClientError
-from boto3.dynamodb.conditions import Key
 
-from model import CustomScript
+from model import CustomScript, CustomScriptRelease, CustomScriptUnpublishedChange
 from repository.custom_script_repository import CustomScriptRepository
 from exception import ServiceException
 from enums import ServiceStatus
-from utils import Singleton
+from utils import Singleton, DynamoDBUtils
 from tests.test_utils import TestUtils
 
 
@@ -28,6 +27,7 @@ class TestCustomScriptRepository(unittest.TestCase):
             self.mock_configure_resource = mock_configure_resource
             self.mock_configure_resource.return_value = self.mock_dynamodb_table
             self.custom_script_repository = CustomScriptRepository(self.app_config, self.aws_config)
+        self.mock_dynamodb_client = self.mock_dynamodb_table.meta.client
 
 
     def tearDown(self):
@@ -42,24 +42,52 @@ class TestCustomScriptRepository(unittest.TestCase):
         mock_table_items_path = self.TEST_RESOURCE_PATH + "get_owner_custom_scripts_response.json"
         mock_items = TestUtils.get_file_content(mock_table_items_path)
 
-        self.mock_dynamodb_table.query.return_value = {
-            'Items': mock_items,
+        self.mock_dynamodb_client.query.return_value = {
+            'Items': [DynamoDBUtils.serialize_item(item) for item in mock_items],
         }
 
         # Call the method under test
         items = self.custom_script_repository.get_owner_custom_scripts(owner_id)
 
         # Assertions
-        self.mock_dynamodb_table.query.assert_called_once_with(KeyConditionExpression=Key('owner_id').eq(owner_id))
+        self.mock_dynamodb_client.query.assert_called_once_with(
+            TableName=self.app_config.custom_script_table_name,
+            KeyConditionExpression='owner_id = :owner_id',
+            ExpressionAttributeValues={':owner_id': {'S': owner_id}},
+            ProjectionExpression='#owner_id, #script_id, #language, #extension, #name, #releases, #unpublished_changes, #creation_date',
+            ExpressionAttributeNames={
+                '#owner_id': 'owner_id', '#script_id': 'script_id', '#language': 'language', '#extension': 'extension', '#name': 'name',
+                '#releases': 'releases', '#unpublished_changes': 'unpublished_changes', '#creation_date': 'creation_date'
+            }
+        )
         self.assertEqual(type(items), list)
         self.assertEqual(len(items), len(mock_items))
         self.assertEqual(type(items[0]), CustomScript)
 
 
+    def test_get_owner_custom_scripts_reads_all_pages(self):
+        owner_id = 'TEST_OWNER_ID'
+        last_evaluated_key = {'owner_id': {'S': owner_id}, 'script_id': {'S': 'TEST_SCRIPT_ID'}}
+
+        mock_table_items_path = self.TEST_RESOURCE_PATH + "get_owner_custom_scripts_response.json"
+        mock_items = [DynamoDBUtils.serialize_item(item) for item in TestUtils.get_file_content(mock_table_items_path)]
+
+        self.mock_dynamodb_client.query.side_effect = [
+            {'Items': mock_items, 'LastEvaluatedKey': last_evaluated_key},
+            {'Items': mock_items},
+        ]
+
+        items = self.custom_script_repository.get_owner_custom_scripts(owner_id)
+
+        self.assertEqual(self.mock_dynamodb_client.query.call_count, 2)
+        self.assertEqual(self.mock_dynamodb_client.query.call_args.kwargs['ExclusiveStartKey'], last_evaluated_key)
+        self.assertEqual(len(items), 2 * len(mock_items))
+
+
     def test_get_owner_custom_scripts_throws_client_exception(self):
         owner_id = 'TEST_OWNER_ID'
 
-        self.mock_dynamodb_table.query.side_effect = ClientError(
+        self.mock_dynamodb_client.query.side_effect = ClientError(
             {'Error': {'Message': 'Test Error'}, 'ResponseMetadata': {'HTTPStatusCode': 400}}, 'query'
         )
 
@@ -68,7 +96,16 @@ class TestCustomScriptRepository(unittest.TestCase):
             self.custom_script_repository.get_owner_custom_scripts(owner_id)
 
         # Assertions
-        self.mock_dynamodb_table.query.assert_called_once_with(KeyConditionExpression=Key('owner_id').eq(owner_id))
+        self.mock_dynamodb_client.query.assert_called_once_with(
+            TableName=self.app_config.custom_script_table_name,
+            KeyConditionExpression='owner_id = :owner_id',
+            ExpressionAttributeValues={':owner_id': {'S': owner_id}},
+            ProjectionExpression='#owner_id, #script_id, #language, #extension, #name, #releases, #unpublished_changes, #creation_date',
+            ExpressionAttributeNames={
+                '#owner_id': 'owner_id', '#script_id': 'script_id', '#language': 'language', '#extension': 'extension', '#name': 'name',
+                '#releases': 'releases', '#unpublished_changes': 'unpublished_changes', '#creation_date': 'creation_date'
+            }
+        )
         self.assertEqual(e.exception.message, "Failed to retrieve owner custom script")
         self.assertEqual(e.exception.status_code, 400)
 
@@ -81,23 +118,50 @@ class TestCustomScriptRepository(unittest.TestCase):
         mock_table_items_path = self.TEST_RESOURCE_PATH + "get_custom_script_response.json"
         mock_items = TestUtils.get_file_content(mock_table_items_path)
 
-        self.mock_dynamodb_table.get_item.return_value = {
-            'Item': mock_items,
+        self.mock_dynamodb_client.get_item.return_value = {
+            'Item': DynamoDBUtils.serialize_item(mock_items),
         }
 
         # Call the method under test
         item = self.custom_script_repository.get_custom_script(owner_id, script_id)
 
         # Assertions
-        self.mock_dynamodb_table.get_item.assert_called_once_with(Key={'owner_id': owner_id, 'script_id': script_id})
+        self.mock_dynamodb_client.get_item.assert_called_once_with(
+            TableName=self.app_config.custom_script_table_name,
+            Key={'owner_id': {'S': owner_id}, 'script_id': {'S': script_id}},
+            ProjectionExpression='#owner_id, #script_id, #language, #extension, #name, #releases, #unpublished_changes, #creation_date',
+            ExpressionAttributeNames={
+                '#owner_id': 'owner_id', '#script_id': 'script_id', '#language': 'language', '#extension': 'extension', '#name': 'name',
+                '#releases': 'releases', '#unpublished_changes': 'unpublished_changes', '#creation_date': 'creation_date'
+            }
+        )
         self.assertIsInstance(item, CustomScript)
 
 
+    def test_get_custom_script_converts_number_dates(self):
+        owner_id = 'TEST_OWNER_ID'
+        script_id = 'TEST_SCRIPT_ID'
+
+        mock_table_items_path = self.TEST_RESOURCE_PATH + "get_custom_script_response.json"
+        mock_items = TestUtils.get_file_content(mock_table_items_path)
+
+        self.mock_dynamodb_client.get_item.return_value = {
+            'Item': DynamoDBUtils.serialize_item(mock_items),
+        }
+
+        item = self.custom_script_repository.get_custom_script(owner_id, script_id)
+
+        self.assertIs(type(item.creation_date), int)
+        self.assertEqual(item.creation_date, 1726812465)
+        self.assertIs(type(item.releases[0].release_date), int)
+        self.assertEqual(item.releases[0].release_date, 1726812912)
+
+
     def test_get_custom_script_throws_client_exception(self):
         owner_id = 'TEST_OWNER_ID'
         script_id = 'TEST_SCRIPT_ID'
 
-        self.mock_dynamodb_table.get_item.side_effect = ClientError(
+        self.mock_dynamodb_client.get_item.side_effect = ClientError(
             {'Error': {'Message': 'Test Error'}, 'ResponseMetadata': {'HTTPStatusCode': 400}}, 'get_item'
         )
 
@@ -106,6 +170,92 @@ class TestCustomScriptRepository(unittest.TestCase):
             self.custom_script_repository.get_custom_script(owner_id, script_id)
 
         # Assertions
-        self.mock_dynamodb_table.get_item.assert_called_once_with(Key={'owner_id': owner_id, 'script_id': script_id})
+        self.mock_dynamodb_client.get_item.assert_called_once_with(
+            TableName=self.app_config.custom_script_table_name,
+            Key={'owner_id': {'S': owner_id}, 'script_id': {'S': script_id}},
+            ProjectionExpression='#owner_id, #script_id, #language, #extension, #name, #releases, #unpublished_changes, #creation_date',
+            ExpressionAttributeNames={
+                '#owner_id': 'owner_id', '#script_id': 'script_id', '#language': 'language', '#extension': 'extension', '#name': 'name',
+                '#releases': 'releases', '#unpublished_changes': 'unpublished_changes', '#creation_date': 'creation_date'
+            }
+        )
         self.assertEqual(e.exception.message, "Failed to retrieve custom script")
         self.assertEqual(e.exception.status_code, 400)
+
+
+    def test_create_custom_script_puts_nested_changes_as_dicts(self):
+        custom_script = CustomScript(
+            owner_id='TEST_OWNER_ID',
+            script_id='TEST_SCRIPT_ID',
+            language='python-3.11.0',
+            extension='py',
+            name='SCRIPT_NAME',
+            releases=[],
+            unpublished_changes=[CustomScriptUnpublishedChange(version_id='TEST_VERSION_ID', edited_by='TEST_OWNER_ID', edited_at=1726812465)],
+            creation_date=1726812465
+        )
+
+        self.custom_script_repository.create_custom_script(custom_script)
+
+        self.mock_dynamodb_table.put_item.assert_called_once_with(Item={
+            'owner_id': 'TEST_OWNER_ID',
+            'script_id': 'TEST_SCRIPT_ID',
+            'language': 'python-3.11.0',
+            'extension': 'py',
+            'name': 'SCRIPT_NAME',
+            'releases': [],
+            'unpublished_changes': [{'version_id': 'TEST_VERSION_ID', 'edited_by': 'TEST_OWNER_ID', 'source_version_id': None, 'edited_at': 1726812465}],
+            'creation_date': 1726812465
+        })
+
+
+    def test_append_unpublished_change_sends_only_the_new_change(self):
+        owner_id = 'TEST_OWNER_ID'
+        script_id = 'TEST_SCRIPT_ID'
+        unpublished_change = CustomScriptUnpublishedChange(version_id='TEST_VERSION_ID', edited_by=owner_id, edited_at=1726812465)
+
+        self.custom_script_repository.append_unpublished_change(owner_id, script_id, unpublished_change)
+
+        self.mock_dynamodb_table.update_item.assert_called_once_with(
+            Key={'owner_id': owner_id, 'script_id': script_id},
+            UpdateExpression="SET unpublished_changes = list_append(if_not_exists(unpublished_changes, :empty_list), :unpublished_changes)",
+            ExpressionAttributeValues={
+                ':unpublished_changes': [{'version_id': 'TEST_VERSION_ID', 'edited_by': owner_id, 'source_version_id': None, 'edited_at': 1726812465}],
+                ':empty_list': []
+            },
+        )
+
+
+    def test_append_unpublished_change_throws_client_exception(self):
+        owner_id = 'TEST_OWNER_ID'
+        script_id = 'TEST_SCRIPT_ID'
+        unpublished_change = CustomScriptUnpublishedChange(version_id='TEST_VERSION_ID', edited_by=owner_id, edited_at=1726812465)
+
+        self.mock_dynamodb_table.update_item.side_effect = ClientError(
+            {'Error': {'Message': 'Test Error'}, 'ResponseMetadata': {'HTTPStatusCode': 400}}, 'update_item'
+        )
+
+        with self.assertRaises(ServiceException) as e:
+            self.custom_script_repository.append_unpublished_change(owner_id, script_id, unpublished_change)
+
+        self.assertEqual(e.exception.message, "Failed to update unpublished changes")
+        self.assertEqual(e.exception.status_code, 400)
+
+
+    def test_append_release_and_update_unpublished_changes_in_one_write(self):
+        owner_id = 'TEST_OWNER_ID'
+        script_id = 'TEST_SCRIPT_ID'
+        release = CustomScriptRelease(version_id='TEST_VERSION_ID', edited_by=owner_id, source_version_id='TEST_SOURCE_VERSION_ID', release_date=1726812912)
+        unpublished_changes = [CustomScriptUnpublishedChange(version_id='TEST_OTHER_VERSION_ID', edited_by='TEST_OTHER_USER_ID', edited_at=1726812465)]
+
+        self.custom_script_repository.append_release_and_update_unpublished_changes(owner_id, script_id, release, unpublished_changes)
+
+        self.mock_dynamodb_table.update_item.assert_called_once_with(
+            Key={'owner_id': owner_id, 'script_id': script_id},
+            UpdateExpression="SET releases = list_append(if_not_exists(releases, :empty_list), :releases), unpublished_changes = :unpublished_changes",
+            ExpressionAttributeValues={
+                ':releases': [{'version_id': 'TEST_VERSION_ID', 'edited_by': owner_id, 'source_version_id': 'TEST_SOURCE_VERSION_ID', 'release_date': 1726812912}],
+                ':empty_list': [],
+                ':unpublished_changes': [{'version_id': 'TEST_OTHER_VERSION_ID', 'edited_by': 'TEST_OTHER_USER_ID', 'source_version_id': None, 'edited_at': 1726812465}]
+            },
+        )
@@ -1,16 +1,16 @@
 import unittest
 from unittest.mock import Mock, patch
 from botocore.exceptions import ClientError
-from boto3.dynamodb.conditions import Key, Attr
-from dacite import from_dict
+from boto3.dynamodb.conditions import Attr
 from datetime import datetime
+from decimal import Decimal
 
 from tests.test_utils import TestUtils
 from model import  CustomerTableInfo
 from repository.customer_table_info_repository import CustomerTableInfoRepository, BackupJob
 from exception import ServiceException
 from enums import ServiceStatus
-from utils import Singleton
+from utils import Singleton, DataClassUtils, DynamoDBUtils
 
 class TestCustomerTableInfoRepository(unittest.TestCase):
 
@@ -29,20 +29,19 @@ class TestCustomerTableInfoRepository(unittest.TestCase):
         Singleton.clear_instance(CustomerTableInfoRepository)
         with patch('repository.customer_table_info_repository.CustomerTableInfoRepository._CustomerTableInfoRepository__configure_dynamodb_resource') as mock_configure_resource, \
              patch('repository.customer_table_info_repository.CustomerTableInfoRepository._CustomerTableInfoRepository__configure_dynamodb_client') as mock_configure_client, \
-             patch('repository.customer_table_info_repository.CustomerTableInfoRepository._CustomerTableInfoRepository__configure_backup_client') as mock_configure_backup_client, \
              patch('repository.customer_table_info_repository.CustomerTableInfoRepository._CustomerTableInfoRepository__configure_table') as mock_configure_table:
 
             self.mock_configure_resource = mock_configure_resource
             self.mock_configure_client = mock_configure_client
-            self.mock_configure_backup_client = mock_configure_backup_client
             self.mock_configure_table = mock_configure_table
 
             self.mock_configure_resource.return_value = self.mock_dynamodb_resource
             self.mock_configure_client.return_value = self.mock_dynamodb_client
-            self.mock_configure_backup_client.return_value = self.mock_dynamodb_backup_client
             self.mock_configure_table.return_value = self.mock_table
 
             self.customer_table_info_repo = CustomerTableInfoRepository(self.app_config, self.aws_config)
+        # The backup client is created lazily on first use
+        self.customer_table_info_repo.dynamodb_backup_client = self.mock_dynamodb_backup_client
 
 
     def tearDown(self):
@@ -58,27 +57,56 @@ class TestCustomerTableInfoRepository(unittest.TestCase):
         expected_items = TestUtils.get_file_content(mock_response_path)
         expected_tables = []
         for expected_item in expected_items:
-            expected_table = from_dict(CustomerTableInfo, expected_item)
+            expected_table = DataClassUtils.from_dict(CustomerTableInfo, expected_item)
             expected_tables.append(expected_table)
 
-        self.mock_table.query.return_value = {'Items': expected_items}
+        self.mock_dynamodb_client.query.return_value = {'Items': [DynamoDBUtils.serialize_item(item) for item in expected_items]}
 
         result = self.customer_table_info_repo.get_tables_for_owner(owner_id)
 
-        self.mock_table.query.assert_called_once_with(KeyConditionExpression=Key('owner_id').eq(owner_id))
+        self.mock_dynamodb_client.query.assert_called_once_with(
+            TableName=self.app_config.customer_table_info_table_name,
+            KeyConditionExpression='owner_id = :owner_id',
+            ExpressionAttributeValues={':owner_id': {'S': owner_id}}
+        )
         self.assertEqual(result, expected_tables)
 
 
+    def test_get_tables_for_owner_reads_all_pages(self):
+        """
+        Should continue the query from LastEvaluatedKey and return the tables of all pages.
+        """
+        owner_id = 'owner123'
+        mock_response_path = self.TEST_RESOURCE_PATH + "expected_tables_for_owner_happy_case.json"
+        items = TestUtils.get_file_content(mock_response_path)
+        last_evaluated_key = {'owner_id': {'S': owner_id}, 'table_id': {'S': 'table123'}}
+
+        self.mock_dynamodb_client.query.side_effect = [
+            {'Items': [DynamoDBUtils.serialize_item(item) for item in items], 'LastEvaluatedKey': last_evaluated_key},
+            {'Items': [DynamoDBUtils.serialize_item(item) for item in items]},
+        ]
+
+        result = self.customer_table_info_repo.get_tables_for_owner(owner_id)
+
+        self.assertEqual(self.mock_dynamodb_client.query.call_count, 2)
+        self.assertEqual(self.mock_dynamodb_client.query.call_args.kwargs['ExclusiveStartKey'], last_evaluated_key)
+        self.assertEqual(len(result), 2 * len(items))
+
+
     def test_get_tables_for_owner_should_return_empty_tables(self):
         """
         Should return an empty list when there are no tables for the specified owner_id.
         """
         owner_id = 'owner123'
-        self.mock_table.query.return_value = {'Items': []}
+        self.mock_dynamodb_client.query.return_value = {'Items': []}
 
         result = self.customer_table_info_repo.get_tables_for_owner(owner_id)
 
-        self.mock_table.query.assert_called_once_with(KeyConditionExpression=Key('owner_id').eq(owner_id))
+        self.mock_dynamodb_client.query.assert_called_once_with(
+            TableName=self.app_config.customer_table_info_table_name,
+            KeyConditionExpression='owner_id = :owner_id',
+            ExpressionAttributeValues={':owner_id': {'S': owner_id}}
+        )
         self.assertEqual(result, [])
 
 
@@ -87,7 +115,7 @@ class TestCustomerTableInfoRepository(unittest.TestCase):
         Should propagate ServiceException when DynamoDB throws a ClientError.
         """
         owner_id = 'owner123'
-        self.mock_table.query.side_effect = ClientError(
+        self.mock_dynamodb_client.query.side_effect = ClientError(
             {'Error': {'Message': 'Test Error'}, 'ResponseMetadata': {'HTTPStatusCode': 400}}, 'query')
 
         with self.assertRaises(ServiceException) as context:
@@ -96,7 +124,11 @@ class TestCustomerTableInfoRepository(unittest.TestCase):
         self.assertEqual(context.exception.status_code, 500)
         self.assertEqual(context.exception.status, ServiceStatus.FAILURE)
         self.assertEqual(context.exception.message, 'Failed to retrieve customer tables')
-        self.mock_table.query.assert_called_once_with(KeyConditionExpression=Key('owner_id').eq(owner_id))
+        self.mock_dynamodb_client.query.assert_called_once_with(
+            TableName=self.app_config.customer_table_info_table_name,
+            KeyConditionExpression='owner_id = :owner_id',
+            ExpressionAttributeValues={':owner_id': {'S': owner_id}}
+        )
 
 
     def test_get_table_size_happy_case(self):
@@ -114,6 +146,22 @@ class TestCustomerTableInfoRepository(unittest.TestCase):
         self.assertEqual(result, mock_dynamodb_table_details['Table']['TableSizeBytes'] / 1024)
 
 
+    def test_get_table_size_served_from_cache(self):
+        """
+        Should describe the dynamoDB table only once when its size is requested twice.
+        """
+        table_name = 'originalTable1'
+        mock_dynamodb_table_details_path = self.TEST_RESOURCE_PATH + "expected_dynamodb_table_details_for_first_table_happy_case.json"
+        mock_dynamodb_table_details = TestUtils.get_file_content(mock_dynamodb_table_details_path)
+        self.mock_dynamodb_client.describe_table.return_value = mock_dynamodb_table_details
+
+        first_result = self.customer_table_info_repo.get_table_size(table_name)
+        second_result = self.customer_table_info_repo.get_table_size(table_name)
+
+        self.mock_dynamodb_client.describe_table.assert_called_once_with(TableName=table_name)
+        self.assertEqual(first_result, second_result)
+
+
     def test_get_table_size_with_service_exception(self):
         """
         Should propagate ServiceException when DynamoDB throws a ClientError.
@@ -148,6 +196,26 @@ class TestCustomerTableInfoRepository(unittest.TestCase):
         self.mock_dynamodb_client.describe_table.assert_called_once_with(TableName=table_name)
 
 
+    def test_get_table_sizes_keeps_order_of_table_names(self):
+        """
+        Should return the sizes of the dynamoDB tables in the order of the given table names.
+        """
+        mock_first_dynamodb_table_details_path = self.TEST_RESOURCE_PATH + "expected_dynamodb_table_details_for_first_table_happy_case.json"
+        mock_second_dynamodb_table_details_path = self.TEST_RESOURCE_PATH + "expected_dynamodb_table_details_for_second_table_happy_case.json"
+        mock_dynamodb_table_details = {
+            'originalTable1': TestUtils.get_file_content(mock_first_dynamodb_table_details_path),
+            'originalTable2': TestUtils.get_file_content(mock_second_dynamodb_table_details_path)
+        }
+        self.mock_dynamodb_client.describe_table.side_effect = lambda TableName: mock_dynamodb_table_details[TableName]
+
+        result = self.customer_table_info_repo.get_table_sizes(['originalTable2', 'originalTable1'])
+
+        self.assertEqual(result, [
+            mock_dynamodb_table_details['originalTable2']['Table']['TableSizeBytes'] / 1024,
+            mock_dynamodb_table_details['originalTable1']['Table']['TableSizeBytes'] / 1024
+        ])
+
+
     def test_get_table_item_happy_case(self):
         """
         Test case for retrieving a customer table item successfully.
@@ -163,10 +231,43 @@ class TestCustomerTableInfoRepository(unittest.TestCase):
 
         result = self.customer_table_info_repo.get_table_item(owner_id, table_id)
 
-        self.assertEqual(result, from_dict(CustomerTableInfo, expected_item.get('Item')))
+        self.assertEqual(result, DataClassUtils.from_dict(CustomerTableInfo, expected_item.get('Item')))
         self.mock_table.get_item.assert_called_once_with(Key={'owner_id': owner_id, 'table_id': table_id})
 
 
+    def test_get_table_item_converts_decimal_attributes(self):
+        """
+        Test case for retrieving a customer table item whose numeric attributes are returned as Decimal by DynamoDB.
+
+        Case: The table item contains Decimal capacity units and index counters.
+        Expected Result: The numeric fields of the returned CustomerTableInfo are converted to int and float.
+        """
+        owner_id = 'owner123'
+        table_id = 'table123'
+        self.mock_table.get_item.return_value = {
+            'Item': {
+                'table_id': table_id,
+                'table_name': 'table_name',
+                'original_table_name': 'original_table_name',
+                'owner_id': owner_id,
+                'partition_key': 'id',
+                'total_indexes': Decimal('1'),
+                'read_capacity_units': Decimal('5'),
+                'write_capacity_units': Decimal('10'),
+                'indexes': [{'name': 'index', 'partition_key': 'id', 'size': Decimal('1.5'), 'item_count': Decimal('3')}]
+            }
+        }
+
+        result = self.customer_table_info_repo.get_table_item(owner_id, table_id)
+
+        self.assertEqual(type(result.total_indexes), int)
+        self.assertEqual(type(result.read_capacity_units), int)
+        self.assertEqual(result.write_capacity_units, 10)
+        self.assertEqual(type(result.indexes[0].size), float)
+        self.assertEqual(result.indexes[0].size, 1.5)
+        self.assertEqual(type(result.indexes[0].item_count), int)
+
+
     def test_get_table_item_throws_service_exception_when_no_item_found(self):
         """
         Test case for retrieving a customer table item that does not exist.
@@ -235,7 +336,7 @@ class TestCustomerTableInfoRepository(unittest.TestCase):
             ExpressionAttributeValues={':desc': Customer_table_info.description},
             ReturnValues='ALL_NEW'
         )
-        self.assertEqual(result, from_dict(CustomerTableInfo, expected_item.get('Attributes')))
+        self.assertEqual(result, DataClassUtils.from_dict(CustomerTableInfo, expected_item.get('Attributes')))
 
 
     def test_update_table_with_client_error(self):
@@ -377,3 +478,23 @@ class TestCustomerTableInfoRepository(unittest.TestCase):
         self.assertEqual(context.exception.status, ServiceStatus.FAILURE)
         self.assertEqual(context.exception.message, 'Failed to retrieve backup jobs of customer table')
         self.mock_dynamodb_backup_client.list_backup_jobs.assert_called_once_with(ByResourceArn=table_arn)
+
+
+    def test_backup_client_is_created_on_first_use(self):
+        """
+        Should create the backup client only when it is first used, and only once.
+        """
+        Singleton.clear_instance(CustomerTableInfoRepository)
+        with patch('repository.customer_table_info_repository.CustomerTableInfoRepository._CustomerTableInfoRepository__configure_dynamodb_resource'), \
+             patch('repository.customer_table_info_repository.CustomerTableInfoRepository._CustomerTableInfoRepository__configure_dynamodb_client'), \
+             patch('repository.customer_table_info_repository.CustomerTableInfoRepository._CustomerTableInfoRepository__configure_table'), \
+             patch('repository.customer_table_info_repository.CustomerTableInfoRepository._CustomerTableInfoRepository__configure_backup_client') as mock_configure_backup_client:
+
+            customer_table_info_repo = CustomerTableInfoRepository(self.app_config, self.aws_config)
+            mock_configure_backup_client.assert_not_called()
+
+            first_client = customer_table_info_repo.dynamodb_backup_client
+            second_client = customer_table_info_repo.dynamodb_backup_client
+
+        mock_configure_backup_client.assert_called_once()
+        self.assertIs(first_client, second_client)
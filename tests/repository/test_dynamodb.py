@@ -0,0 +1,78 @@
+import contextvars
+import unittest
+from unittest.mock import patch
+
+from repository import _dynamodb
+
+
+class TestDynamoDB(unittest.TestCase):
+
+
+    def setUp(self):
+        _dynamodb.get_resource.cache_clear()
+        _dynamodb.get_table.cache_clear()
+
+
+    def tearDown(self):
+        _dynamodb.get_resource.cache_clear()
+        _dynamodb.get_table.cache_clear()
+
+
+    @patch('repository._dynamodb.boto3.resource')
+    def test_get_resource_is_created_once_per_region(self, mock_resource):
+        first_resource = _dynamodb.get_resource('eu-central-1', False)
+        second_resource = _dynamodb.get_resource('eu-central-1', False)
+
+        self.assertIs(first_resource, second_resource)
+        mock_resource.assert_called_once()
+
+
+    @patch('repository._dynamodb.boto3.resource')
+    def test_get_resource_local_uses_local_endpoint(self, mock_resource):
+        _dynamodb.get_resource('eu-central-1', True)
+
+        mock_resource.assert_called_once_with('dynamodb', region_name='eu-central-1', endpoint_url='http://localhost:8000')
+
+
+    @patch('repository._dynamodb.boto3.resource')
+    def test_get_table_shares_table_and_resource(self, mock_resource):
+        first_table = _dynamodb.get_table('eu-central-1', False, 'TEST_TABLE')
+        second_table = _dynamodb.get_table('eu-central-1', False, 'TEST_TABLE')
+        _dynamodb.get_table('eu-central-1', False, 'OTHER_TABLE')
+
+        self.assertIs(first_table, second_table)
+        mock_resource.assert_called_once()
+        self.assertEqual(mock_resource.return_value.Table.call_count, 2)
+
+
+    @patch('repository._dynamodb.boto3.resource')
+    def test_get_client_uses_shared_resource_client(self, mock_resource):
+        client = _dynamodb.get_client('eu-central-1', False)
+
+        self.assertIs(client, mock_resource.return_value.meta.client)
+        mock_resource.assert_called_once()
+
+
+    def test_map_concurrently_keeps_order_of_values(self):
+        result = _dynamodb.map_concurrently(lambda value: value * 2, [3, 1, 2])
+
+        self.assertEqual(result, [6, 2, 4])
+
+
+    def test_map_concurrently_runs_in_caller_context(self):
+        request_id = contextvars.ContextVar('request_id')
+        request_id.set('TEST_REQUEST_ID')
+
+        result = _dynamodb.map_concurrently(lambda value: request_id.get(), [1, 2])
+
+        self.assertEqual(result, ['TEST_REQUEST_ID', 'TEST_REQUEST_ID'])
+
+
+    def test_map_concurrently_raises_exception_of_a_call(self):
+        def fail_on_two(value):
+            if value == 2:
+                raise ValueError('Test Error')
+            return value
+
+        with self.assertRaises(ValueError):
+            _dynamodb.map_concurrently(fail_on_two, [1, 2, 3])
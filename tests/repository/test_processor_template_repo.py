@@ -47,6 +47,22 @@ class TestProcessTemplateRepo(unittest.TestCase):
         self.mock_table.scan.assert_called_once()
 
 
+    def test_get_all_templates_without_input_and_output_should_default_to_none(self):
+        # A stored template may omit the optional input and output descriptions
+        item = TestUtils.get_file_content(self.test_resource_path + 'event_processor_template.json')
+        item.pop('input', None)
+        item.pop('output', None)
+        self.mock_table.scan.return_value = {'Items': [item]}
+
+        # Call the method
+        templates = self.repo.get_all_templates()
+
+        # Assertions
+        self.assertEqual(len(templates), 1)
+        self.assertIsNone(templates[0].input)
+        self.assertIsNone(templates[0].output)
+
+
     def test_get_all_templates_empty_database_should_return_empty_list(self):
         # Mock empty response from DynamoDB
         self.mock_table.scan.return_value = {'Items': []}
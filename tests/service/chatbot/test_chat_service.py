@@ -247,12 +247,12 @@ class TestChatService(unittest.TestCase):
         )
 
 
-    @patch('nanoid.generate')
-    def test_save_chat_session_success_case(self, mock_nanoid):
+    @patch('secrets.token_urlsafe')
+    def test_save_chat_session_success_case(self, mock_token_urlsafe):
         """
         Test case for saving a new chat session.
         """
-        mock_nanoid.return_value = self.TEST_CHAT_ID
+        mock_token_urlsafe.return_value = self.TEST_CHAT_ID
         # Mock the repository method
         self.chat_service.chat_repository.create_new_chat = MagicMock()
 
@@ -281,13 +281,13 @@ class TestChatService(unittest.TestCase):
         self.chat_service.chat_repository.create_new_chat.assert_called_with(item=expected_chat) 
 
 
-    @patch('nanoid.generate')
-    def test_save_chat_session_should_raise_exception_when_repository_call_fails(self, mock_nanoid): 
+    @patch('secrets.token_urlsafe')
+    def test_save_chat_session_should_raise_exception_when_repository_call_fails(self, mock_token_urlsafe): 
         """
         Test case for handling failure in the repository layer.
         Expected Result: ServiceException is raised.
         """
-        mock_nanoid.return_value = self.TEST_CHAT_ID
+        mock_token_urlsafe.return_value = self.TEST_CHAT_ID
         chat_id = self.TEST_CHAT_ID
         mock_create_new_chat = self.chat_service.chat_repository.create_new_chat = MagicMock()
         mock_create_new_chat.side_effect = ServiceException(
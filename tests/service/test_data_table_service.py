@@ -2,8 +2,7 @@ import unittest
 import json
 from unittest.mock import MagicMock, Mock, patch, call
 from botocore.exceptions import ClientError
-from boto3.dynamodb.conditions import Key, Attr
-from dacite import from_dict
+from boto3.dynamodb.conditions import Attr
 from datetime import datetime
 
 from tests.test_utils import TestUtils
@@ -13,7 +12,7 @@ from repository.customer_table_repository import CustomerTableRepository
 from service.data_table_service import DataTableService
 from exception import ServiceException
 from enums import ServiceStatus
-from utils import Singleton
+from utils import Singleton, DataClassUtils, DynamoDBUtils
 
 class TestDataTableService(unittest.TestCase):
 
@@ -32,19 +31,18 @@ class TestDataTableService(unittest.TestCase):
         Singleton.clear_instance(CustomerTableInfoRepository)
         with patch('repository.customer_table_info_repository.CustomerTableInfoRepository._CustomerTableInfoRepository__configure_dynamodb_resource') as mock_configure_resource, \
              patch('repository.customer_table_info_repository.CustomerTableInfoRepository._CustomerTableInfoRepository__configure_dynamodb_client') as mock_configure_client, \
-             patch('repository.customer_table_info_repository.CustomerTableInfoRepository._CustomerTableInfoRepository__configure_backup_client') as mock_configure_backup_client, \
              patch('repository.customer_table_info_repository.CustomerTableInfoRepository._CustomerTableInfoRepository__configure_table') as mock_configure_table:
 
             self.mock_configure_resource = mock_configure_resource
             self.mock_configure_client = mock_configure_client
-            self.mock_configure_backup_client = mock_configure_backup_client
             self.mock_configure_table = mock_configure_table
 
             self.mock_configure_resource.return_value = self.mock_dynamodb_resource
             self.mock_configure_client.return_value = self.mock_dynamodb_client
-            self.mock_configure_backup_client.return_value= self.mock_dynamodb_backup_client
             self.mock_configure_table.return_value = self.mock_table
             self.customer_table_info_repo = CustomerTableInfoRepository(self.app_config, self.aws_config)
+        # The backup client is created lazily on first use
+        self.customer_table_info_repo.dynamodb_backup_client = self.mock_dynamodb_backup_client
 
         Singleton.clear_instance(CustomerTableRepository)
         with patch('repository.customer_table_repository.CustomerTableRepository._CustomerTableRepository__configure_dynamodb_resource') as mock_customer_table_configure_resource:
@@ -71,24 +69,30 @@ class TestDataTableService(unittest.TestCase):
         owner_id = 'owner123'
         mock_tables_response_path = self.TEST_RESOURCE_PATH + "expected_tables_for_owner_happy_case.json"
         tables = TestUtils.get_file_content(mock_tables_response_path)
-        self.customer_table_info_repo.table.query = MagicMock(return_value={'Items': tables})
+        self.customer_table_info_repo.dynamodb_client.query = MagicMock(return_value={'Items': [DynamoDBUtils.serialize_item(table) for table in tables]})
 
         mock_first_dynamodb_table_details_response_path = self.TEST_RESOURCE_PATH + "expected_dynamodb_table_details_for_first_table_happy_case.json"
         mock_first_dynamodb_table_details = TestUtils.get_file_content(mock_first_dynamodb_table_details_response_path)
         mock_second_dynamodb_table_details_response_path = self.TEST_RESOURCE_PATH + "expected_dynamodb_table_details_for_second_table_happy_case.json"
         mock_second_dynamodb_table_details = TestUtils.get_file_content(mock_second_dynamodb_table_details_response_path)
-        self.customer_table_info_repo.dynamodb_client.describe_table = MagicMock(side_effect=[
-            mock_first_dynamodb_table_details,
-            mock_second_dynamodb_table_details
-        ])
+        # The tables are described concurrently, so the details are looked up by table name
+        mock_dynamodb_table_details = {
+            'OriginalTable1': mock_first_dynamodb_table_details,
+            'OriginalTable2': mock_second_dynamodb_table_details
+        }
+        self.customer_table_info_repo.dynamodb_client.describe_table = MagicMock(side_effect=lambda TableName: mock_dynamodb_table_details[TableName])
 
         result = self.data_table_service.list_tables(owner_id)
 
-        self.customer_table_info_repo.table.query.assert_called_once_with(KeyConditionExpression=Key('owner_id').eq(owner_id))
+        self.customer_table_info_repo.dynamodb_client.query.assert_called_once_with(
+            TableName=self.app_config.customer_table_info_table_name,
+            KeyConditionExpression='owner_id = :owner_id',
+            ExpressionAttributeValues={':owner_id': {'S': owner_id}}
+        )
         self.customer_table_info_repo.dynamodb_client.describe_table.assert_has_calls([
             call(TableName='OriginalTable1'),
             call(TableName='OriginalTable2')
-        ], any_order=False)
+        ], any_order=True)
 
         self.assertEqual(len(result), 2)
         self.assertEqual(result[0].name, 'Table1')
@@ -104,11 +108,15 @@ class TestDataTableService(unittest.TestCase):
         Should return an empty list when there are no tables for the specified owner_id.
         """
         owner_id = 'owner123'
-        self.customer_table_info_repo.table.query = MagicMock(return_value={'Items': []})
+        self.customer_table_info_repo.dynamodb_client.query = MagicMock(return_value={'Items': []})
 
         result = self.data_table_service.list_tables(owner_id)
 
-        self.customer_table_info_repo.table.query.assert_called_once_with(KeyConditionExpression=Key('owner_id').eq(owner_id))
+        self.customer_table_info_repo.dynamodb_client.query.assert_called_once_with(
+            TableName=self.app_config.customer_table_info_table_name,
+            KeyConditionExpression='owner_id = :owner_id',
+            ExpressionAttributeValues={':owner_id': {'S': owner_id}}
+        )
         self.assertEqual(len(result), 0)
 
 
@@ -119,24 +127,30 @@ class TestDataTableService(unittest.TestCase):
         owner_id = 'owner123'
         mock_tables_response_path = self.TEST_RESOURCE_PATH + "expected_tables_for_owner_happy_case.json"
         tables = TestUtils.get_file_content(mock_tables_response_path)
-        self.customer_table_info_repo.table.query = MagicMock(return_value={'Items': tables})
+        self.customer_table_info_repo.dynamodb_client.query = MagicMock(return_value={'Items': [DynamoDBUtils.serialize_item(table) for table in tables]})
 
         mock_first_dynamodb_table_details_response_path = self.TEST_RESOURCE_PATH + "expected_dynamodb_table_details_for_first_table_with_size_zero.json"
         mock_first_dynamodb_table_details = TestUtils.get_file_content(mock_first_dynamodb_table_details_response_path)
         mock_second_dynamodb_table_details_response_path = self.TEST_RESOURCE_PATH + "expected_dynamodb_table_details_for_second_table_with_size_zero.json"
         mock_second_dynamodb_table_details = TestUtils.get_file_content(mock_second_dynamodb_table_details_response_path)
-        self.customer_table_info_repo.dynamodb_client.describe_table = MagicMock(side_effect=[
-            mock_first_dynamodb_table_details,
-            mock_second_dynamodb_table_details
-        ])
+        # The tables are described concurrently, so the details are looked up by table name
+        mock_dynamodb_table_details = {
+            'OriginalTable1': mock_first_dynamodb_table_details,
+            'OriginalTable2': mock_second_dynamodb_table_details
+        }
+        self.customer_table_info_repo.dynamodb_client.describe_table = MagicMock(side_effect=lambda TableName: mock_dynamodb_table_details[TableName])
 
         result = self.data_table_service.list_tables(owner_id)
 
-        self.customer_table_info_repo.table.query.assert_called_once_with(KeyConditionExpression=Key('owner_id').eq(owner_id))
+        self.customer_table_info_repo.dynamodb_client.query.assert_called_once_with(
+            TableName=self.app_config.customer_table_info_table_name,
+            KeyConditionExpression='owner_id = :owner_id',
+            ExpressionAttributeValues={':owner_id': {'S': owner_id}}
+        )
         self.customer_table_info_repo.dynamodb_client.describe_table.assert_has_calls([
             call(TableName='OriginalTable1'),
             call(TableName='OriginalTable2')
-        ], any_order=False)
+        ], any_order=True)
 
         self.assertEqual(len(result), 2)
         self.assertEqual(result[0].name, 'Table1')
@@ -153,7 +167,7 @@ class TestDataTableService(unittest.TestCase):
         The failure could be as ClientError from dynamo DB or when the owner id has value as None etc.
         """
         owner_id = 'owner123'
-        self.customer_table_info_repo.table.query = MagicMock(side_effect=ServiceException(500, ServiceStatus.FAILURE.value, 'Some error'))
+        self.customer_table_info_repo.dynamodb_client.query = MagicMock(side_effect=ServiceException(500, ServiceStatus.FAILURE.value, 'Some error'))
 
         with self.assertRaises(ServiceException) as context:
             self.data_table_service.list_tables(owner_id)
@@ -161,7 +175,11 @@ class TestDataTableService(unittest.TestCase):
         self.assertEqual(context.exception.status_code, 500)
         self.assertEqual(context.exception.status, ServiceStatus.FAILURE.value)
         self.assertEqual(context.exception.message, 'Some error')
-        self.customer_table_info_repo.table.query.assert_called_once_with(KeyConditionExpression=Key('owner_id').eq(owner_id))
+        self.customer_table_info_repo.dynamodb_client.query.assert_called_once_with(
+            TableName=self.app_config.customer_table_info_table_name,
+            KeyConditionExpression='owner_id = :owner_id',
+            ExpressionAttributeValues={':owner_id': {'S': owner_id}}
+        )
         self.customer_table_info_repo.dynamodb_client.describe_table.assert_not_called()
 
 
@@ -173,7 +191,7 @@ class TestDataTableService(unittest.TestCase):
         owner_id = 'owner123'
         mock_tables_response_path = self.TEST_RESOURCE_PATH + "expected_tables_for_owner_happy_case.json"
         tables = TestUtils.get_file_content(mock_tables_response_path)
-        self.customer_table_info_repo.table.query = MagicMock(return_value={'Items': tables})
+        self.customer_table_info_repo.dynamodb_client.query = MagicMock(return_value={'Items': [DynamoDBUtils.serialize_item(table) for table in tables]})
 
         # Mock describe_table to throw a ClientError
         self.customer_table_info_repo.dynamodb_client.describe_table = MagicMock(side_effect=ClientError({'Error': {'Message': 'Test Error'}, 'ResponseMetadata': {'HTTPStatusCode': 400}}, 'describe_table'))
@@ -184,8 +202,15 @@ class TestDataTableService(unittest.TestCase):
         self.assertEqual(context.exception.status_code, 500)
         self.assertEqual(context.exception.status, ServiceStatus.FAILURE)
         self.assertEqual(context.exception.message, 'Failed to retrieve size of customer table')
-        self.customer_table_info_repo.table.query.assert_called_once_with(KeyConditionExpression=Key('owner_id').eq(owner_id))
-        self.customer_table_info_repo.dynamodb_client.describe_table.assert_called_once_with(TableName='OriginalTable1')
+        self.customer_table_info_repo.dynamodb_client.query.assert_called_once_with(
+            TableName=self.app_config.customer_table_info_table_name,
+            KeyConditionExpression='owner_id = :owner_id',
+            ExpressionAttributeValues={':owner_id': {'S': owner_id}}
+        )
+        self.customer_table_info_repo.dynamodb_client.describe_table.assert_has_calls([
+            call(TableName='OriginalTable1'),
+            call(TableName='OriginalTable2')
+        ], any_order=True)
 
 
     def test_update_table_happy_case(self):
@@ -204,7 +229,7 @@ class TestDataTableService(unittest.TestCase):
 
         mock_updated_customer_table_info_path = self.TEST_RESOURCE_PATH + "updated_customer_table_item_happy_case.json"
         updated_customer_table_info = TestUtils.get_file_content(mock_updated_customer_table_info_path)
-        expected_customer_table_info = from_dict(CustomerTableInfo, updated_customer_table_info.get('Attributes'))
+        expected_customer_table_info = DataClassUtils.from_dict(CustomerTableInfo, updated_customer_table_info.get('Attributes'))
 
         mock_dynamoDB_table_details_response_path = self.TEST_RESOURCE_PATH + "expected_dynamodb_table_details_for_first_table_happy_case.json"
         mock_dynamoDB_table_details = TestUtils.get_file_content(mock_dynamoDB_table_details_response_path)
@@ -380,7 +405,7 @@ class TestDataTableService(unittest.TestCase):
             mock_dynamoDB_table_details
         ])
 
-        expected_expected_customer_table_info = from_dict(CustomerTableInfo, customer_table_info_item.get('Item'))
+        expected_expected_customer_table_info = DataClassUtils.from_dict(CustomerTableInfo, customer_table_info_item.get('Item'))
         for index in expected_expected_customer_table_info.indexes:
             # table size equals index size
             index.size = mock_dynamoDB_table_details['Table']['TableSizeBytes'] / 1024
@@ -413,7 +438,7 @@ class TestDataTableService(unittest.TestCase):
             mock_dynamoDB_table_details
         ])
 
-        expected_expected_customer_table_info = from_dict(CustomerTableInfo, customer_table_info_item.get('Item'))
+        expected_expected_customer_table_info = DataClassUtils.from_dict(CustomerTableInfo, customer_table_info_item.get('Item'))
         for index in expected_expected_customer_table_info.indexes:
             # table size equals index size
             index.size = mock_dynamoDB_table_details['Table']['TableSizeBytes'] / 1024
@@ -715,7 +740,7 @@ class TestDataTableService(unittest.TestCase):
         mock_table_items_path = self.TEST_RESOURCE_PATH + "get_table_items_happy_case.json"
         table_content_items = TestUtils.get_file_content(mock_table_items_path)
 
-        self.customer_table_info_repo.get_table_item = MagicMock(return_value=from_dict(CustomerTableInfo, customer_table_info_item))
+        self.customer_table_info_repo.get_table_item = MagicMock(return_value=DataClassUtils.from_dict(CustomerTableInfo, customer_table_info_item))
         self.customer_table_repo.get_table_items = MagicMock(return_value=(table_content_items, None))
 
         result = self.data_table_service.get_table_items(owner_id, table_id, size, last_evaluated_key)
@@ -750,7 +775,7 @@ class TestDataTableService(unittest.TestCase):
         mock_table_content_items_path = self.TEST_RESOURCE_PATH + "get_table_items_happy_case.json"
         table_content_items = TestUtils.get_file_content(mock_table_content_items_path)
 
-        self.customer_table_info_repo.get_table_item = MagicMock(return_value=from_dict(CustomerTableInfo, customer_table_info_item))
+        self.customer_table_info_repo.get_table_item = MagicMock(return_value=DataClassUtils.from_dict(CustomerTableInfo, customer_table_info_item))
         self.customer_table_repo.get_table_items = MagicMock(return_value=(table_content_items, {"next_key": "next_value"}))
 
         result = self.data_table_service.get_table_items(owner_id, table_id, size, last_evaluated_key)
@@ -810,7 +835,7 @@ class TestDataTableService(unittest.TestCase):
         customer_table_info_item = TestUtils.get_file_content(mock_customer_table_info_item_path)
         customer_table_info_item = customer_table_info_item.get("Item", {})
 
-        self.customer_table_info_repo.get_table_item = MagicMock(return_value=from_dict(CustomerTableInfo, customer_table_info_item))
+        self.customer_table_info_repo.get_table_item = MagicMock(return_value=DataClassUtils.from_dict(CustomerTableInfo, customer_table_info_item))
 
         mock_dynamodb_resource_table = MagicMock()
         self.customer_table_repo.dynamodb_resource.Table.return_value = mock_dynamodb_resource_table
@@ -842,7 +867,7 @@ class TestDataTableService(unittest.TestCase):
         mock_customer_table_info_item_path = self.TEST_RESOURCE_PATH + "get_customer_table_item_happy_case.json"
         customer_table_info_item = TestUtils.get_file_content(mock_customer_table_info_item_path)
         customer_table_info_item = customer_table_info_item.get("Item", {})
-        self.customer_table_info_repo.get_table_item = MagicMock(return_value=from_dict(CustomerTableInfo, customer_table_info_item))
+        self.customer_table_info_repo.get_table_item = MagicMock(return_value=DataClassUtils.from_dict(CustomerTableInfo, customer_table_info_item))
         
         # Mock the create_item response
         self.customer_table_repo.create_item = MagicMock(return_value=item)
@@ -903,7 +928,7 @@ class TestDataTableService(unittest.TestCase):
         mock_customer_table_info_item_path = self.TEST_RESOURCE_PATH + "get_customer_table_item_happy_case.json"
         customer_table_info_item = TestUtils.get_file_content(mock_customer_table_info_item_path)
         customer_table_info_item = customer_table_info_item.get("Item", {})
-        self.customer_table_info_repo.get_table_item = MagicMock(return_value=from_dict(CustomerTableInfo, customer_table_info_item))
+        self.customer_table_info_repo.get_table_item = MagicMock(return_value=DataClassUtils.from_dict(CustomerTableInfo, customer_table_info_item))
 
         with self.assertRaises(ServiceException) as context:
             self.data_table_service.create_item(owner_id, table_id, item)
@@ -932,7 +957,7 @@ class TestDataTableService(unittest.TestCase):
         mock_customer_table_info_item_path = self.TEST_RESOURCE_PATH + "get_customer_table_item_happy_case.json"
         customer_table_info_item = TestUtils.get_file_content(mock_customer_table_info_item_path)
         customer_table_info_item = customer_table_info_item.get("Item", {})
-        self.customer_table_info_repo.get_table_item = MagicMock(return_value=from_dict(CustomerTableInfo, customer_table_info_item))
+        self.customer_table_info_repo.get_table_item = MagicMock(return_value=DataClassUtils.from_dict(CustomerTableInfo, customer_table_info_item))
 
         with self.assertRaises(ServiceException) as context:
             self.data_table_service.create_item(owner_id, table_id, item)
@@ -988,7 +1013,7 @@ class TestDataTableService(unittest.TestCase):
         customer_table_info_item = TestUtils.get_file_content(mock_customer_table_info_item_path)
         customer_table_info_item = customer_table_info_item.get("Item", {})
         customer_table_info_item['sort_key'] = None
-        self.customer_table_info_repo.get_table_item = MagicMock(return_value=from_dict(CustomerTableInfo, customer_table_info_item))
+        self.customer_table_info_repo.get_table_item = MagicMock(return_value=DataClassUtils.from_dict(CustomerTableInfo, customer_table_info_item))
 
         # Mock the delete_item method to not raise any exception
         self.customer_table_repo.delete_item = MagicMock(return_value=None)
@@ -1020,7 +1045,7 @@ class TestDataTableService(unittest.TestCase):
         mock_customer_table_info_item_path = self.TEST_RESOURCE_PATH + "get_customer_table_item_happy_case.json"
         customer_table_info_item = TestUtils.get_file_content(mock_customer_table_info_item_path)
         customer_table_info_item = customer_table_info_item.get("Item", {})
-        self.customer_table_info_repo.get_table_item = MagicMock(return_value=from_dict(CustomerTableInfo, customer_table_info_item))
+        self.customer_table_info_repo.get_table_item = MagicMock(return_value=DataClassUtils.from_dict(CustomerTableInfo, customer_table_info_item))
 
         # Mock the delete_item method to not raise any exception
         self.customer_table_repo.delete_item = MagicMock(return_value=None)
@@ -1074,7 +1099,7 @@ class TestDataTableService(unittest.TestCase):
         mock_customer_table_info_item_path = self.TEST_RESOURCE_PATH + "get_customer_table_item_happy_case.json"
         customer_table_info_item = TestUtils.get_file_content(mock_customer_table_info_item_path)
         customer_table_info_item = customer_table_info_item.get("Item", {})
-        self.customer_table_info_repo.get_table_item = MagicMock(return_value=from_dict(CustomerTableInfo, customer_table_info_item))
+        self.customer_table_info_repo.get_table_item = MagicMock(return_value=DataClassUtils.from_dict(CustomerTableInfo, customer_table_info_item))
 
         with self.assertRaises(ServiceException) as context:
             self.data_table_service.delete_item(owner_id, table_id, partition_key_value)
@@ -1101,7 +1126,7 @@ class TestDataTableService(unittest.TestCase):
         customer_table_info_item = TestUtils.get_file_content(mock_customer_table_info_item_path)
         customer_table_info_item = customer_table_info_item.get("Item", {})
         customer_table_info_item['sort_key'] = None
-        self.customer_table_info_repo.get_table_item = MagicMock(return_value=from_dict(CustomerTableInfo, customer_table_info_item))
+        self.customer_table_info_repo.get_table_item = MagicMock(return_value=DataClassUtils.from_dict(CustomerTableInfo, customer_table_info_item))
 
         # Mock the delete_item method to raise a ServiceException
         self.customer_table_repo.delete_item =  MagicMock(side_effect=ServiceException(500, ServiceStatus.FAILURE, 'Failed to delete item from table'))
@@ -1135,7 +1160,7 @@ class TestDataTableService(unittest.TestCase):
         customer_table_info_item = TestUtils.get_file_content(mock_customer_table_info_item_path)
         customer_table_info_item = customer_table_info_item.get("Item", {})
         customer_table_info_item['sort_key'] = None
-        self.customer_table_info_repo.get_table_item = MagicMock(return_value=from_dict(CustomerTableInfo, customer_table_info_item))
+        self.customer_table_info_repo.get_table_item = MagicMock(return_value=DataClassUtils.from_dict(CustomerTableInfo, customer_table_info_item))
 
         # Mock the query_item method response
         mock_items = [{'partition_key': partition_key_value, 'data': 'value1'}]
@@ -1171,7 +1196,7 @@ class TestDataTableService(unittest.TestCase):
         mock_customer_table_info_item_path = self.TEST_RESOURCE_PATH + "get_customer_table_item_happy_case.json"
         customer_table_info_item = TestUtils.get_file_content(mock_customer_table_info_item_path)
         customer_table_info_item = customer_table_info_item.get("Item", {})
-        self.customer_table_info_repo.get_table_item = MagicMock(return_value=from_dict(CustomerTableInfo, customer_table_info_item))
+        self.customer_table_info_repo.get_table_item = MagicMock(return_value=DataClassUtils.from_dict(CustomerTableInfo, customer_table_info_item))
 
         # Mock the query_item method response
         mock_items = [{'partition_key': partition_key_value, 'sort_key': sort_key_value, 'data': 'value1'}]
@@ -1208,7 +1233,7 @@ class TestDataTableService(unittest.TestCase):
         mock_customer_table_info_item_path = self.TEST_RESOURCE_PATH + "get_customer_table_item_happy_case.json"
         customer_table_info_item = TestUtils.get_file_content(mock_customer_table_info_item_path)
         customer_table_info_item = customer_table_info_item.get("Item", {})
-        self.customer_table_info_repo.get_table_item = MagicMock(return_value=from_dict(CustomerTableInfo, customer_table_info_item))
+        self.customer_table_info_repo.get_table_item = MagicMock(return_value=DataClassUtils.from_dict(CustomerTableInfo, customer_table_info_item))
 
         # Mock the query_item method response
         mock_items = [{'partition_key': partition_key_value, 'sort_key': sort_key_value, 'status': 'active', 'data': 'value1'}]
@@ -1243,7 +1268,7 @@ class TestDataTableService(unittest.TestCase):
         mock_customer_table_info_item_path = self.TEST_RESOURCE_PATH + "get_customer_table_item_happy_case.json"
         customer_table_info_item = TestUtils.get_file_content(mock_customer_table_info_item_path)
         customer_table_info_item = customer_table_info_item.get("Item", {})
-        self.customer_table_info_repo.get_table_item = MagicMock(return_value=from_dict(CustomerTableInfo, customer_table_info_item))
+        self.customer_table_info_repo.get_table_item = MagicMock(return_value=DataClassUtils.from_dict(CustomerTableInfo, customer_table_info_item))
 
         # Mock the query_item method to return no items
         self.customer_table_repo.query_item = MagicMock(return_value=[])
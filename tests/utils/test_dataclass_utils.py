@@ -0,0 +1,156 @@
+import unittest
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Optional
+
+from utils import DataClassUtils
+
+
+@dataclass(slots=True)
+class Child:
+    name: str
+    count: int = 0
+
+
+@dataclass(slots=True)
+class Parent:
+    parent_id: str = field(metadata={'alias': 'parentId'})
+    status: str = field(default='ACTIVE', metadata={'intern': True})
+    size: float = field(default=0)
+    description: Optional[str] = None
+    note: str | None = field(default='NOTE')
+    optional_without_default: str | None = field(default=None)
+    children: list[Child] = field(default_factory=list)
+    child_tuple: tuple[Child, ...] = field(default=())
+    children_by_name: dict[str, Child] = field(default_factory=dict)
+    favourite_child: Optional[Child] = None
+
+
+@dataclass(slots=True)
+class OptionalWithoutDefault:
+    name: str
+    description: Optional[str]
+    child: Child | None
+
+
+@dataclass(slots=True)
+class TreeNode:
+    name: str
+    children: list['TreeNode'] = field(default_factory=list)
+
+
+@dataclass(slots=True, kw_only=True)
+class KeywordOnly:
+    first: str
+    second: int = 1
+
+
+class TestDataClassUtils(unittest.TestCase):
+
+
+    def test_from_dict_reads_aliased_key(self):
+        parent = DataClassUtils.from_dict(Parent, {'parentId': 'TEST_PARENT_ID'})
+
+        self.assertEqual(parent.parent_id, 'TEST_PARENT_ID')
+
+
+    def test_from_dict_interns_marked_fields(self):
+        first_parent = DataClassUtils.from_dict(Parent, {'parentId': 'A', 'status': ''.join(['ARCH', 'IVED'])})
+        second_parent = DataClassUtils.from_dict(Parent, {'parentId': 'B', 'status': ''.join(['ARCH', 'IVED'])})
+
+        self.assertIs(first_parent.status, second_parent.status)
+
+
+    def test_from_dict_uses_defaults_and_factories_for_missing_keys(self):
+        first_parent = DataClassUtils.from_dict(Parent, {'parentId': 'A'})
+        second_parent = DataClassUtils.from_dict(Parent, {'parentId': 'B'})
+
+        self.assertEqual(first_parent.status, 'ACTIVE')
+        self.assertEqual(first_parent.note, 'NOTE')
+        self.assertEqual(first_parent.children, [])
+        self.assertIsNot(first_parent.children, second_parent.children)
+
+
+    def test_from_dict_sets_missing_optional_field_without_default_to_none(self):
+        instance = DataClassUtils.from_dict(OptionalWithoutDefault, {'name': 'TEST_NAME'})
+
+        self.assertEqual(instance, OptionalWithoutDefault(name='TEST_NAME', description=None, child=None))
+
+
+    def test_from_dict_raises_key_error_for_missing_required_field(self):
+        with self.assertRaises(KeyError):
+            DataClassUtils.from_dict(OptionalWithoutDefault, {'description': 'TEST_DESCRIPTION'})
+
+
+    def test_from_dict_builds_nested_list_tuple_and_dict(self):
+        parent = DataClassUtils.from_dict(Parent, {
+            'parentId': 'A',
+            'children': [{'name': 'first'}],
+            'child_tuple': [{'name': 'second'}],
+            'children_by_name': {'third': {'name': 'third', 'count': 3}},
+            'favourite_child': {'name': 'fourth'},
+        })
+
+        self.assertEqual(parent.children, [Child(name='first')])
+        self.assertEqual(parent.child_tuple, (Child(name='second'),))
+        self.assertEqual(parent.children_by_name, {'third': Child(name='third', count=3)})
+        self.assertEqual(parent.favourite_child, Child(name='fourth'))
+
+
+    def test_from_dict_keeps_none_for_optional_nested_dataclass(self):
+        parent = DataClassUtils.from_dict(Parent, {'parentId': 'A', 'favourite_child': None})
+
+        self.assertIsNone(parent.favourite_child)
+
+
+    def test_from_dict_builds_recursive_dataclass(self):
+        tree = DataClassUtils.from_dict(TreeNode, {'name': 'root', 'children': [{'name': 'leaf', 'children': []}]})
+
+        self.assertEqual(tree, TreeNode(name='root', children=[TreeNode(name='leaf')]))
+
+
+    def test_from_dict_converts_decimals(self):
+        parent = DataClassUtils.from_dict(Parent, {'parentId': 'A', 'size': Decimal('1.5'), 'children': [{'name': 'first', 'count': Decimal('2')}]})
+
+        self.assertIs(type(parent.size), float)
+        self.assertEqual(parent.size, 1.5)
+        self.assertIs(type(parent.children[0].count), int)
+        self.assertEqual(parent.children[0].count, 2)
+
+
+    def test_from_dict_rejects_fractional_decimal_for_int_field(self):
+        with self.assertRaises(ValueError):
+            DataClassUtils.from_dict(Child, {'name': 'first', 'count': Decimal('1.7')})
+
+
+    def test_from_dict_passes_keyword_only_fields(self):
+        instance = DataClassUtils.from_dict(KeywordOnly, {'first': 'TEST_FIRST'})
+
+        self.assertEqual(instance, KeywordOnly(first='TEST_FIRST', second=1))
+
+
+    def test_get_builder_returns_cached_builder(self):
+        self.assertIs(DataClassUtils.get_builder(Child), DataClassUtils.get_builder(Child))
+
+
+    def test_to_dict_converts_nested_dataclasses(self):
+        parent = Parent(parent_id='A', children=[Child(name='first')], child_tuple=(Child(name='second'),), favourite_child=None)
+
+        result = DataClassUtils.to_dict(parent)
+
+        self.assertEqual(result['parent_id'], 'A')
+        self.assertEqual(result['children'], [{'name': 'first', 'count': 0}])
+        self.assertEqual(result['child_tuple'], ({'name': 'second', 'count': 0},))
+        self.assertIsNone(result['favourite_child'])
+
+
+    def test_to_dict_does_not_copy_plain_values(self):
+        parameters = {'key': 'value'}
+
+        @dataclass
+        class WithParameters:
+            parameters: dict
+
+        result = DataClassUtils.to_dict(WithParameters(parameters=parameters))
+
+        self.assertIs(result['parameters'], parameters)
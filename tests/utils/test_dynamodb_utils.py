@@ -0,0 +1,71 @@
+import unittest
+from dataclasses import dataclass, field
+from decimal import Decimal
+
+from utils import DynamoDBUtils
+
+
+@dataclass(slots=True)
+class Item:
+    item_id: str = field(metadata={'alias': 'itemId'})
+    size: float
+    count: int
+    tags: list[str] = field(default_factory=list)
+
+
+class TestDynamoDBUtils(unittest.TestCase):
+
+
+    def test_deserialize_value_decodes_attribute_types(self):
+        self.assertEqual(DynamoDBUtils.deserialize_value({'S': 'text'}), 'text')
+        self.assertEqual(DynamoDBUtils.deserialize_value({'N': '12'}), 12)
+        self.assertEqual(DynamoDBUtils.deserialize_value({'N': '1.5'}), 1.5)
+        self.assertEqual(DynamoDBUtils.deserialize_value({'N': '2.0'}), 2)
+        self.assertIs(DynamoDBUtils.deserialize_value({'BOOL': True}), True)
+        self.assertIsNone(DynamoDBUtils.deserialize_value({'NULL': True}))
+        self.assertEqual(DynamoDBUtils.deserialize_value({'L': [{'S': 'a'}, {'N': '1'}]}), ['a', 1])
+        self.assertEqual(DynamoDBUtils.deserialize_value({'M': {'key': {'S': 'value'}}}), {'key': 'value'})
+        self.assertEqual(DynamoDBUtils.deserialize_value({'SS': ['a', 'b']}), {'a', 'b'})
+        self.assertEqual(DynamoDBUtils.deserialize_value({'NS': ['1', '2.5']}), {1, 2.5})
+
+
+    def test_deserialize_value_raises_type_error_for_unknown_type(self):
+        with self.assertRaises(TypeError):
+            DynamoDBUtils.deserialize_value({'X': 'value'})
+
+
+    def test_serialize_and_deserialize_item_round_trip(self):
+        item = {'itemId': 'TEST_ITEM_ID', 'count': 3, 'nested': {'values': ['a', 'b']}}
+
+        serialized_item = DynamoDBUtils.serialize_item(item)
+
+        self.assertEqual(serialized_item['count'], {'N': '3'})
+        self.assertEqual(DynamoDBUtils.deserialize_item(serialized_item), item)
+
+
+    def test_serialize_and_deserialize_item_keep_none(self):
+        self.assertIsNone(DynamoDBUtils.serialize_item(None))
+        self.assertIsNone(DynamoDBUtils.deserialize_item(None))
+
+
+    def test_get_item_builder_builds_dataclass_from_client_item(self):
+        build_item = DynamoDBUtils.get_item_builder(Item)
+
+        item = build_item({'itemId': {'S': 'TEST_ITEM_ID'}, 'size': {'N': '1.5'}, 'count': {'N': '2'}})
+
+        self.assertEqual(item, Item(item_id='TEST_ITEM_ID', size=1.5, count=2))
+        self.assertIs(type(item.count), int)
+
+
+    def test_get_item_builder_converts_whole_number_to_float_field(self):
+        item = DynamoDBUtils.get_item_builder(Item)({'itemId': {'S': 'A'}, 'size': {'N': '2'}, 'count': {'N': '2'}})
+
+        self.assertEqual(item.size, 2)
+        self.assertNotIsInstance(item.size, Decimal)
+
+
+    def test_get_projection_uses_aliases_and_attribute_names(self):
+        projection, attribute_names = DynamoDBUtils.get_projection(Item)
+
+        self.assertEqual(projection, '#itemId, #size, #count, #tags')
+        self.assertEqual(attribute_names, {'#itemId': 'itemId', '#size': 'size', '#count': 'count', '#tags': 'tags'})
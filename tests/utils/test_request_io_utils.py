@@ -0,0 +1,42 @@
+import unittest
+from dataclasses import dataclass
+from decimal import Decimal
+
+from utils import DataTypeUtils
+
+
+@dataclass(slots=True)
+class Child:
+    size: Decimal
+
+
+@dataclass(slots=True)
+class Parent:
+    name: str
+    children: tuple[Child, ...]
+
+
+class TestDataTypeUtils(unittest.TestCase):
+
+
+    def test_convert_decimals_to_float_or_int(self):
+        result = DataTypeUtils.convert_decimals_to_float_or_int({'count': Decimal('2'), 'values': [Decimal('1.5')]})
+
+        self.assertEqual(result, {'count': 2, 'values': [1.5]})
+        self.assertIs(type(result['count']), int)
+
+
+    def test_convert_to_builtins_converts_dataclasses_and_decimals(self):
+        parent = Parent(name='TEST_NAME', children=(Child(size=Decimal('2')), Child(size=Decimal('0.5'))))
+
+        result = DataTypeUtils.convert_to_builtins([parent])
+
+        self.assertEqual(result, [{'name': 'TEST_NAME', 'children': [{'size': 2}, {'size': 0.5}]}])
+        self.assertIs(type(result[0]['children'][0]['size']), int)
+
+
+    def test_convert_to_builtins_keeps_other_values(self):
+        parameters = object()
+
+        self.assertIs(DataTypeUtils.convert_to_builtins(parameters), parameters)
+        self.assertEqual(DataTypeUtils.convert_to_builtins({'key': None}), {'key': None})
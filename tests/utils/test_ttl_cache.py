@@ -0,0 +1,62 @@
+import unittest
+from unittest.mock import patch
+
+from utils import TTLCache
+
+
+class TestTTLCache(unittest.TestCase):
+
+
+    def test_get_returns_stored_value(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+
+        cache.put('key', 'value')
+
+        self.assertEqual(cache.get('key'), 'value')
+
+
+    def test_get_returns_default_for_missing_key(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+
+        self.assertIsNone(cache.get('key'))
+        self.assertEqual(cache.get('key', 'default'), 'default')
+
+
+    @patch('utils.ttl_cache.time.monotonic')
+    def test_get_expires_entry_after_ttl(self, mock_monotonic):
+        cache = TTLCache(maxsize=2, ttl=60)
+        mock_monotonic.return_value = 100
+        cache.put('key', 'value')
+
+        mock_monotonic.return_value = 159
+        self.assertEqual(cache.get('key'), 'value')
+
+        mock_monotonic.return_value = 160
+        self.assertIsNone(cache.get('key'))
+
+
+    def test_put_evicts_least_recently_used_entry(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.put('first', 1)
+        cache.put('second', 2)
+
+        # Reading the first entry makes the second one the least recently used
+        cache.get('first')
+        cache.put('third', 3)
+
+        self.assertEqual(cache.get('first'), 1)
+        self.assertIsNone(cache.get('second'))
+        self.assertEqual(cache.get('third'), 3)
+
+
+    def test_pop_and_clear_remove_entries(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.put('first', 1)
+        cache.put('second', 2)
+
+        cache.pop('first')
+        cache.pop('missing')
+        self.assertIsNone(cache.get('first'))
+
+        cache.clear()
+        self.assertIsNone(cache.get('second'))
@@ -1,4 +1,7 @@
 from .log_manager import LogManager
 from .helper_types import Singleton
 from .request_io_utils import DataTypeUtils
-from .base64_conversion_utils import Base64ConversionUtils
\ No newline at end of file
+from .base64_conversion_utils import Base64ConversionUtils
+from .dataclass_utils import DataClassUtils
+from .dynamodb_utils import DynamoDBUtils
+from .ttl_cache import TTLCache
\ No newline at end of file
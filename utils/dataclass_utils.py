@@ -0,0 +1,288 @@
+import dataclasses
+import sys
+import types
+import typing
+from decimal import Decimal
+from typing import Any, Callable
+
+
+class DataClassUtils:
+    """
+    Builds dataclass instances from plain dicts (e.g. DynamoDB items) through a constructor
+    generated once per class, instead of walking the type hints on every call like dacite does.
+
+    A field can be read from a different key by declaring `field(metadata={'alias': 'camelCaseKey'})`.
+    Fields with a small set of string values (statuses, codes) can declare `field(metadata={'intern': True})`
+    so every row shares one string object instead of allocating its own copy.
+    Missing keys fall back to the field default, or to None for Optional fields without a default,
+    and raise KeyError if the field is required.
+    Decimal values (as returned by DynamoDB) of int and float fields are converted while building,
+    so items do not need a separate decimal conversion pass. A fractional Decimal for an int field raises ValueError.
+
+    The reverse direction, `to_dict`, is generated the same way. It is a shallow replacement for `dataclasses.asdict`
+    that converts nested dataclasses but does not deep-copy other values.
+    """
+    _builders: dict[type, Callable[[dict], Any]] = {}
+    _decoding_builders: dict[tuple[type, Callable[[Any], Any]], Callable[[dict], Any]] = {}
+    _dumpers: dict[type, Callable[[Any], dict]] = {}
+
+
+    @classmethod
+    def from_dict(cls, data_class: type, data: dict) -> Any:
+        """
+        Creates an instance of the dataclass from the given dict.
+
+        Args:
+            data_class (type): The dataclass to create.
+            data (dict): The source data.
+
+        Returns:
+            Any: The dataclass instance.
+        """
+        builder = cls._builders.get(data_class)
+        if builder is None:
+            builder = cls.get_builder(data_class)
+        return builder(data)
+
+
+    @classmethod
+    def get_builder(cls, data_class: type) -> Callable[[dict], Any]:
+        """
+        Returns the cached constructor for the dataclass, generating it on first use.
+
+        Args:
+            data_class (type): The dataclass to build the constructor for.
+
+        Returns:
+            Callable[[dict], Any]: A function converting a dict to a dataclass instance.
+        """
+        builder = cls._builders.get(data_class)
+        if builder is None:
+            # Register a trampoline first so that self-referencing dataclasses resolve to the final builder
+            cls._builders[data_class] = lambda data: cls._builders[data_class](data)
+            try:
+                builder = cls.__generate_builder(data_class)
+            except Exception:
+                cls._builders.pop(data_class)
+                raise
+            cls._builders[data_class] = builder
+        return builder
+
+
+    @classmethod
+    def get_decoding_builder(cls, data_class: type, value_decoder: Callable[[Any], Any]) -> Callable[[dict], Any]:
+        """
+        Returns the cached constructor for the dataclass that passes every top-level value through `value_decoder`
+        before converting it. This builds instances straight from encoded items (e.g. low-level DynamoDB client items)
+        without first creating a decoded copy of each item.
+
+        Args:
+            data_class (type): The dataclass to build the constructor for.
+            value_decoder (Callable[[Any], Any]): The function decoding a single raw value.
+
+        Returns:
+            Callable[[dict], Any]: A function converting an encoded dict to a dataclass instance.
+        """
+        builder_key = (data_class, value_decoder)
+        builder = cls._decoding_builders.get(builder_key)
+        if builder is None:
+            builder = cls._decoding_builders[builder_key] = cls.__generate_builder(data_class, value_decoder)
+        return builder
+
+
+    @classmethod
+    def to_dict(cls, instance: Any) -> dict:
+        """
+        Converts the dataclass instance to a dict keyed by field name, e.g. for a DynamoDB put_item.
+
+        Args:
+            instance (Any): The dataclass instance.
+
+        Returns:
+            dict: The fields of the instance, with nested dataclasses converted to dicts.
+        """
+        dumper = cls._dumpers.get(type(instance))
+        if dumper is None:
+            dumper = cls.get_dumper(type(instance))
+        return dumper(instance)
+
+
+    @classmethod
+    def get_dumper(cls, data_class: type) -> Callable[[Any], dict]:
+        """
+        Returns the cached dict conversion function for the dataclass, generating it on first use.
+
+        Args:
+            data_class (type): The dataclass to build the conversion function for.
+
+        Returns:
+            Callable[[Any], dict]: A function converting a dataclass instance to a dict.
+        """
+        dumper = cls._dumpers.get(data_class)
+        if dumper is None:
+            cls._dumpers[data_class] = lambda instance: cls._dumpers[data_class](instance)
+            try:
+                dumper = cls.__generate_dumper(data_class)
+            except Exception:
+                cls._dumpers.pop(data_class)
+                raise
+            cls._dumpers[data_class] = dumper
+        return dumper
+
+
+    @classmethod
+    def __generate_builder(cls, data_class: type, value_decoder: Callable[[Any], Any] | None = None) -> Callable[[dict], Any]:
+        type_hints = typing.get_type_hints(data_class)
+        namespace = {'_cls': data_class, '_decode': value_decoder}
+        args = []
+        keyword_args = []
+        for index, dc_field in enumerate(dataclasses.fields(data_class)):
+            if not dc_field.init:
+                continue
+            key = dc_field.metadata.get('alias', dc_field.name)
+            value = f'data[{key!r}]' if value_decoder is None else f'_decode(data[{key!r}])'
+            if dc_field.metadata.get('intern'):
+                converter = cls.__intern
+            else:
+                converter = cls.__get_converter(type_hints[dc_field.name])
+            if converter is not None:
+                namespace[f'_conv{index}'] = converter
+                value = f'_conv{index}({value})'
+
+            if dc_field.default is not dataclasses.MISSING:
+                namespace[f'_default{index}'] = dc_field.default
+                value = f'{value} if {key!r} in data else _default{index}'
+            elif dc_field.default_factory is not dataclasses.MISSING:
+                namespace[f'_factory{index}'] = dc_field.default_factory
+                value = f'{value} if {key!r} in data else _factory{index}()'
+            elif cls.__is_optional(type_hints[dc_field.name]):
+                # Like dacite, a missing Optional field without a default is set to None
+                value = f'{value} if {key!r} in data else None'
+            # Positional arguments are bound faster than keywords; only keyword-only fields are passed by name
+            if dc_field.kw_only:
+                keyword_args.append(f'{dc_field.name}={value}')
+            else:
+                args.append(value)
+
+        source = f'def _build(data):\n    return _cls({", ".join(args + keyword_args)})\n'
+        exec(source, namespace)
+        return namespace['_build']
+
+
+    @classmethod
+    def __generate_dumper(cls, data_class: type) -> Callable[[Any], dict]:
+        type_hints = typing.get_type_hints(data_class)
+        namespace = {}
+        items = []
+        for index, dc_field in enumerate(dataclasses.fields(data_class)):
+            value = f'instance.{dc_field.name}'
+            converter = cls.__get_dump_converter(type_hints[dc_field.name])
+            if converter is not None:
+                namespace[f'_conv{index}'] = converter
+                value = f'_conv{index}({value})'
+            items.append(f'{dc_field.name!r}: {value}')
+
+        source = f'def _dump(instance):\n    return {{{", ".join(items)}}}\n'
+        exec(source, namespace)
+        return namespace['_dump']
+
+
+    @classmethod
+    def __get_converter(cls, type_hint: Any) -> Callable[[Any], Any] | None:
+        """
+        Returns a function converting a raw value into the type hint, or None if the value can be used as is.
+        """
+        if dataclasses.is_dataclass(type_hint):
+            return cls.get_builder(type_hint)
+        if type_hint is int:
+            return cls.__decimal_to_int
+        if type_hint is float:
+            return cls.__decimal_to_float
+
+        origin = typing.get_origin(type_hint)
+        type_args = typing.get_args(type_hint)
+        if origin in (typing.Union, types.UnionType):
+            non_none_args = [arg for arg in type_args if arg is not type(None)]
+            if len(non_none_args) != 1:
+                return None
+            converter = cls.__get_converter(non_none_args[0])
+            if converter is None:
+                return None
+            return lambda value: None if value is None else converter(value)
+        if origin is list and type_args:
+            converter = cls.__get_converter(type_args[0])
+            if converter is None:
+                return None
+            return lambda value: [converter(item) for item in value]
+        if origin is tuple and len(type_args) == 2 and type_args[1] is Ellipsis:
+            converter = cls.__get_converter(type_args[0])
+            if converter is None:
+                return tuple
+            return lambda value: tuple([converter(item) for item in value])
+        if origin is dict and len(type_args) == 2:
+            converter = cls.__get_converter(type_args[1])
+            if converter is None:
+                return None
+            return lambda value: {key: converter(item) for key, item in value.items()}
+        return None
+
+
+    @classmethod
+    def __get_dump_converter(cls, type_hint: Any) -> Callable[[Any], Any] | None:
+        """
+        Returns a function converting nested dataclasses in a field value to dicts, or None if the value can be used as is.
+        """
+        if dataclasses.is_dataclass(type_hint):
+            return cls.get_dumper(type_hint)
+
+        origin = typing.get_origin(type_hint)
+        type_args = typing.get_args(type_hint)
+        if origin in (typing.Union, types.UnionType):
+            non_none_args = [arg for arg in type_args if arg is not type(None)]
+            if len(non_none_args) != 1:
+                return None
+            converter = cls.__get_dump_converter(non_none_args[0])
+            if converter is None:
+                return None
+            return lambda value: None if value is None else converter(value)
+        if origin is list and type_args:
+            converter = cls.__get_dump_converter(type_args[0])
+            if converter is None:
+                return None
+            return lambda value: [converter(item) for item in value]
+        if origin is tuple and len(type_args) == 2 and type_args[1] is Ellipsis:
+            converter = cls.__get_dump_converter(type_args[0])
+            if converter is None:
+                return None
+            return lambda value: tuple([converter(item) for item in value])
+        if origin is dict and len(type_args) == 2:
+            converter = cls.__get_dump_converter(type_args[1])
+            if converter is None:
+                return None
+            return lambda value: {key: converter(item) for key, item in value.items()}
+        return None
+
+
+    @staticmethod
+    def __is_optional(type_hint: Any) -> bool:
+        return typing.get_origin(type_hint) in (typing.Union, types.UnionType) and type(None) in typing.get_args(type_hint)
+
+
+    @staticmethod
+    def __intern(value: Any) -> Any:
+        return sys.intern(value) if type(value) is str else value
+
+
+    @staticmethod
+    def __decimal_to_int(value: Any) -> Any:
+        if type(value) is not Decimal:
+            return value
+        # int() would silently truncate a fractional number, which dacite rejected as a wrong type
+        if value != value.to_integral_value():
+            raise ValueError(f'Expected an integral number, got {value}')
+        return int(value)
+
+
+    @staticmethod
+    def __decimal_to_float(value: Any) -> Any:
+        return float(value) if type(value) is Decimal else value
@@ -0,0 +1,128 @@
+import dataclasses
+from typing import Any, Callable
+
+from boto3.dynamodb.types import TypeSerializer
+
+from .dataclass_utils import DataClassUtils
+
+
+class DynamoDBUtils:
+    """
+    Converts items between the low-level DynamoDB client format (e.g. `{'N': '123'}`) and plain Python values.
+
+    Unlike boto3's TypeDeserializer used by the Table resource, numbers are decoded straight to int or float
+    without creating a Decimal first, so items read through the client need no separate decimal conversion.
+    """
+    _serializer = TypeSerializer()
+
+
+    @classmethod
+    def deserialize_item(cls, item: dict | None) -> dict | None:
+        """
+        Converts an item (or key) returned by the DynamoDB client into a dict of plain Python values.
+
+        Args:
+            item (dict | None): The item in DynamoDB attribute value format.
+
+        Returns:
+            dict | None: The item with plain Python values, or None if no item was given.
+        """
+        if item is None:
+            return None
+        return {name: cls.deserialize_value(value) for name, value in item.items()}
+
+
+    @classmethod
+    def deserialize_value(cls, value: dict) -> Any:
+        """
+        Converts a single DynamoDB attribute value into a plain Python value. Numbers become int when integral,
+        float otherwise, matching `DataTypeUtils.convert_decimals_to_float_or_int`.
+
+        Args:
+            value (dict): The attribute value, e.g. `{'S': 'text'}`.
+
+        Returns:
+            Any: The plain Python value.
+
+        Raises:
+            TypeError: If the attribute value type is not supported.
+        """
+        (type_code, raw_value), = value.items()
+        if type_code == 'S':
+            return raw_value
+        if type_code == 'N':
+            return cls.__to_number(raw_value)
+        if type_code == 'M':
+            return {name: cls.deserialize_value(item) for name, item in raw_value.items()}
+        if type_code == 'L':
+            return [cls.deserialize_value(item) for item in raw_value]
+        if type_code == 'BOOL' or type_code == 'B':
+            return raw_value
+        if type_code == 'NULL':
+            return None
+        if type_code == 'SS' or type_code == 'BS':
+            return set(raw_value)
+        if type_code == 'NS':
+            return {cls.__to_number(number) for number in raw_value}
+        raise TypeError(f'Unsupported DynamoDB attribute type: {type_code}')
+
+
+    @classmethod
+    def get_item_builder(cls, data_class: type) -> Callable[[dict], Any]:
+        """
+        Returns the cached constructor building the dataclass directly from an item returned by the DynamoDB client.
+        Attribute values are decoded while the fields are read, so no intermediate decoded dict is created per item.
+
+        Args:
+            data_class (type): The dataclass to build.
+
+        Returns:
+            Callable[[dict], Any]: A function converting a client item to a dataclass instance.
+        """
+        return DataClassUtils.get_decoding_builder(data_class, cls.deserialize_value)
+
+
+    @classmethod
+    def serialize_item(cls, item: dict | None) -> dict | None:
+        """
+        Converts a dict of plain Python values (e.g. a pagination key) into the DynamoDB client format.
+
+        Args:
+            item (dict | None): The item with plain Python values.
+
+        Returns:
+            dict | None: The item in DynamoDB attribute value format, or None if no item was given.
+        """
+        if item is None:
+            return None
+        return {name: cls._serializer.serialize(value) for name, value in item.items()}
+
+
+    @staticmethod
+    def get_projection(data_class: type) -> tuple[str, dict[str, str]]:
+        """
+        Builds a ProjectionExpression reading only the attributes of the dataclass fields, so queries do not
+        return (and pay read capacity for) attributes the model does not use. Every attribute goes through
+        an expression attribute name, as some field names (e.g. `timestamp`) are DynamoDB reserved words.
+
+        Args:
+            data_class (type): The dataclass the items are built into.
+
+        Returns:
+            tuple[str, dict[str, str]]: The ProjectionExpression and its ExpressionAttributeNames.
+        """
+        attribute_names = {}
+        for dc_field in dataclasses.fields(data_class):
+            if dc_field.init:
+                attribute_name = dc_field.metadata.get('alias', dc_field.name)
+                attribute_names[f'#{attribute_name}'] = attribute_name
+        return ', '.join(attribute_names), attribute_names
+
+
+    @staticmethod
+    def __to_number(raw_value: str) -> int | float:
+        try:
+            return int(raw_value)
+        except ValueError:
+            number = float(raw_value)
+            return int(number) if number.is_integer() else number
@@ -1,7 +1,10 @@
+from dataclasses import fields, is_dataclass
 from decimal import Decimal
 
 class DataTypeUtils:
 
+    _field_names: dict[type, tuple[str, ...]] = {}
+
     @classmethod
     def convert_decimals_to_float_or_int(cls, item):
         """
@@ -16,3 +19,25 @@ class DataTypeUtils:
             return int(item) if item % 1 == 0 else float(item)
         else:
             return item
+
+
+    @classmethod
+    def convert_to_builtins(cls, item):
+        """
+        Recursively convert dataclasses to dictionaries and Decimal values to int or float in a single pass.
+        Unlike `dataclasses.asdict` followed by `convert_decimals_to_float_or_int`, the values are not deep-copied
+        and the structure is walked only once.
+        """
+        if isinstance(item, list) or isinstance(item, tuple):
+            return [DataTypeUtils.convert_to_builtins(i) for i in item]
+        elif isinstance(item, dict):
+            return {k: DataTypeUtils.convert_to_builtins(v) for k, v in item.items()}
+        elif isinstance(item, Decimal):
+            return int(item) if item % 1 == 0 else float(item)
+        elif is_dataclass(item) and not isinstance(item, type):
+            field_names = cls._field_names.get(type(item))
+            if field_names is None:
+                field_names = cls._field_names[type(item)] = tuple(f.name for f in fields(item))
+            return {name: DataTypeUtils.convert_to_builtins(getattr(item, name)) for name in field_names}
+        else:
+            return item
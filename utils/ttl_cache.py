@@ -0,0 +1,68 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class TTLCache:
+    """
+    A small thread-safe in-process cache whose entries expire after `ttl` seconds.
+    When `maxsize` is reached the least recently used entry is evicted.
+    """
+
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """
+        Initializes the cache.
+
+        Args:
+            maxsize (int): The maximum number of entries kept in the cache.
+            ttl (float): The number of seconds an entry stays valid.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Returns the cached value for the key, or the default if it is missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Stores the value for the key, evicting the least recently used entry if the cache is full.
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+    def pop(self, key: Hashable) -> None:
+        """
+        Removes the entry for the key if it exists.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+    def clear(self) -> None:
+        """
+        Removes all entries.
+        """
+        with self._lock:
+            self._entries.clear()